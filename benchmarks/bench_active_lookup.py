@@ -0,0 +1,69 @@
+"""
+Benchmark: active-task lookup, linear scan from index 0 vs PendingIndex.
+
+Long-running lists: the first 99% of lines are completed ('+') tasks. The
+legacy path scanned twice per edit (_first_active_task_index, then again in
+get_active_text). Run from project root:
+    python benchmarks/bench_active_lookup.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.task_model import TaskList, TaskModel  # noqa: E402
+
+
+def legacy_first_active(tasks: list[dict]) -> int | None:
+    for i, t in enumerate(tasks):
+        if t.get("done", False):
+            continue
+        if (t.get("text", "") or "").strip():
+            return i
+    return None
+
+
+def main() -> None:
+    rng = random.Random(1)
+    print(f"{'tasks':>9}  {'legacy x2 scan':>15}  {'index active':>13}  {'next 10':>9}  {'tick':>9}")
+    for n in (10_000, 100_000, 1_000_000):
+        done = n - n // 100
+        lines = [f"+ Done {i}" for i in range(done)] + [f"Task {i}" for i in range(done, n)]
+        legacy = [{"text": f"Done {i}", "done": True} for i in range(done)] + [
+            {"text": f"Task {i}", "done": False} for i in range(done, n)
+        ]
+        model = TaskModel(TaskList.from_lines(lines))
+
+        t0 = time.perf_counter()
+        legacy_first_active(legacy)
+        legacy_first_active(legacy)
+        t_legacy = time.perf_counter() - t0
+
+        reps = 1000
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            model.active_index
+        t_index = (time.perf_counter() - t0) / reps
+
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            model.upcoming(10)
+        t_next = (time.perf_counter() - t0) / reps
+
+        rows = [rng.randrange(n) for _ in range(reps)]
+        t0 = time.perf_counter()
+        for row in rows:
+            model.set_done(row, not model.tasks.is_done(row))
+        t_tick = (time.perf_counter() - t0) / reps
+
+        print(
+            f"{n:>9}  {t_legacy * 1e3:12.3f} ms  {t_index * 1e6:10.2f} us  "
+            f"{t_next * 1e6:6.2f} us  {t_tick * 1e6:6.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
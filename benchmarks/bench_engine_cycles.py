@@ -0,0 +1,71 @@
+"""
+Benchmark: headless TimerEngine throughput on a virtual clock (no display needed).
+
+Two drivers: "deadline" jumps straight to each phase deadline (what a
+non-GUI front end does), "per-second" wakes on every clock-face change like
+the Tk view. Run from project root:
+    python benchmarks/bench_engine_cycles.py [--cycles 20000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.engine import TimerEngine  # noqa: E402
+from pomodoro.ticker import VirtualClock  # noqa: E402
+
+
+def _engine(clock: VirtualClock, finished: list[str]) -> TimerEngine:
+    cfg = {"work_minutes": 25, "break_minutes": 5}
+    return TimerEngine(lambda: cfg, clock=clock, on_finish=finished.append)
+
+
+def run_deadline(cycles: int) -> tuple[float, int]:
+    clock = VirtualClock()
+    finished: list[str] = []
+    engine = _engine(clock, finished)
+    t0 = time.perf_counter()
+    for _ in range(cycles * 2):
+        engine.start()
+        clock.advance(engine.remaining)
+        engine.tick()
+    return time.perf_counter() - t0, len(finished)
+
+
+def run_per_second(cycles: int) -> tuple[float, int]:
+    clock = VirtualClock()
+    finished: list[str] = []
+    engine = _engine(clock, finished)
+    t0 = time.perf_counter()
+    for _ in range(cycles * 2):
+        engine.start()
+        while True:
+            clock.advance(engine.next_delay_ms() / 1000.0)
+            if not engine.tick():
+                break
+    return time.perf_counter() - t0, len(finished)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cycles", type=int, default=20000)
+    parser.add_argument("--per-second-cycles", type=int, default=20)
+    args = parser.parse_args()
+
+    elapsed, phases = run_deadline(args.cycles)
+    print(
+        f"deadline driver  : {args.cycles} cycles ({phases} phases) in {elapsed:.3f} s "
+        f"-> {args.cycles / elapsed:,.0f} cycles/s"
+    )
+    elapsed, phases = run_per_second(args.per_second_cycles)
+    print(
+        f"per-second driver: {args.per_second_cycles} cycles ({phases} phases) in "
+        f"{elapsed:.3f} s -> {args.per_second_cycles / elapsed:,.1f} cycles/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: task/settings handler work per keystroke, direct dispatch vs Coalescer.
+
+Each simulated keystroke in the tasks Text fires <KeyRelease> and <<Modified>>,
+and every tasks update relabels the active task (on_active_changed); a burst is
+the keystrokes that arrive before Tk gets idle (auto-repeat, paste, busy loop).
+Direct dispatch runs every handler per event, as before; the Coalescer runs one
+update per key per idle cycle. The idle queue is simulated (no display needed).
+Run from project root:
+    python benchmarks/bench_event_coalescing.py [--lines 10000] [--keystrokes 600]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.coalesce import Coalescer  # noqa: E402
+from pomodoro.task_model import TaskModel  # noqa: E402
+
+
+class IdleQueue:
+    """Stand-in for root.after_idle: callbacks run when the burst is over."""
+
+    def __init__(self) -> None:
+        self.queue: list[Callable[[], None]] = []
+
+    def post(self, fn: Callable[[], None]) -> None:
+        self.queue.append(fn)
+
+    def run(self) -> None:
+        while self.queue:
+            self.queue.pop(0)()
+
+
+class Handlers:
+    """What TasksWidget / main / SettingsWidget do per executed update."""
+
+    def __init__(self, model: TaskModel) -> None:
+        self.model = model
+        self.label = ""
+        self.saves = 0
+        self.updates = 0
+
+    def relabel(self) -> None:
+        self.label = self.model.active_text()
+        self.updates += 1
+
+    def tasks_update(self, save: bool, on_active: Callable[[], None]) -> None:
+        _ = (self.model.active_index, self.model.done_count, self.model.total)
+        if save:
+            self.saves += 1
+        self.updates += 1
+        on_active()
+
+
+def run(lines: int, keystrokes: int, burst: int, coalesce: bool) -> tuple[float, int, int, int]:
+    model = TaskModel()
+    model.load_text("\n".join(f"Task {i}" for i in range(lines)))
+    h = Handlers(model)
+    idle = IdleQueue()
+    co = Coalescer(idle.post)
+    sync = [False]
+
+    def on_active() -> None:
+        if coalesce:
+            co.schedule("active-label", h.relabel)
+        else:
+            h.relabel()
+
+    def flush_tasks() -> None:
+        save, sync[0] = sync[0], False
+        h.tasks_update(save, on_active)
+
+    def event(save: bool) -> None:
+        if coalesce:
+            sync[0] = sync[0] or save
+            co.schedule("tasks-edit", flush_tasks)
+        else:
+            h.tasks_update(save, on_active)
+
+    raw = 0
+    row = lines - 1
+    t0 = time.perf_counter()
+    for k in range(keystrokes):
+        model.replace_lines(row, 1, [f"Task {row} edited {k}"])
+        event(save=False)  # <KeyRelease>
+        event(save=True)  # <<Modified>>
+        raw += 2
+        if (k + 1) % burst == 0:
+            idle.run()
+    idle.run()
+    return time.perf_counter() - t0, raw, h.updates, h.saves
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=10000)
+    parser.add_argument("--keystrokes", type=int, default=600)
+    parser.add_argument("--bursts", type=int, nargs="+", default=[1, 5, 30])
+    args = parser.parse_args()
+    print(f"{args.lines} tasks, {args.keystrokes} keystrokes")
+    print(
+        f"{'keys/idle':>9} {'mode':>10} {'raw events':>11} {'updates':>8} "
+        f"{'saves':>6} {'us/keystroke':>13}"
+    )
+    for burst in args.bursts:
+        for coalesce in (False, True):
+            t, raw, updates, saves = run(args.lines, args.keystrokes, burst, coalesce)
+            mode = "coalesced" if coalesce else "direct"
+            print(
+                f"{burst:>9} {mode:>10} {raw:>11} {updates:>8} {saves:>6} "
+                f"{t / args.keystrokes * 1e6:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
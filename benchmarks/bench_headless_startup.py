@@ -0,0 +1,137 @@
+"""
+Benchmark: startup time and RSS, --headless terminal mode vs the Tk overlay.
+
+Each run is a fresh interpreter. Reported per front end (median of --runs):
+  import   - time and peak RSS after importing the front end's module
+             (pomodoro.headless vs pomodoro.main, which pulls in tkinter and every widget);
+  startup  - process start to the first rendered frame (first status line on stdout for
+             --headless; mainloop entry after one update() for the overlay), RSS at that point.
+The overlay startup needs a display and is skipped without one. RSS is read from
+/proc (Linux) or getrusage. The app runs against a temporary POMODORO_DIR, never
+the project's config.json / tasks.txt.
+Run from project root:
+    python benchmarks/bench_headless_startup.py [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+
+_IMPORT_PROBE = """
+import resource, sys, time
+t0 = time.perf_counter()
+import {module}
+ms = (time.perf_counter() - t0) * 1000.0
+kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    kb //= 1024
+print(ms, kb, "tkinter" in sys.modules)
+"""
+
+# Full overlay up to its first painted frame, then exit instead of running mainloop.
+_GUI_PROBE = """
+import resource, sys, time, tkinter
+def mainloop(self, n=0):
+    self.update()
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print("READY", kb // 1024 if sys.platform == "darwin" else kb, flush=True)
+    self.destroy()
+tkinter.Misc.mainloop = mainloop
+from pomodoro.main import main
+main()
+"""
+
+
+def rss_kb(pid: int) -> int | None:
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def import_probe(module: str) -> tuple[float, int, bool]:
+    out = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE.format(module=module)],
+        env=ENV, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return float(out[0]), int(out[1]), out[2] == "True"
+
+
+def headless_startup(env: dict[str, str]) -> tuple[float, int | None]:
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "pomodoro", "--headless"],
+        env=env, cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    if proc.stdout is None or proc.stdin is None:
+        raise RuntimeError("pipes were not created")
+    while proc.stdout.read(1) not in (b"\r", b""):
+        pass
+    ms = (time.perf_counter() - t0) * 1000.0
+    rss = rss_kb(proc.pid)
+    proc.stdin.write(b"q")
+    proc.stdin.close()
+    proc.wait(timeout=10)
+    return ms, rss
+
+
+def gui_startup(env: dict[str, str]) -> tuple[float, int | None] | None:
+    t0 = time.perf_counter()
+    done = subprocess.run(
+        [sys.executable, "-c", _GUI_PROBE], env=env, cwd=ROOT,
+        capture_output=True, text=True, timeout=60,
+    )
+    ms = (time.perf_counter() - t0) * 1000.0
+    for line in done.stdout.splitlines():
+        if line.startswith("READY"):
+            return ms, int(line.split()[1])
+    return None  # no display (TclError) or the overlay failed to start
+
+
+def median(values: list[float]) -> float:
+    return statistics.median(values) if values else float("nan")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    rows = []
+    for label, module in (("headless", "pomodoro.headless"), ("overlay", "pomodoro.main")):
+        probes = [import_probe(module) for _ in range(args.runs)]
+        rows.append((
+            f"import {label}",
+            median([p[0] for p in probes]),
+            median([p[1] for p in probes]),
+            "yes" if probes[0][2] else "no",
+        ))
+    with tempfile.TemporaryDirectory(prefix="pomodoro-bench-") as tmp:
+        env = {**ENV, "POMODORO_DIR": tmp}
+        runs = [headless_startup(env) for _ in range(args.runs)]
+        gui = [g for g in (gui_startup(env) for _ in range(args.runs)) if g is not None]
+    rss = [r for _, r in runs if r is not None]
+    rows.append(("startup headless", median([ms for ms, _ in runs]), median(rss), "no"))
+    if gui:
+        gui_rss = [r for _, r in gui if r is not None]
+        rows.append(("startup overlay", median([ms for ms, _ in gui]), median(gui_rss), "yes"))
+    print(f"{'':<18} {'ms':>9} {'RSS MB':>8} {'tkinter':>8}")
+    for name, ms, kb, tk_loaded in rows:
+        print(f"{name:<18} {ms:>9.1f} {kb / 1024:>8.1f} {tk_loaded:>8}")
+    if not gui:
+        print("startup overlay: skipped (no display)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: timer wakeups per hour with the overlay visible vs hidden (idle mode).
+
+Drives TimerEngine through TimerScheduler on a simulated event loop exactly like
+TimerWidget._arm: per-second wakeups while visible, one wakeup per phase
+deadline while hidden. Phases are restarted back to back. No display needed.
+Run from project root:
+    python benchmarks/bench_idle_wakeups.py [--hours 2]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.engine import TimerEngine  # noqa: E402
+from pomodoro.scheduler import TimerScheduler  # noqa: E402
+from pomodoro.ticker import VirtualClock  # noqa: E402
+
+
+class SimLoop:
+    """after()-like backend on a VirtualClock."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        self._clock = clock
+        self._pending: dict[int, tuple[float, Callable[[], None]]] = {}
+        self._next = 0
+
+    def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any:
+        self._next += 1
+        self._pending[self._next] = (self._clock() + delay_ms / 1000.0, callback)
+        return self._next
+
+    def disarm(self, token: Any) -> None:
+        self._pending.pop(token, None)
+
+    def run_until(self, end: float) -> None:
+        while self._pending:
+            token, (when, callback) = min(self._pending.items(), key=lambda kv: kv[1][0])
+            if when > end:
+                break
+            del self._pending[token]
+            self._clock.now = max(self._clock.now, when)
+            callback()
+        self._clock.now = end
+
+
+def simulate(hours: float, hidden: bool) -> tuple[dict[str, float], int, float]:
+    clock = VirtualClock()
+    loop = SimLoop(clock)
+    sched = TimerScheduler(loop, clock=clock)
+    cfg = {"work_minutes": 25, "break_minutes": 5}
+    repaints = [0]
+    end_errors: list[float] = []
+
+    def arm() -> None:
+        delay = engine.deadline_delay_ms() if hidden else engine.next_delay_ms()
+        sched.add(delay / 1000.0, tick, name="clock")
+
+    def tick() -> None:
+        if engine.tick():
+            arm()
+
+    def on_finish(_phase: str) -> None:
+        end_errors.append(engine.stats.last_end_error_ms)
+        sched.add(0.0, engine.start, name="restart")
+
+    def on_display() -> None:
+        repaints[0] += 1
+
+    engine = TimerEngine(
+        lambda: cfg,
+        clock=clock,
+        on_finish=on_finish,
+        on_run_state_changed=lambda running: arm() if running else None,
+        on_display=on_display,
+    )
+    engine.start()
+    loop.run_until(hours * 3600.0)
+    return sched.stats(), repaints[0], max(end_errors, default=0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=float, default=2.0)
+    args = parser.parse_args()
+    print(f"{args.hours:g} h of back-to-back pomodoros (25 + 5 min):")
+    print(f"{'overlay':<9} {'wakeups/hour':>13} {'repaints':>9} {'max end error ms':>17}")
+    for hidden in (False, True):
+        stats, repaints, end_error = simulate(args.hours, hidden)
+        label = "hidden" if hidden else "visible"
+        print(
+            f"{label:<9} {stats['wakeups_per_hour']:>13.1f} {repaints:>9} {end_error:>17.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
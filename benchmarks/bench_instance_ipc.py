@@ -0,0 +1,131 @@
+"""
+Benchmark: single-instance hand-off, a second launch vs starting a new instance.
+
+Reported (median / p95 of --runs):
+  ipc round-trip - forward() to an InstanceServer in this process whose handler
+                   runs on a separate "UI" thread (connect, request, post, reply);
+  forward launch - `python -m pomodoro toggle` against a running --headless
+                   instance: process start to exit (imports, lock probe, round-trip);
+  cold start     - `python -m pomodoro --headless --new-instance` to its first
+                   status line, i.e. what the second launch used to cost.
+Everything runs against a temporary POMODORO_DIR (its own config.json, tasks.txt
+and instance key), so a running overlay and the project's files are never touched.
+Run from project root:
+    python benchmarks/bench_instance_ipc.py [--runs 50]
+"""
+
+import argparse
+import os
+import queue
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+ENV = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+
+from pomodoro.instance import InstanceServer, forward  # noqa: E402
+
+
+def p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def row(name: str, values: list[float]) -> None:
+    print(f"{name:<16} {statistics.median(values):9.2f} {p95(values):9.2f}")
+
+
+def ipc_round_trip(base: Path, runs: int) -> list[float]:
+    """In-process server; handler posted to a worker thread like root.after_idle."""
+    jobs: "queue.Queue" = queue.Queue()
+
+    def ui_loop() -> None:
+        while (job := jobs.get()) is not None:
+            job()
+
+    ui = threading.Thread(target=ui_loop, daemon=True)
+    ui.start()
+    state = {"phase": "work", "time": "25:00", "running": False}
+    server = InstanceServer(base, lambda cmd, arg: state, jobs.put)
+    server.start()
+    try:
+        forward(base, "show")  # warm-up
+        samples = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            forward(base, "toggle")
+            samples.append((time.perf_counter() - t0) * 1000.0)
+    finally:
+        server.close()
+        jobs.put(None)
+    return samples
+
+
+def cold_start(env: dict[str, str]) -> float:
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "pomodoro", "--headless", "--new-instance"],
+        env=env, cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    if proc.stdout is None or proc.stdin is None:
+        raise RuntimeError("pipes were not created")
+    while proc.stdout.read(1) not in (b"\r", b""):
+        pass
+    ms = (time.perf_counter() - t0) * 1000.0
+    proc.stdin.write(b"q")
+    proc.stdin.close()
+    proc.wait(timeout=10)
+    return ms
+
+
+def forward_launches(base: Path, env: dict[str, str], runs: int) -> list[float]:
+    primary = subprocess.Popen(
+        [sys.executable, "-m", "pomodoro", "--headless"],
+        env=env, cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if primary.stdin is None:
+        raise RuntimeError("pipe was not created")
+    try:
+        forward(base, "show")  # waits until the primary listens
+        samples = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-m", "pomodoro", "toggle"],
+                env=env, cwd=ROOT, capture_output=True, check=True, timeout=30,
+            )
+            samples.append((time.perf_counter() - t0) * 1000.0)
+    finally:
+        primary.stdin.write(b"q")
+        primary.stdin.close()
+        primary.wait(timeout=10)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+    launches = max(5, args.runs // 5)
+    with tempfile.TemporaryDirectory(prefix="pomodoro-bench-") as tmp:
+        base = Path(tmp).resolve()
+        env = {**ENV, "POMODORO_DIR": str(base)}
+        ipc = ipc_round_trip(base, args.runs)
+        fwd = forward_launches(base, env, launches)
+        cold = [cold_start(env) for _ in range(launches)]
+    print(f"{'':<16} {'p50 ms':>9} {'p95 ms':>9}")
+    row("ipc round-trip", ipc)
+    row("forward launch", fwd)
+    row("cold start", cold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: tick lateness with notification channels called inline vs NotificationDispatcher.
+
+A compressed timer loop (one tick every --tick-ms, a phase end every
+--phase-ticks ticks) notifies four simulated channels: fast, slow (--slow-ms),
+one that hangs until the run ends, and one that always fails. Inline, as the
+old notify_timer_end did, every channel runs on the loop thread (the hung
+one is given up after --slow-ms so the run can finish). With the dispatcher
+the loop only publishes. No display needed.
+Run from project root:
+    python benchmarks/bench_notify_dispatch.py [--ticks 300] [--tick-ms 10] [--slow-ms 200]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.dispatch import PHASE_END, NotificationDispatcher, TimerEvent  # noqa: E402
+
+
+class SimChannel:
+    def __init__(self, name: str, action: Callable[[], None], timeout_s: float) -> None:
+        self.name = name
+        self.timeout_s = timeout_s
+        self._action = action
+
+    def send(self, event: TimerEvent) -> None:
+        self._action()
+
+
+def channels(slow_s: float, release: threading.Event) -> list[SimChannel]:
+    def fail() -> None:
+        raise OSError("webhook refused")
+
+    return [
+        SimChannel("fast", lambda: None, 1.0),
+        SimChannel("slow", lambda: time.sleep(slow_s), 1.0),
+        SimChannel("hung", lambda: release.wait(), 0.5),
+        SimChannel("failing", fail, 1.0),
+    ]
+
+
+def run_loop(ticks: int, tick_s: float, phase_ticks: int, notify: Callable[[int], Any]) -> float:
+    """Max tick lateness in ms."""
+    start = time.perf_counter()
+    worst = 0.0
+    for i in range(1, ticks + 1):
+        due = start + i * tick_s
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        worst = max(worst, time.perf_counter() - due)
+        if i % phase_ticks == 0:
+            notify(i)
+    return worst * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--tick-ms", type=float, default=10.0)
+    parser.add_argument("--phase-ticks", type=int, default=50)
+    parser.add_argument("--slow-ms", type=float, default=200.0)
+    args = parser.parse_args()
+    tick_s, slow_s = args.tick_ms / 1000.0, args.slow_ms / 1000.0
+
+    release = threading.Event()
+    inline_channels = channels(slow_s, threading.Event())
+    inline_channels[2] = SimChannel("hung", lambda: time.sleep(slow_s), 0.5)
+
+    def inline(i: int) -> None:
+        event = TimerEvent(PHASE_END, "work", f"task {i}")
+        for c in inline_channels:
+            try:
+                c.send(event)
+            except Exception:
+                pass
+
+    late_inline = run_loop(args.ticks, tick_s, args.phase_ticks, inline)
+
+    dispatcher = NotificationDispatcher(channels(slow_s, release), queue_size=4)
+    late_dispatch = run_loop(
+        args.ticks,
+        tick_s,
+        args.phase_ticks,
+        lambda i: dispatcher.publish(TimerEvent(PHASE_END, "work", f"task {i}")),
+    )
+    time.sleep(slow_s + 0.6)
+    stats = dispatcher.stats()
+    release.set()
+    dispatcher.close()
+
+    phases = args.ticks // args.phase_ticks
+    print(f"{args.ticks} ticks of {args.tick_ms:g} ms, {phases} phase ends:")
+    print(f"  inline channels   max tick lateness {late_inline:8.1f} ms")
+    print(f"  dispatcher        max tick lateness {late_dispatch:8.1f} ms")
+    print(f"{'channel':<9} {'sent':>5} {'errors':>7} {'timeouts':>9} {'dropped':>8} {'p95 ms':>8}")
+    for name, s in stats["channels"].items():
+        p95 = s["latency"]["p95_ms"]
+        print(
+            f"{name:<9} {s['sent']:>5} {s['errors']:>7} {s['timeouts']:>9} "
+            f"{s['dropped']:>8} {p95:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
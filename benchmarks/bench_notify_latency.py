@@ -0,0 +1,92 @@
+"""
+Benchmark: end-of-phase sound, per-call lookup + open on the Tk thread vs AudioPlayer.
+
+Before: every phase end ran find_sound() (a stat per candidate path) and opened
+the sound through MCI on the Tk thread. Now the sound is resolved and its sink
+prepared once on the audio thread; the Tk thread only posts a request. The
+sink here simulates MCI (--open-ms per open, --play-ms per play call), so no
+sound device is needed.
+Run from project root:
+    python benchmarks/bench_notify_latency.py [--notifications 50] [--open-ms 30] [--play-ms 2]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.audio import AudioPlayer, NullSink, Pcm, find_sound  # noqa: E402
+from pomodoro.profiling import Histogram  # noqa: E402
+
+
+class SimulatedMci(NullSink):
+    name = "simulated-mci"
+
+    def __init__(self, open_ms: float, play_ms: float) -> None:
+        super().__init__()
+        self._open_s = open_ms / 1000.0
+        self._play_s = play_ms / 1000.0
+
+    def prepare(self, sound: Path | None, pcm: Pcm | None) -> bool:
+        time.sleep(self._open_s)
+        return True
+
+    def play(self) -> None:
+        time.sleep(self._play_s)
+        self.plays += 1
+
+
+def legacy(n: int, open_ms: float, play_ms: float) -> Histogram:
+    """UI-thread time per notification: lookup, open, play (the old play_sound())."""
+    ui = Histogram()
+    sink = SimulatedMci(open_ms, play_ms)
+    for _ in range(n):
+        t0 = time.perf_counter()
+        sound = find_sound()
+        sink.prepare(sound, None)
+        sink.play()
+        ui.record((time.perf_counter() - t0) * 1000.0)
+    return ui
+
+
+def pipeline(n: int, open_ms: float, play_ms: float) -> tuple[Histogram, AudioPlayer]:
+    ui = Histogram()
+    audio = AudioPlayer([SimulatedMci(open_ms, play_ms)])
+    audio.preload()
+    time.sleep(open_ms / 1000.0 + 0.05)  # startup: preload finishes before the first phase ends
+    for _ in range(n):
+        t0 = time.perf_counter()
+        audio.play()
+        ui.record((time.perf_counter() - t0) * 1000.0)
+        time.sleep(play_ms / 1000.0 + 0.005)  # phases end far apart; let each play finish
+    audio.close()
+    return ui, audio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--notifications", type=int, default=50)
+    parser.add_argument("--open-ms", type=float, default=30.0)
+    parser.add_argument("--play-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    n = args.notifications
+    old = legacy(n, args.open_ms, args.play_ms)
+    ui, audio = pipeline(n, args.open_ms, args.play_ms)
+    print(f"{n} phase ends, open {args.open_ms:g} ms, play call {args.play_ms:g} ms:")
+    print(f"{'':<22} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for label, hist in (
+        ("before: Tk thread", old),
+        ("now: Tk thread", ui),
+        ("now: request -> sink", audio.latency),
+    ):
+        print(
+            f"{label:<22} {hist.percentile(50):>9.3f} {hist.percentile(95):>9.3f} "
+            f"{hist.max_ms:>9.3f}"
+        )
+    print(f"preload (once, audio thread): {audio.preload_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
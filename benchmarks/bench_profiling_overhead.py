@@ -0,0 +1,65 @@
+"""
+Benchmark: cost of --profile instrumentation per handler call.
+
+Disabled, nothing is wrapped: handlers are the original methods (zero overhead
+by construction). Enabled, each call adds two clock reads and a histogram
+update under a lock. Measured on an empty method and on a typical handler body
+(incremental task model update). No display needed.
+Run from project root:
+    python benchmarks/bench_profiling_overhead.py [--calls 200000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.profiling import Profiler  # noqa: E402
+from pomodoro.task_model import TaskModel  # noqa: E402
+
+
+def make_handler_class() -> type:
+    model = TaskModel()
+    model.load_text("\n".join(f"Task {i}" for i in range(1000)))
+
+    class Handlers:
+        def empty(self) -> None:
+            pass
+
+        def edit(self) -> None:
+            model.replace_lines(500, 1, ["Task 500 edited"])
+            _ = (model.active_index, model.done_count)
+
+    return Handlers
+
+
+def per_call_ns(obj: object, attr: str, calls: int, repeat: int = 5) -> float:
+    """Best of `repeat` runs."""
+    fn = getattr(obj, attr)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - t0)
+    return best / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+    print(f"{'handler':<8} {'disabled ns':>12} {'enabled ns':>11} {'overhead ns':>12}")
+    for attr in ("empty", "edit"):
+        plain = make_handler_class()
+        profiled = make_handler_class()
+        Profiler().patch(profiled, attr)
+        off = per_call_ns(plain(), attr, args.calls)
+        on = per_call_ns(profiled(), attr, args.calls)
+        print(f"{attr:<8} {off:>12.0f} {on:>11.0f} {on - off:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: timer widget updates per hour, unconditional render vs ViewModel guard.
+
+Runs an hour of pomodoros on a virtual clock with the Tk view's per-second
+wakeups, plus the stopped-timer renders settings edits cause (refresh / select
+mode on every keystroke in the duration fields). Each applied update is one
+Tcl round trip (label config, progress variable, tab/button redraw); the widgets
+are counters here, no display needed.
+Run from project root:
+    python benchmarks/bench_render_guard.py [--hours 1] [--edits-per-hour 120]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.engine import TimerEngine  # noqa: E402
+from pomodoro.ticker import VirtualClock  # noqa: E402
+from pomodoro.view_model import ViewModel, quantize_progress  # noqa: E402
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, _value: object) -> None:
+        self.calls += 1
+
+
+def simulate(hours: float, edits_per_hour: int) -> tuple[int, ViewModel, float]:
+    clock = VirtualClock()
+    cfg = {"work_minutes": 25, "break_minutes": 5}
+    view = ViewModel(clock=clock)
+    sink = Counter()
+    legacy = [0]
+    shown_mode: list[str | None] = [None]
+
+    def render() -> None:
+        # Before: label and progress variable on every render; tabs only on change.
+        legacy[0] += 2
+        if engine.selected_mode != shown_mode[0]:
+            shown_mode[0] = engine.selected_mode
+            legacy[0] += 1
+        view.push("clock.text", engine.display_text, sink)
+        view.push("clock.progress", quantize_progress(engine.progress), sink)
+        view.push("tabs.selected", engine.selected_mode, sink)
+
+    engine = TimerEngine(lambda: cfg, clock=clock, on_display=render)
+    engine.reset_to_work()
+    end = hours * 3600.0
+    edit_every = 3600.0 / edits_per_hour if edits_per_hour else end + 1
+    next_edit = edit_every
+    t0 = time.perf_counter()
+    while clock() < end:
+        engine.start()
+        while engine.running and clock() < end:
+            clock.advance(engine.next_delay_ms() / 1000.0)
+            engine.tick()
+        # Between phases the user tweaks settings: each keystroke re-renders.
+        while next_edit <= clock():
+            engine.refresh()
+            engine.select_mode(engine.selected_mode)
+            next_edit += edit_every
+    return legacy[0], view, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--edits-per-hour", type=int, default=120)
+    args = parser.parse_args()
+    legacy, view, elapsed = simulate(args.hours, args.edits_per_hour)
+    per_hour = 1.0 / args.hours
+    print(f"{args.hours:g} h of pomodoros, {args.edits_per_hour} settings edits/hour:")
+    print(f"  unconditional render  {legacy * per_hour:10.0f} widget updates/hour")
+    print(
+        f"  ViewModel guard       {view.applied * per_hour:10.0f} applied/hour  "
+        f"{view.skipped * per_hour:8.0f} skipped/hour"
+    )
+    saved = (legacy - view.applied) * per_hour
+    print(f"  saved                 {saved:10.0f} Tcl round trips/hour")
+    print(f"  (simulated in {elapsed:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
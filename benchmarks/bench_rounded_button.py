@@ -0,0 +1,73 @@
+"""
+Benchmark: RoundedButton redraw cost, delete-and-recreate vs item mutation.
+
+Replays what a session does to the timer buttons: phase switches (tab highlight),
+Start/Pause label changes and hover. The legacy path is the old _draw: delete("all")
+and create four arcs, two rectangles and the text on every change. Needs a display
+(real Tk canvas); the window stays withdrawn.
+Run from project root:
+    python benchmarks/bench_rounded_button.py [--changes 5000]
+"""
+
+import argparse
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.ui.rounded_button import RoundedButton, _rounded_rect  # noqa: E402
+
+COLORS = ("#e8e8e8", "#d0d0d0")
+LABELS = ("Старт", "Пауза")
+
+
+def legacy_draw(canvas: tk.Canvas, text: str, fill: str) -> int:
+    """Old _draw; returns the number of items created."""
+    canvas.delete("all")
+    ids = _rounded_rect(canvas, 0, 0, 100, 32, 8, fill=fill, outline="")
+    canvas.create_text(50, 16, text=text, fill="#1a1a1a", font=("Segoe UI", 10))
+    return len(ids) + 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--changes", type=int, default=5000)
+    args = parser.parse_args()
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"needs a display: {e}")
+        return
+    root.withdraw()
+
+    canvas = tk.Canvas(root, width=101, height=33, highlightthickness=0)
+    created = 0
+    t0 = time.perf_counter()
+    for i in range(args.changes):
+        created += legacy_draw(canvas, LABELS[i // 2 % 2], COLORS[i % 2])
+        root.update_idletasks()
+    legacy = time.perf_counter() - t0
+
+    button = RoundedButton(root, "Старт", width=100, height=32)
+    t0 = time.perf_counter()
+    for i in range(args.changes):
+        button.set_fill(COLORS[i % 2])
+        button.set_text(LABELS[i // 2 % 2])
+        root.update_idletasks()
+    mutated = time.perf_counter() - t0
+    stats = button.render_stats()
+    root.destroy()
+
+    print(f"{args.changes} button changes (fill every change, label every 2nd):")
+    print(f"  recreate  {legacy / args.changes * 1e6:8.1f} us/change  {created:8d} items created")
+    print(
+        f"  mutate    {mutated / args.changes * 1e6:8.1f} us/change  "
+        f"{stats['items_created']:8d} items created  "
+        f"{stats['itemconfig_calls']} itemconfig, {stats['updates_skipped']} skipped"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: TimerScheduler wakeups and operation cost with many concurrent timers.
+
+Runs on a simulated event loop (virtual clock), so it needs no display.
+Run from project root:
+    python benchmarks/bench_scheduler.py [--minutes 10]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.scheduler import TimerScheduler  # noqa: E402
+from pomodoro.ticker import VirtualClock  # noqa: E402
+
+
+class SimLoop:
+    """Event loop on a VirtualClock: one slot per armed callback, like after()."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        self._clock = clock
+        self._pending: dict[int, tuple[float, Callable[[], None]]] = {}
+        self._next = 0
+        self.arms = 0
+
+    def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any:
+        self._next += 1
+        self.arms += 1
+        self._pending[self._next] = (self._clock() + delay_ms / 1000.0, callback)
+        return self._next
+
+    def disarm(self, token: Any) -> None:
+        self._pending.pop(token, None)
+
+    def run_until(self, end: float) -> None:
+        while self._pending:
+            token, (when, callback) = min(self._pending.items(), key=lambda kv: kv[1][0])
+            if when > end:
+                break
+            del self._pending[token]
+            self._clock.now = max(self._clock.now, when)
+            callback()
+        self._clock.now = end
+
+
+def periodic(sched: TimerScheduler, period: float, first: float) -> None:
+    def fire() -> None:
+        sched.add(period, fire)
+
+    sched.add(first, fire)
+
+
+def scenario(name: str, minutes: float, setup: Callable[[TimerScheduler], None], slack: float = 0.0) -> None:
+    clock = VirtualClock()
+    loop = SimLoop(clock)
+    sched = TimerScheduler(loop, clock=clock, slack=slack)
+    setup(sched)
+    t0 = time.perf_counter()
+    loop.run_until(minutes * 60.0)
+    cpu = time.perf_counter() - t0
+    print(
+        f"{name:<44} wakeups/min {sched.wakeups / minutes:8.1f}   "
+        f"callbacks {sched.fired:8d}   cpu {cpu * 1000 / minutes:7.2f} ms/min"
+    )
+
+
+def op_cost(n: int) -> None:
+    clock = VirtualClock()
+    sched = TimerScheduler(SimLoop(clock), clock=clock)
+    rng = random.Random(n)
+    t0 = time.perf_counter()
+    handles = [sched.add(rng.uniform(1, 3600), lambda: None) for _ in range(n)]
+    t_add = time.perf_counter() - t0
+    sample = rng.sample(handles, min(n, 10000))
+    t0 = time.perf_counter()
+    for h in sample:
+        sched.pause(h)
+    for h in sample:
+        sched.resume(h)
+    t_pause = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for h in sample:
+        sched.cancel(h)
+    t_cancel = time.perf_counter() - t0
+    k = len(sample)
+    print(
+        f"n={n:>7}: add {t_add / n * 1e6:6.2f} us   pause+resume "
+        f"{t_pause / k * 1e6:6.2f} us   cancel {t_cancel / k * 1e6:6.2f} us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=10.0)
+    args = parser.parse_args()
+    rng = random.Random(1)
+
+    print("Wakeups (1 s periodic timers unless noted):")
+    scenario("1 timer", args.minutes, lambda s: periodic(s, 1.0, 1.0))
+    scenario(
+        "1 timer + 999 idle reminders (1-8 h)",
+        args.minutes,
+        lambda s: (
+            periodic(s, 1.0, 1.0),
+            [s.add(rng.uniform(3600, 8 * 3600), lambda: None) for _ in range(999)],
+        ),
+    )
+    scenario(
+        "1000 timers on a shared second grid",
+        args.minutes,
+        lambda s: [periodic(s, 1.0, 1.0) for _ in range(1000)],
+    )
+    scenario(
+        "1000 timers, random phase, slack 0",
+        args.minutes,
+        lambda s: [periodic(s, 1.0, rng.random()) for _ in range(1000)],
+    )
+    scenario(
+        "1000 timers, random phase, slack 50 ms",
+        args.minutes,
+        lambda s: [periodic(s, 1.0, rng.random()) for _ in range(1000)],
+        slack=0.05,
+    )
+
+    print("\nOperation cost:")
+    for n in (1000, 10000, 100000):
+        op_cost(n)
+
+
+if __name__ == "__main__":
+    main()
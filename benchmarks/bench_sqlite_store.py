@@ -0,0 +1,83 @@
+"""
+Benchmark: SQLite task storage at up to a million rows.
+
+Import from text, single-row tick, "next pending" and "done count" index
+queries, and a tick saved through the diffing save_tasks() path and through
+save_change() with the range the TaskList recorded (what ConfigWriter does).
+Run from project root:
+    python benchmarks/bench_sqlite_store.py [--tasks 1000000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.storage_sqlite import SqliteStore  # noqa: E402
+
+
+def timed(fn, repeat: int = 1) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+    n = args.tasks
+    rng = random.Random(1)
+    text = "\n".join(
+        ("+ " if i < n // 2 else "") + f"Task {i}: chapter {i % 97}" for i in range(n)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteStore(Path(tmp) / "pomodoro.db")
+        t = timed(lambda: store.import_text(text))
+        print(f"{n} tasks")
+        print(f"  import from text        {t * 1000:10.1f} ms")
+        t = timed(store.load_tasks)
+        print(f"  load all (ORDER BY pos) {t * 1000:10.1f} ms")
+
+        picks = [rng.randrange(n) for _ in range(args.ticks)]
+        t0 = time.perf_counter()
+        for i in picks:
+            store.set_line(i, f"+ Task {i}")
+        t = (time.perf_counter() - t0) / len(picks)
+        print(f"  tick (1-row UPDATE)     {t * 1e6:10.1f} us")
+        t = timed(store.next_pending, 200)
+        print(f"  next pending (index)    {t * 1e6:10.1f} us")
+        t = timed(store.done_count, 200)
+        print(f"  done count (counters)   {t * 1e6:10.1f} us")
+
+        tasks = store.load_tasks()
+
+        def tick_and_save() -> None:
+            i = rng.randrange(n)
+            tasks.set_done(i, not tasks.is_done(i))
+            store.save_tasks(tasks)
+        t = timed(tick_and_save, 10)
+        print(f"  tick via save_tasks()   {t * 1000:10.1f} ms   (snapshot diff is O(n) in Python)")
+
+        tasks.take_copy()  # start the change record at the saved state
+
+        def tick_and_save_change() -> None:
+            i = rng.randrange(n)
+            tasks.set_done(i, not tasks.is_done(i))
+            change = tasks.take_change()
+            if change is not None:
+                store.save_change(*change)
+        t = timed(tick_and_save_change, args.ticks)
+        print(f"  tick via save_change()  {t * 1e6:10.1f} us   (known range, no diff)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: overlay startup path, import time and time to first paint.
+
+Each run is a fresh interpreter. Reported (median of --runs):
+  import        - `import pomodoro.main` alone (-X importtime total), and which of
+                  the deferred modules (task editor, settings, attention/ctypes,
+                  subprocess, tracemalloc) it already loads;
+  startup-bench - `python -m pomodoro --startup-bench`: ms from entry to each mark
+                  (import, tk, clock, first_paint, panel) plus the process wall time.
+                  Needs a display; skipped without one. Runs against a temporary
+                  POMODORO_DIR, never the project's config.json / tasks.txt.
+Run from project root:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+
+_IMPORT_PROBE = """
+import sys
+import pomodoro.main
+from pomodoro.profiling import DEFERRED_MODULES
+print(" ".join(m for m in DEFERRED_MODULES if m in sys.modules))
+"""
+
+
+def import_probe() -> tuple[float, str]:
+    done = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_PROBE],
+        env=ENV, capture_output=True, text=True, check=True,
+    )
+    total_us = 0
+    for line in done.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == "pomodoro.main":
+            total_us = int(parts[1])
+    return total_us / 1000.0, done.stdout.strip()
+
+
+def startup_bench(env: dict[str, str]) -> tuple[dict, float] | None:
+    t0 = time.perf_counter()
+    done = subprocess.run(
+        [sys.executable, "-m", "pomodoro", "--startup-bench"],
+        env=env, cwd=ROOT, capture_output=True, text=True, timeout=60,
+    )
+    wall_ms = (time.perf_counter() - t0) * 1000.0
+    for line in done.stdout.splitlines():
+        if line.startswith("{"):
+            return json.loads(line), wall_ms
+    return None  # no display (TclError) or the overlay failed to start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    probes = [import_probe() for _ in range(args.runs)]
+    print(f"import pomodoro.main   {statistics.median(p[0] for p in probes):8.1f} ms")
+    print(f"  deferred modules loaded: {probes[0][1] or 'none'}")
+
+    with tempfile.TemporaryDirectory(prefix="pomodoro-bench-") as tmp:
+        env = {**ENV, "POMODORO_DIR": tmp}
+        runs = [r for r in (startup_bench(env) for _ in range(args.runs)) if r is not None]
+    if not runs:
+        print("startup-bench: skipped (no display)")
+        return
+    names = list(runs[0][0]["marks_ms"])
+    print("python -m pomodoro --startup-bench (ms since __main__ entry):")
+    for name in names:
+        values = [r["marks_ms"][name] for r, _ in runs if name in r["marks_ms"]]
+        print(f"  {name:<12} {statistics.median(values):8.1f}")
+    print(f"  {'wall':<12} {statistics.median(ms for _, ms in runs):8.1f}  (process start to exit)")
+    print(f"  deferred modules loaded at first paint: "
+          f"{' '.join(runs[0][0]['deferred_loaded_at_paint']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: per-keystroke task bookkeeping, full re-parse vs incremental TaskModel.
+
+The legacy path is what TasksWidget did on every <KeyRelease>: take the whole
+buffer, _text_to_tasks, scan for the first active task, count done tasks.
+The Text.get copy is approximated by joining the lines (no display needed).
+Run from project root:
+    python benchmarks/bench_task_keystroke.py [--keystrokes 200]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.task_model import TaskModel  # noqa: E402
+
+
+def make_lines(n: int) -> list[str]:
+    """Long-running list: the first 90% are completed tasks."""
+    done = int(n * 0.9)
+    return [f"+ Done task {i}" for i in range(done)] + [
+        f"Task {i}" for i in range(done, n)
+    ]
+
+
+def legacy_text_to_tasks(text: str) -> list[dict]:
+    tasks: list[dict] = []
+    for raw in text.splitlines():
+        if raw.lstrip().startswith("+"):
+            tasks.append({"text": raw.lstrip("+ \t"), "done": True})
+        else:
+            tasks.append({"text": raw, "done": False})
+    return tasks
+
+
+def legacy_keystroke(lines: list[str]) -> None:
+    raw = "\n".join(lines) + "\n"  # Text.get("1.0", END)
+    tasks = legacy_text_to_tasks(raw)
+    next(
+        (i for i, t in enumerate(tasks) if not t["done"] and t["text"].strip()),
+        None,
+    )
+    sum(1 for t in tasks if t.get("done", False))
+
+
+def run(n: int, keystrokes: int, rng: random.Random) -> tuple[float, float]:
+    lines = make_lines(n)
+    model = TaskModel()
+    model.load_text("\n".join(lines))
+    legacy: list[float] = []
+    incremental: list[float] = []
+    for _ in range(keystrokes):
+        row = rng.randrange(int(n * 0.9), n)
+        lines[row] += "x"
+        t0 = time.perf_counter()
+        legacy_keystroke(lines)
+        legacy.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        model.replace_lines(row, 1, [lines[row]])
+        model.active_index
+        model.done_count
+        incremental.append(time.perf_counter() - t0)
+    return statistics.median(legacy), statistics.median(incremental)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keystrokes", type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(1)
+    print(f"{'lines':>8}  {'full re-parse':>14}  {'incremental':>12}  speedup")
+    for n in (1_000, 10_000, 100_000):
+        ks = args.keystrokes if n < 100_000 else max(10, args.keystrokes // 10)
+        legacy, inc = run(n, ks, rng)
+        print(f"{n:>8}  {legacy * 1e3:11.3f} ms  {inc * 1e6:9.2f} us  {legacy / inc:8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: time to first frame when opening tasks.txt, eager parse vs memory-mapped lazy load.
+
+"First frame" = what the window needs to show: total/done counters, the active
+task and the first screen of rows. No display is needed.
+Run from project root:
+    python benchmarks/bench_task_load.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.task_file import load_tasks  # noqa: E402
+from pomodoro.task_model import TaskList, TaskModel  # noqa: E402
+
+SCREEN_ROWS = 40
+
+
+def make_file(path: Path, n: int, done_head: float, seed: int = 1) -> None:
+    """First done_head of the tasks are done (active task after them), ~20% of the rest."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(n):
+        prefix = "+ " if i < n * done_head or rng.random() < 0.2 else ""
+        lines.append(f"{prefix}Task {i}: review chapter {rng.randint(1, 99)} notes")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def first_frame(tasks: TaskList) -> TaskModel:
+    model = TaskModel(tasks)
+    _ = (model.total, model.done_count, model.active_text())
+    for i in range(min(SCREEN_ROWS, model.total)):
+        tasks.text(i)
+    return model
+
+
+def eager(path: Path) -> float:
+    t0 = time.perf_counter()
+    first_frame(TaskList.from_text(path.read_text(encoding="utf-8")))
+    return time.perf_counter() - t0
+
+
+def lazy(path: Path) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    model = first_frame(load_tasks(path))
+    t_first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    while model.load_more():
+        pass
+    return t_first, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument(
+        "--done-head", type=float, nargs="+", default=[0.0, 0.5],
+        help="fraction of leading done tasks (where the active task is)",
+    )
+    args = parser.parse_args()
+    print(
+        f"{'tasks':>9} {'MiB':>7} {'done head':>9} {'eager ms':>10} "
+        f"{'mmap first ms':>14} {'background ms':>14}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            for head in args.done_head:
+                path = Path(tmp) / f"tasks_{n}_{head}.txt"
+                make_file(path, n, head)
+                mib = path.stat().st_size / (1 << 20)
+                t_eager = eager(path)
+                t_first, t_rest = lazy(path)
+                print(
+                    f"{n:>9} {mib:>7.1f} {head:>9.0%} {t_eager * 1000:>10.1f} "
+                    f"{t_first * 1000:>14.1f} {t_rest * 1000:>14.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
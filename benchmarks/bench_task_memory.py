@@ -0,0 +1,74 @@
+"""
+Benchmark: memory per 100k tasks, legacy list[dict] vs TaskList (parallel arrays).
+
+Measured with tracemalloc on the parse of the same tasks.txt text, plus the
+cost of a progress (done/total) query. Run from project root:
+    python benchmarks/bench_task_memory.py [--tasks 100000]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.task_model import TaskList  # noqa: E402
+
+
+def legacy_text_to_tasks(text: str) -> list[dict]:
+    tasks: list[dict] = []
+    for raw in text.splitlines():
+        if raw.lstrip().startswith("+"):
+            tasks.append({"text": raw.lstrip("+ \t"), "done": True})
+        else:
+            tasks.append({"text": raw, "done": False})
+    return tasks
+
+
+def measure(build: Callable[[], Any]) -> tuple[Any, int]:
+    tracemalloc.start()
+    obj = build()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.tasks
+    text = "\n".join(
+        f"+ Done task number {i}" if i % 3 else f"Pending task number {i}"
+        for i in range(n)
+    )
+
+    legacy, legacy_bytes = measure(lambda: legacy_text_to_tasks(text))
+    compact, compact_bytes = measure(lambda: TaskList.from_text(text))
+    assert compact == TaskList.from_dicts(legacy)
+    assert compact.to_text() == text
+
+    t0 = time.perf_counter()
+    done = sum(1 for t in legacy if t.get("done", False))
+    legacy_progress = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    assert compact.done_count == done
+    compact_progress = time.perf_counter() - t0
+
+    scale = 100_000 / n
+    print(f"{n} tasks (text included), scaled to 100k tasks:")
+    print(
+        f"  list[dict] : {legacy_bytes * scale / 2**20:7.2f} MiB   "
+        f"{legacy_bytes / n:6.1f} B/task   progress {legacy_progress * 1e3:8.3f} ms"
+    )
+    print(
+        f"  TaskList   : {compact_bytes * scale / 2**20:7.2f} MiB   "
+        f"{compact_bytes / n:6.1f} B/task   progress {compact_progress * 1e3:8.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: cost of saving tasks.txt after ticking one task — full atomic rewrite vs journal patch.
+
+Both paths fsync. Also shows the in-place checkpoint (journal merged into tasks.txt)
+for a change near the end and near the start of the file.
+Run from project root:
+    python benchmarks/bench_task_save.py [--tasks 50000] [--ticks 200]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.config import atomic_write_text  # noqa: E402
+from pomodoro.task_journal import TaskFileWriter  # noqa: E402
+from pomodoro.task_model import TaskList  # noqa: E402
+
+
+def make_tasks(n: int) -> TaskList:
+    return TaskList.from_lines(f"Task {i}: write section {i % 97}" for i in range(n))
+
+
+def full_rewrite(path: Path, tasks: TaskList, picks: list[int]) -> tuple[float, int]:
+    written = 0
+    t0 = time.perf_counter()
+    for i in picks:
+        tasks.set_done(i, not tasks.is_done(i))
+        text = tasks.to_text()
+        atomic_write_text(path, text)
+        written += len(text.encode("utf-8"))
+    return time.perf_counter() - t0, written
+
+
+def journal(path: Path, tasks: TaskList, picks: list[int]) -> tuple[float, int, TaskFileWriter]:
+    writer = TaskFileWriter(path, journal_max=1 << 30)
+    writer.prime(list(tasks.lines()))
+    elapsed = 0.0
+    for i in picks:
+        tasks.set_done(i, not tasks.is_done(i))
+        lines = list(tasks.lines())  # done by ConfigWriter for any save path
+        t0 = time.perf_counter()
+        writer.write(lines)
+        elapsed += time.perf_counter() - t0
+    return elapsed, writer.bytes_written, writer
+
+
+def checkpoint(path: Path, tasks: TaskList, i: int) -> tuple[float, int]:
+    atomic_write_text(path, tasks.to_text())
+    writer = TaskFileWriter(path)
+    writer.prime(list(tasks.lines()))
+    tasks.set_done(i, not tasks.is_done(i))
+    writer.write(list(tasks.lines()))
+    before = writer.bytes_written
+    t0 = time.perf_counter()
+    writer.checkpoint()
+    return time.perf_counter() - t0, writer.bytes_written - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(1)
+    picks = [rng.randrange(args.tasks) for _ in range(args.ticks)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tasks.txt"
+        tasks = make_tasks(args.tasks)
+        atomic_write_text(path, tasks.to_text())
+        size = path.stat().st_size
+        print(f"{args.tasks} tasks, {size / 1024:.0f} KiB, {args.ticks} single ticks:")
+
+        t, written = full_rewrite(path, make_tasks(args.tasks), picks)
+        print(
+            f"  full rewrite   {t / args.ticks * 1000:8.3f} ms/tick  "
+            f"{written / args.ticks:12.0f} bytes/tick"
+        )
+
+        atomic_write_text(path, make_tasks(args.tasks).to_text())
+        t, written, writer = journal(path, make_tasks(args.tasks), picks)
+        print(
+            f"  journal patch  {t / args.ticks * 1000:8.3f} ms/tick  "
+            f"{written / args.ticks:12.0f} bytes/tick   (diff + journal append)"
+        )
+        writer.close()
+
+        print("Checkpoint (journal merged in place):")
+        for label, i in (("tick near the end", args.tasks - 10), ("tick near the start", 10)):
+            t, written = checkpoint(path, make_tasks(args.tasks), i)
+            print(f"  {label:<20} {t * 1000:8.3f} ms  {written:10d} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: widget options reconfigured per theme switch, full re-apply vs ThemeEngine diff.
+
+The widget set mirrors the window (frames, labels, entries, Text, radios, scale,
+progress style; canvas buttons subscribe to the palette). Full re-apply is what
+every apply_theme did before: configure every option of every widget. Each
+configured option is one Tcl round trip plus a redraw in the real window; the
+widgets here only count them (no display needed).
+Run from project root:
+    python benchmarks/bench_theme_switch.py [--switches 1000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.ui.theme import ROLES, THEME_DARK, THEME_LIGHT, Palette, ThemeEngine  # noqa: E402
+
+# role -> number of widgets with that role in the main window
+WINDOW_ROLES = {
+    "surface": 10,
+    "label": 2,
+    "panel": 2,
+    "panel_surface": 4,
+    "panel_label": 5,
+    "panel_dim": 1,
+    "entry": 2,
+    "text": 1,
+    "radio": 2,
+    "scale": 1,
+    "progressbar": 1,
+}
+
+
+class FakeWidget:
+    options = 0
+    calls = 0
+
+    def configure(self, **options: str) -> None:
+        FakeWidget.calls += 1
+        FakeWidget.options += len(options)
+
+
+def full_reapply(widgets: list[tuple[FakeWidget, str]], palette: Palette) -> None:
+    colors = dict(palette)  # theme_colors() copied the palette on every call
+    for widget, role in widgets:
+        widget.configure(**{opt: colors[key] for opt, key in ROLES[role].items()})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--switches", type=int, default=1000)
+    args = parser.parse_args()
+    accent = MappingProxyType({**THEME_DARK, "progress_fg": "#ff9800"})
+    palettes = {"light": THEME_LIGHT, "dark": THEME_DARK, "dark-accent": accent}
+    widgets = [(FakeWidget(), role) for role, n in WINDOW_ROLES.items() for _ in range(n)]
+    print(f"{len(widgets)} themed widgets, {args.switches} switches per scenario")
+    print(
+        f"{'scenario':<24} {'mode':<8} {'configure/switch':>17} "
+        f"{'options/switch':>15} {'us/switch':>10}"
+    )
+
+    scenarios = [
+        ("light <-> dark", ["light", "dark"]),
+        ("dark <-> dark-accent", ["dark", "dark-accent"]),
+        ("same theme again", ["dark", "dark"]),
+    ]
+    for label, names in scenarios:
+        for mode in ("full", "diff"):
+            engine = ThemeEngine(palettes, names[0])
+            if mode == "diff":
+                for widget, role in widgets:
+                    engine.register(widget, role)
+            FakeWidget.calls = FakeWidget.options = 0
+            t0 = time.perf_counter()
+            for i in range(args.switches):
+                name = names[(i + 1) % 2]
+                if mode == "full":
+                    full_reapply(widgets, palettes[name])
+                else:
+                    engine.switch(name)
+            elapsed = time.perf_counter() - t0
+            print(
+                f"{label:<24} {mode:<8} {FakeWidget.calls / args.switches:>17.1f} "
+                f"{FakeWidget.options / args.switches:>15.1f} "
+                f"{elapsed / args.switches * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
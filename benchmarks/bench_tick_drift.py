@@ -0,0 +1,94 @@
+"""
+Benchmark: end-of-phase error of the legacy per-second decrement vs DeadlineTicker.
+
+Simulates an event loop on a virtual clock: every after(delay) fires late by a
+random lag (normal load) and occasionally by a long stall (GC, window drag,
+slow disk). Run from project root:
+    python benchmarks/bench_tick_drift.py [--hours 8] [--seed 1]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.ticker import DeadlineTicker, VirtualClock  # noqa: E402
+
+SESSION_SECONDS = 25 * 60
+
+
+class LaggyLoop:
+    """Injected event-loop delay: exponential lag plus rare multi-second stalls."""
+
+    def __init__(self, rng: random.Random, mean_lag_ms: float, stall_rate: float) -> None:
+        self._rng = rng
+        self._mean_lag = mean_lag_ms / 1000.0
+        self._stall_rate = stall_rate
+
+    def lag(self) -> float:
+        lag = self._rng.expovariate(1.0 / self._mean_lag)
+        if self._rng.random() < self._stall_rate:
+            lag += self._rng.uniform(0.5, 3.0)
+        return lag
+
+
+def run_legacy(clock: VirtualClock, loop: LaggyLoop) -> float:
+    """Old TimerWidget._tick: remaining -= 1 per after(1000). Returns end error (s)."""
+    start = clock()
+    remaining = SESSION_SECONDS
+    while remaining > 0:
+        clock.advance(1.0 + loop.lag())
+        remaining -= 1
+    return clock() - (start + SESSION_SECONDS)
+
+
+def run_deadline(clock: VirtualClock, loop: LaggyLoop, ticker: DeadlineTicker) -> float:
+    """New path: after(next_delay_ms) and remaining read from the deadline."""
+    ticker.start(SESSION_SECONDS)
+    deadline = ticker.deadline or 0.0
+    while True:
+        clock.advance(ticker.next_delay_ms() / 1000.0 + loop.lag())
+        ticker.on_wakeup()
+        if ticker.remaining() <= 0:
+            ticker.finish()
+            return clock() - deadline
+
+
+def _summary(errors: list[float]) -> str:
+    ms = [e * 1000.0 for e in errors]
+    return f"mean {sum(ms) / len(ms):10.1f} ms   max {max(ms):10.1f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=float, default=8.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--mean-lag-ms", type=float, default=15.0)
+    parser.add_argument("--stall-rate", type=float, default=0.005)
+    args = parser.parse_args()
+
+    sessions = max(1, int(args.hours * 3600 // SESSION_SECONDS))
+    print(
+        f"{sessions} sessions x 25 min, mean lag {args.mean_lag_ms} ms, "
+        f"stall rate {args.stall_rate}"
+    )
+
+    rng = random.Random(args.seed)
+    clock = VirtualClock()
+    loop = LaggyLoop(rng, args.mean_lag_ms, args.stall_rate)
+    legacy = [run_legacy(clock, loop) for _ in range(sessions)]
+
+    rng.seed(args.seed)
+    clock = VirtualClock()
+    ticker = DeadlineTicker(clock)
+    deadline = [run_deadline(clock, loop, ticker) for _ in range(sessions)]
+
+    print(f"legacy decrement : end error {_summary(legacy)}")
+    print(f"deadline ticker  : end error {_summary(deadline)}")
+    print(f"deadline ticker stats: {ticker.stats.as_dict()}")
+
+
+if __name__ == "__main__":
+    main()
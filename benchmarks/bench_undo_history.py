@@ -0,0 +1,129 @@
+"""
+Benchmark: task editor undo history, unbounded Tk stack vs bounded UndoJournal.
+
+A paste-heavy session on an in-memory line buffer that patches TaskModel the
+way the Text proxy does: typing runs, large clipboard pastes and cuts. Reports
+history memory for Tk's own stack (keeps inserted and removed text of every
+edit, forever) vs UndoJournal under the cap, then undo/redo time per step for
+growing buffers. No display needed.
+Run from project root:
+    python benchmarks/bench_undo_history.py [--pastes 20] [--paste-kb 512] [--cap-kb 1024]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pomodoro.task_model import TaskModel  # noqa: E402
+from pomodoro.undo import Change, Pos, UndoJournal, advance  # noqa: E402
+
+
+class LineBuffer:
+    """Text-widget stand-in: (line, col) positions, each edit patches the model."""
+
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+        self.model = TaskModel()
+        self.model.load_text("\n".join(lines))
+
+    def get(self, start: Pos, end: Pos) -> str:
+        (l1, c1), (l2, c2) = start, end
+        if l1 == l2:
+            return self.lines[l1 - 1][c1:c2]
+        parts = [self.lines[l1 - 1][c1:]] + self.lines[l1 : l2 - 1] + [self.lines[l2 - 1][:c2]]
+        return "\n".join(parts)
+
+    def replace(self, start: Pos, end: Pos, text: str) -> None:
+        (l1, c1), (l2, c2) = start, end
+        head, tail = self.lines[l1 - 1][:c1], self.lines[l2 - 1][c2:]
+        new = (head + text + tail).split("\n")
+        self.lines[l1 - 1 : l2] = new
+        self.model.replace_lines(l1 - 1, l2 - l1 + 1, new)
+
+    def edit(
+        self, journal: UndoJournal, tk_stack: list[int], start: Pos, end: Pos, text: str
+    ) -> None:
+        removed = self.get(start, end)
+        self.replace(start, end, text)
+        journal.record(Change(start, advance(start, text), removed))
+        tk_stack.append(sys.getsizeof(removed) + sys.getsizeof(text))
+
+    def apply(self, change: Change) -> Change:
+        inserted = self.get(change.start, change.end)
+        self.replace(change.start, change.end, change.removed)
+        return Change(change.start, advance(change.start, change.removed), inserted)
+
+
+def session(
+    buf: LineBuffer, journal: UndoJournal, pastes: int, paste_kb: int, keystrokes: int
+) -> list[int]:
+    rng = random.Random(7)
+    tk_stack: list[int] = []
+    clip_lines = max(1, paste_kb * 1024 // 40)
+    clip = "\n".join(f"pasted task {i} " + "x" * 24 for i in range(clip_lines))
+    per_paste = max(1, keystrokes // max(1, pastes))
+    for p in range(pastes):
+        line = 1
+        for k in range(per_paste):
+            if k % 40 == 0:  # a new typing run on another task
+                line = rng.randrange(len(buf.lines)) + 1
+            col = len(buf.lines[line - 1])
+            buf.edit(journal, tk_stack, (line, col), (line, col), "abcdefgh"[k % 8])
+        at = rng.randrange(len(buf.lines)) + 1
+        buf.edit(journal, tk_stack, (at, 0), (at, 0), clip + "\n")
+        if p % 3 == 2:  # cut the block again
+            buf.edit(journal, tk_stack, (at, 0), (at + clip_lines, 0), "")
+    return tk_stack
+
+
+def undo_timing(lines: int, steps: int) -> tuple[float, float]:
+    buf = LineBuffer([f"Task {i}" for i in range(lines)])
+    journal = UndoJournal(clock=lambda: 0.0)
+    rng = random.Random(1)
+    for _ in range(steps):
+        line = rng.randrange(lines) + 1
+        buf.edit(journal, [], (line, 0), (line, 0), "+ ")
+    t0 = time.perf_counter()
+    while journal.undo(buf.apply):
+        pass
+    undo_us = (time.perf_counter() - t0) / steps * 1e6
+    t0 = time.perf_counter()
+    while journal.redo(buf.apply):
+        pass
+    redo_us = (time.perf_counter() - t0) / steps * 1e6
+    return undo_us, redo_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pastes", type=int, default=20)
+    parser.add_argument("--paste-kb", type=int, default=512)
+    parser.add_argument("--keystrokes", type=int, default=20000)
+    parser.add_argument("--cap-kb", type=int, default=1024)
+    args = parser.parse_args()
+
+    buf = LineBuffer([f"Task {i}" for i in range(1000)])
+    journal = UndoJournal(args.cap_kb * 1024)
+    tk_stack = session(buf, journal, args.pastes, args.paste_kb, args.keystrokes)
+    stats = journal.stats()
+    print(
+        f"{args.keystrokes} keystrokes, {args.pastes} pastes of {args.paste_kb} KB "
+        f"(every third cut again), cap {args.cap_kb} KB:"
+    )
+    print(f"  Tk undo stack   {len(tk_stack):8d} edits  {sum(tk_stack) / 1024:10.0f} KB")
+    print(
+        f"  UndoJournal     {stats['undo_steps']:8d} steps  {stats['bytes'] / 1024:10.0f} KB  "
+        f"({stats['merged']} keystrokes merged, {stats['dropped']} steps dropped)"
+    )
+    print("undo/redo of 200 single-line edits:")
+    for lines in (1000, 10000, 100000):
+        undo_us, redo_us = undo_timing(lines, 200)
+        print(f"  {lines:7d} lines  undo {undo_us:7.1f} us/step  redo {redo_us:7.1f} us/step")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,137 @@
 """Entry point for python -m pomodoro."""
 
-from pomodoro.main import main
+import time
+
+# --startup-bench measures from here (interpreter start-up itself is not included).
+_T0 = time.perf_counter()
+
+import argparse  # noqa: E402
+import sys  # noqa: E402
+
+from pomodoro.instance import COMMANDS, DEFAULT_COMMAND, InstanceLock  # noqa: E402
+from pomodoro.memprofile import DEFAULT_MEMPROFILE_PATH  # noqa: E402
+from pomodoro.profiling import DEFAULT_PROFILE_PATH  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pomodoro", description="Pomodoro overlay timer.")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=COMMANDS,
+        help="sent to the running instance if there is one (default show), "
+        "else run after startup",
+    )
+    parser.add_argument("text", nargs="?", help="task text for add-task")
+    parser.add_argument(
+        "--new-instance",
+        action="store_true",
+        help="do not hand off to a running instance (no single-instance lock)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_PROFILE_PATH,
+        metavar="PATH",
+        help=f"time hot-path handlers and after() lag; write JSON (or *.csv) on exit "
+        f"(default {DEFAULT_PROFILE_PATH})",
+    )
+    parser.add_argument(
+        "--memprofile",
+        nargs="?",
+        const=DEFAULT_MEMPROFILE_PATH,
+        metavar="PATH",
+        help=f"tracemalloc snapshots and Tk object counts every few minutes; write JSON "
+        f"on exit (default {DEFAULT_MEMPROFILE_PATH})",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="terminal mode: one status line, Space = start/pause, q = quit (no Tk)",
+    )
+    parser.add_argument(
+        "--startup-bench",
+        action="store_true",
+        help="start the overlay, print import time and time to first paint (ms, JSON) "
+        "once the panel is built, then exit",
+    )
+    parser.add_argument(
+        "--soak",
+        action="store_true",
+        help="with --memprofile: run a scripted headless soak (timer ticks, theme "
+        "switches, task edits) instead of the overlay",
+    )
+    args = parser.parse_args(argv)
+    if args.command == "add-task" and not (args.text or "").strip():
+        parser.error("add-task needs the task text")
+    return args
+
+
+# [START SPEC:POMODORO-29:MAIN_HANDOFF]
+# req_refs: REQ-POMODORO-29-01
+def claim_instance(args: argparse.Namespace) -> InstanceLock | None:
+    """
+    The single-instance lock if this launch is the instance (None if locking is
+    unavailable). Otherwise forward the command to the running instance, print
+    its state and exit: no Tk, no config or task files touched.
+    """
+    from pomodoro.config import get_base_dir
+    from pomodoro.instance import forward, format_state
+
+    base = get_base_dir()
+    try:
+        lock = InstanceLock(base)
+        if lock.acquire():
+            return lock
+    except OSError:
+        return None
+    try:
+        reply = forward(base, args.command or DEFAULT_COMMAND, args.text or "")
+    except (OSError, ValueError) as e:
+        sys.exit(f"pomodoro: the running instance did not answer ({e})")
+    if not reply.get("ok"):
+        sys.exit(f"pomodoro: {reply.get('error', 'command failed')}")
+    print(format_state(reply.get("state") or {}))
+    sys.exit(0)
+
+
+# [END SPEC:POMODORO-29:MAIN_HANDOFF]
+
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    command = (args.command, args.text or "") if args.command else None
+    single = not (args.soak or args.new_instance or args.startup_bench)
+    lock = claim_instance(args) if single else None
+    if args.soak:
+        from pathlib import Path
+
+        from pomodoro.memprofile import run_soak
+
+        path = Path(args.memprofile or DEFAULT_MEMPROFILE_PATH)
+        report = run_soak(path)
+        print(
+            f"{report['snapshots']} snapshots, traced growth "
+            f"{report['traced_growth_bytes']} bytes -> {path}"
+        )
+    elif args.headless:
+        from pomodoro.headless import run_headless
+
+        run_headless(lock=lock, command=command)
+    else:
+        startup = None
+        if args.startup_bench:
+            from pomodoro.profiling import StartupTimer
+
+            startup = StartupTimer(_T0)
+        from pomodoro.main import main
+
+        if startup is not None:
+            startup.mark("import")
+        main(
+            profile=args.profile,
+            memprofile=args.memprofile,
+            startup=startup,
+            lock=lock,
+            command=command,
+        )
@@ -0,0 +1,401 @@
+"""Notification sound: resolved and decoded once, played on a dedicated thread through a sink."""
+# [START SPEC:POMODORO-25:AUDIO]
+# req_refs: REQ-POMODORO-25-01, REQ-POMODORO-25-02, REQ-POMODORO-25-03
+
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from pomodoro.profiling import Histogram
+
+SOUND_NAME = "sound.mp3"
+# PCM format sounds are decoded to (16-bit little endian).
+PCM_RATE = 44100
+PCM_CHANNELS = 2
+PCM_WIDTH = 2
+
+_PKG_DIR = Path(__file__).resolve().parent
+
+
+def sound_candidates() -> list[Path]:
+    """sound.mp3: when frozen (exe) use sys._MEIPASS, else package or project root."""
+    paths: list[Path] = []
+    meipass: str | None = getattr(sys, "_MEIPASS", None)
+    if getattr(sys, "frozen", False) and meipass is not None:
+        paths.append(Path(meipass) / SOUND_NAME)
+    paths.extend([
+        _PKG_DIR / SOUND_NAME,
+        _PKG_DIR.parent.parent / SOUND_NAME,
+    ])
+    return paths
+
+
+def find_sound() -> Path | None:
+    for p in sound_candidates():
+        if p.is_file():
+            return p
+    return None
+
+
+class Pcm:
+    """Decoded samples: interleaved signed little-endian frames."""
+
+    __slots__ = ("data", "rate", "channels", "width")
+
+    def __init__(self, data: bytes, rate: int, channels: int, width: int) -> None:
+        self.data = data
+        self.rate = rate
+        self.channels = channels
+        self.width = width
+
+    @property
+    def duration_s(self) -> float:
+        return len(self.data) / float(self.rate * self.channels * self.width)
+
+    def to_wav(self) -> bytes:
+        import io
+        import wave
+
+        out = io.BytesIO()
+        with wave.open(out, "wb") as w:
+            w.setnchannels(self.channels)
+            w.setsampwidth(self.width)
+            w.setframerate(self.rate)
+            w.writeframes(self.data)
+        return out.getvalue()
+
+
+def decode(path: Path) -> Pcm | None:
+    """
+    *.wav through the wave module; anything else through ffmpeg if it is on
+    PATH (the stdlib has no MP3 decoder). None if the sound cannot be decoded.
+    """
+    if path.suffix.lower() == ".wav":
+        import wave
+
+        try:
+            with wave.open(str(path), "rb") as w:
+                return Pcm(
+                    w.readframes(w.getnframes()),
+                    w.getframerate(),
+                    w.getnchannels(),
+                    w.getsampwidth(),
+                )
+        except (OSError, EOFError, wave.Error):
+            return None
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    cmd = [
+        ffmpeg, "-v", "error", "-i", str(path),
+        "-f", "s16le", "-ac", str(PCM_CHANNELS), "-ar", str(PCM_RATE), "-",
+    ]
+    try:
+        done = subprocess.run(cmd, capture_output=True, timeout=15)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if done.returncode != 0 or not done.stdout:
+        return None
+    return Pcm(done.stdout, PCM_RATE, PCM_CHANNELS, PCM_WIDTH)
+
+
+# --- sinks: prepare() once, play() per notification; all calls on the audio thread ---
+
+
+class NullSink:
+    """Plays nothing; counts plays (sound off, tests)."""
+
+    name = "null"
+
+    def __init__(self) -> None:
+        self.plays = 0
+
+    def prepare(self, sound: Path | None, pcm: Pcm | None) -> bool:
+        return True
+
+    def play(self) -> None:
+        self.plays += 1
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink(NullSink):
+    """Writes the sound (WAV if decoded, else the original bytes) to path on every play."""
+
+    name = "file"
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self._path = path
+        self._payload = b""
+
+    def prepare(self, sound: Path | None, pcm: Pcm | None) -> bool:
+        if pcm is not None:
+            self._payload = pcm.to_wav()
+        elif sound is not None:
+            self._payload = sound.read_bytes()
+        return True
+
+    def play(self) -> None:
+        self._path.write_bytes(self._payload)
+        self.plays += 1
+
+
+class MciSink(NullSink):
+    """Windows MCI: the file is opened (and its decoder loaded) once; play rewinds it."""
+
+    name = "mci"
+    ALIAS = "pomodoro_snd"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._send: Callable[[str], int] | None = None
+
+    def prepare(self, sound: Path | None, pcm: Pcm | None) -> bool:
+        if sound is None or sys.platform != "win32":
+            return False
+        import ctypes
+
+        winmm = ctypes.windll.winmm  # type: ignore[attr-defined]
+
+        def send(command: str) -> int:
+            return int(winmm.mciSendStringW(command, None, 0, None))
+
+        send(f"close {self.ALIAS}")
+        if send(f'open "{sound.resolve()}" type mpegvideo alias {self.ALIAS}') != 0:
+            return False
+        self._send = send
+        return True
+
+    def play(self) -> None:
+        if self._send is not None:
+            self._send(f"play {self.ALIAS} from 0")
+            self.plays += 1
+
+    def close(self) -> None:
+        if self._send is not None:
+            self._send(f"close {self.ALIAS}")
+            self._send = None
+
+
+def _pcm_args(player: str, pcm: Pcm) -> list[str]:
+    fmt = f"s{8 * pcm.width}le"
+    if player == "paplay":
+        return [
+            "--raw", f"--format={fmt}", f"--rate={pcm.rate}", f"--channels={pcm.channels}"
+        ]
+    if player == "aplay":
+        return [
+            "-q", "-t", "raw", "-f", fmt.upper().replace("LE", "_LE"),
+            "-r", str(pcm.rate), "-c", str(pcm.channels), "-",
+        ]
+    return [
+        "-nodisp", "-autoexit", "-loglevel", "quiet",
+        "-f", fmt, "-ar", str(pcm.rate), "-ac", str(pcm.channels), "-i", "-",
+    ]
+
+
+class ProcessSink(NullSink):
+    """
+    External player (paplay, aplay, ffplay) fed the decoded PCM on stdin. The
+    next player process is started ahead of time and waits on stdin, so a play
+    only writes the buffer: no exec, library loading or device connect on the
+    notification path. Without PCM only ffplay works, started per play on the file.
+    """
+
+    def __init__(self, player: str) -> None:
+        super().__init__()
+        self.name = player
+        self._exe: str | None = None
+        self._argv: list[str] = []
+        self._pcm: bytes = b""
+        self._warm: subprocess.Popen | None = None
+        self._playing: list[subprocess.Popen] = []
+
+    def prepare(self, sound: Path | None, pcm: Pcm | None) -> bool:
+        self._exe = shutil.which(self.name)
+        if self._exe is None:
+            return False
+        if pcm is not None:
+            self._argv = [self._exe] + _pcm_args(self.name, pcm)
+            self._pcm = pcm.data
+            self._warm = self._spawn()
+            return self._warm is not None
+        if self.name == "ffplay" and sound is not None:
+            self._argv = [
+                self._exe, "-nodisp", "-autoexit", "-loglevel", "quiet", str(sound)
+            ]
+            return True
+        return False
+
+    def _spawn(self) -> subprocess.Popen | None:
+        try:
+            return subprocess.Popen(
+                self._argv,
+                stdin=subprocess.PIPE if self._pcm else subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+
+    def play(self) -> None:
+        self._playing = [p for p in self._playing if p.poll() is None]
+        proc = self._warm if self._pcm else self._spawn()
+        if proc is None:
+            return
+        self.plays += 1
+        self._playing.append(proc)
+        if not self._pcm:
+            return
+        self._warm = self._spawn()  # next one warms up while this one plays
+        if proc.stdin is None:
+            return
+        try:
+            proc.stdin.write(self._pcm)  # blocks at playback speed: audio thread only
+            proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+
+    def close(self) -> None:
+        procs = self._playing + ([self._warm] if self._warm is not None else [])
+        self._warm = None
+        for p in procs:
+            if p.poll() is None:
+                if p.stdin is not None and not p.stdin.closed:
+                    p.stdin.close()
+                p.terminate()
+
+
+def make_sinks(name: str) -> list[NullSink]:
+    """Sinks to try in order for a config "audio_sink" value (config.AUDIO_SINKS)."""
+    if name == "null":
+        return [NullSink()]
+    if name == "mci":
+        return [MciSink()]
+    if name in ("paplay", "aplay", "ffplay"):
+        return [ProcessSink(name)]
+    if sys.platform == "win32":
+        return [MciSink(), NullSink()]
+    return [ProcessSink(p) for p in ("paplay", "aplay", "ffplay")] + [NullSink()]
+
+
+class AudioPlayer:
+    """
+    Owns the sink on one daemon thread. preload() resolves and decodes the
+    sound and prepares the sink there (a play before that loads it first);
+    play() from the UI thread only stamps the request time and wakes the
+    thread. Requests that arrive while one is still waiting collapse into it.
+    stats() has the request -> sink latency (or pass a profiler histogram
+    as `latency`) and the sink call time.
+    """
+
+    def __init__(
+        self,
+        sinks: list[NullSink] | None = None,
+        sound: Path | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        latency: Histogram | None = None,
+        name: str = "pomodoro-audio",
+    ) -> None:
+        self._candidates = sinks if sinks is not None else make_sinks("auto")
+        self._sound = sound
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._load_wanted = False
+        self._requested: float | None = None
+        self._closed = False
+        self.sink: NullSink | None = None
+        self.requests = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.preload_ms = 0.0
+        self.latency = latency if latency is not None else Histogram()
+        self.sink_time = Histogram()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def preload(self) -> None:
+        with self._cond:
+            self._load_wanted = True
+            self._cond.notify()
+
+    def play(self) -> None:
+        """UI thread, O(1): request one play of the notification sound."""
+        with self._cond:
+            self.requests += 1
+            if self._requested is not None:
+                self.coalesced += 1
+                return
+            self._requested = self._clock()
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "sink": self.sink.name if self.sink is not None else None,
+                "requests": self.requests,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "preload_ms": round(self.preload_ms, 3),
+                "latency": self.latency.as_dict(),
+                "sink_time": self.sink_time.as_dict(),
+            }
+
+    def _load(self) -> NullSink:
+        t0 = self._clock()
+        sound = self._sound or find_sound()
+        pcm = decode(sound) if sound is not None else None
+        for sink in self._candidates:
+            try:
+                if sink.prepare(sound, pcm):
+                    self.sink = sink
+                    break
+            except Exception:
+                self.errors += 1
+        if self.sink is None:
+            self.sink = NullSink()
+        self.preload_ms = (self._clock() - t0) * 1000.0
+        return self.sink
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and not self._load_wanted and self._requested is None:
+                    self._cond.wait()
+                if self._closed:
+                    break
+                requested = self._requested
+                self._requested = None
+                self._load_wanted = False
+            sink = self.sink if self.sink is not None else self._load()
+            if requested is None:
+                continue
+            started = self._clock()
+            try:
+                sink.play()
+            except Exception:
+                self.errors += 1
+            done = self._clock()
+            with self._cond:
+                self.latency.record((started - requested) * 1000.0)
+                self.sink_time.record((done - started) * 1000.0)
+        if self.sink is not None:
+            try:
+                self.sink.close()
+            except Exception:
+                pass
+
+
+# [END SPEC:POMODORO-25:AUDIO]
@@ -0,0 +1,74 @@
+"""Event coalescing: bursts of UI events merged into one update per idle cycle or frame."""
+# [START SPEC:POMODORO-17:COALESCE]
+# req_refs: REQ-POMODORO-17-01, REQ-POMODORO-17-02
+
+from typing import Any, Callable
+
+
+class Coalescer:
+    """
+    Deferred updates keyed by name. schedule(key, fn) counts one raw event and
+    (re)places the key's update; the first event after a flush posts a single
+    flush via `post` (lambda fn: root.after_idle(fn) for one update per idle
+    cycle, or root.after(frame_ms, fn) for one per frame). A burst of events
+    for the same key therefore runs its update once, with the latest callback.
+    No tkinter import: `post` is the only link to the event loop.
+    """
+
+    def __init__(self, post: Callable[[Callable[[], None]], Any]) -> None:
+        self._post = post
+        self._pending: dict[str, Callable[[], None]] = {}
+        self._posted = False
+        self._raw: dict[str, int] = {}
+        self._executed: dict[str, int] = {}
+
+    def schedule(self, key: str, fn: Callable[[], None]) -> None:
+        """Record one event for key; fn runs at the next flush (latest fn wins)."""
+        self._raw[key] = self._raw.get(key, 0) + 1
+        self._pending[key] = fn
+        if not self._posted:
+            self._posted = True
+            self._post(self.flush)
+
+    def cancel(self, key: str) -> None:
+        self._pending.pop(key, None)
+
+    def flush(self) -> None:
+        """
+        Run every pending update now, in first-scheduled order. If one raises,
+        the updates after it stay pending (ahead of newer keys, with a flush
+        posted for them) and the error propagates.
+        """
+        self._posted = False
+        batch, self._pending = self._pending, {}
+        items = iter(batch.items())
+        try:
+            for key, fn in items:
+                self._executed[key] = self._executed.get(key, 0) + 1
+                fn()
+        except BaseException:
+            rest = dict(items)
+            rest.update(self._pending)  # rescheduled meanwhile: the latest fn wins
+            self._pending = rest
+            if rest and not self._posted:
+                self._posted = True
+                self._post(self.flush)
+            raise
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def counters(self) -> dict[str, tuple[int, int]]:
+        """key -> (raw events, executed updates)."""
+        return {key: (raw, self._executed.get(key, 0)) for key, raw in self._raw.items()}
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "raw": sum(self._raw.values()),
+            "executed": sum(self._executed.values()),
+            "pending": len(self._pending),
+        }
+
+
+# [END SPEC:POMODORO-17:COALESCE]
@@ -2,18 +2,35 @@
 # [START SPEC:POMODORO-1:CONFIG]
 # req_refs: REQ-POMODORO-1-03, REQ-POMODORO-1-11
 
+import os
 import sys
 from pathlib import Path
 from typing import Any
 
-from pomodoro.ui.tasks import _tasks_to_text, _text_to_tasks
+from pomodoro.task_file import load_tasks
+from pomodoro.task_journal import discard_journal, journal_path, recover, set_aside_journal
+from pomodoro.task_model import TaskList
 
 CONFIG_FILENAME = "config.json"
 TASKS_FILENAME = "tasks.txt"
+# Overrides the base directory (benchmarks run the app against a temporary one).
+BASE_DIR_ENV = "POMODORO_DIR"
+# Sink names accepted by "audio_sink" (pomodoro.audio.make_sinks);
+# "auto" = MCI on Windows, else first player found.
+AUDIO_SINKS = ("auto", "mci", "paplay", "aplay", "ffplay", "null")
+# Channel names accepted by "notify_channels" (pomodoro.dispatch.make_channels).
+NOTIFY_CHANNELS = ("sound", "flash", "desktop", "hook", "webhook")
+DEFAULT_NOTIFY_CHANNELS = ("sound", "flash")
 
 
 def get_base_dir() -> Path:
-    """Base directory: same folder as exe when frozen, else project root (parent of src)."""
+    """
+    Base directory: $POMODORO_DIR if set, else same folder as exe when frozen,
+    else project root (parent of src).
+    """
+    override = os.environ.get(BASE_DIR_ENV)
+    if override:
+        return Path(override).resolve()
     if getattr(sys, "frozen", False):
         return Path(sys.executable).resolve().parent
     # Running as script: src/pomodoro/config.py -> project root = parent of src
@@ -40,6 +57,16 @@ def _default_settings() -> dict[str, Any]:
         "break_minutes": 5,
         "theme": "light",
         "active_task_index": None,
+        "save_delay_ms": 500,
+        "virtual_threshold": 5000,
+        "storage": "text",
+        "coalesce_ms": 0,
+        "undo_max_kb": 1024,
+        "audio_sink": "auto",
+        "notify_channels": list(DEFAULT_NOTIFY_CHANNELS),
+        "notify_timeout_ms": 3000,
+        "notify_hook": "",
+        "notify_webhook": "",
     }
 
 
@@ -51,45 +78,110 @@ def _validate_settings(data: dict[str, Any]) -> dict[str, Any]:
     out["alpha"] = max(0.3, min(1.0, out["alpha"]))
     out["work_minutes"] = max(1, int(data.get("work_minutes", default["work_minutes"])))
     out["break_minutes"] = max(1, int(data.get("break_minutes", default["break_minutes"])))
-    out["theme"] = "dark" if data.get("theme") == "dark" else "light"
+    # "light", "dark" or a custom theme name (themes/<name>.json) [REQ-POMODORO-18-04]
+    theme = data.get("theme")
+    out["theme"] = theme if isinstance(theme, str) and theme.strip() else "light"
     out["active_task_index"] = data.get("active_task_index")
+    out["save_delay_ms"] = max(
+        0, min(60000, int(data.get("save_delay_ms", default["save_delay_ms"])))
+    )
+    out["virtual_threshold"] = max(
+        100, int(data.get("virtual_threshold", default["virtual_threshold"]))
+    )
+    out["storage"] = "sqlite" if data.get("storage") == "sqlite" else "text"
+    out["coalesce_ms"] = max(
+        0, min(100, int(data.get("coalesce_ms", default["coalesce_ms"])))
+    )
+    # Task editor undo history cap [REQ-POMODORO-24-01]
+    out["undo_max_kb"] = max(
+        0, min(262144, int(data.get("undo_max_kb", default["undo_max_kb"])))
+    )
+    # "auto", "mci", "paplay", "aplay", "ffplay" or "null" (no sound) [REQ-POMODORO-25-02]
+    sink = data.get("audio_sink")
+    out["audio_sink"] = sink if sink in AUDIO_SINKS else default["audio_sink"]
+    # Notification channels, per-channel timeout, shell hook, webhook [REQ-POMODORO-26-02]
+    channels = data.get("notify_channels")
+    if isinstance(channels, list):
+        out["notify_channels"] = [c for c in channels if c in NOTIFY_CHANNELS]
+    else:
+        out["notify_channels"] = list(default["notify_channels"])
+    out["notify_timeout_ms"] = max(
+        100, min(60000, int(data.get("notify_timeout_ms", default["notify_timeout_ms"])))
+    )
+    for key in ("notify_hook", "notify_webhook"):
+        value = data.get(key)
+        out[key] = value if isinstance(value, str) else ""
     return out
 
 
 def load_config() -> dict[str, Any]:
     """
-    Load settings from config.json and tasks from tasks.txt.
+    Load settings from config.json and tasks from tasks.txt (with "storage": "sqlite"
+    in config.json, settings and tasks come from pomodoro.db instead).
     If config.json is missing, create it with defaults. Tasks from tasks.txt or [].
-    Post: returns dict with alpha, work_minutes, break_minutes, theme, active_task_index, tasks.
+    Post: returns dict with alpha, work_minutes, break_minutes, theme, active_task_index,
+    tasks (TaskList; a lazily parsed MappedTaskList for large files).
     """
-    import json
+    return load_tasks_into(load_settings())
 
-    base = get_base_dir()
-    base.mkdir(parents=True, exist_ok=True)
-    config_path = base / CONFIG_FILENAME
-    tasks_path = base / TASKS_FILENAME
 
-    # Settings
+# [START SPEC:POMODORO-28:CONFIG_SNAPSHOT]
+# req_refs: REQ-POMODORO-28-02
+def load_settings() -> dict[str, Any]:
+    """
+    Settings only, from config.json (created with defaults if missing): the
+    snapshot the overlay draws its clock from before any task is read.
+    With storage "sqlite" the database values are applied by load_tasks_into().
+    """
+    import json
+
+    config_path = get_config_path()
     if not config_path.exists():
         config_path.write_text(
             json.dumps(_default_settings(), ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
     try:
-        settings = _validate_settings(
-            json.loads(config_path.read_text(encoding="utf-8"))
-        )
+        return _validate_settings(json.loads(config_path.read_text(encoding="utf-8")))
     except (OSError, ValueError):
-        settings = _default_settings()
-
-    # Tasks
-    if tasks_path.exists():
-        try:
-            tasks = _text_to_tasks(tasks_path.read_text(encoding="utf-8"))
-        except OSError:
-            tasks = []
-    else:
-        tasks = []
+        return _default_settings()
+
+
+def load_tasks_into(settings: dict[str, Any]) -> dict[str, Any]:
+    """
+    Add tasks to settings (in place) and return it: journal recovery, tasks
+    from pomodoro.db or tasks.txt, active_task_index clamped to the task count.
+    With storage "sqlite" the settings stored in the database replace the
+    config.json ones.
+    """
+    base = get_base_dir()
+    tasks_path = base / TASKS_FILENAME
+
+    # Replay a journal left by an interrupted session [REQ-POMODORO-14-03]
+    try:
+        recover(tasks_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        # Unusable journal: keep it as .bad, never append this session's patches to it
+        if journal_path(tasks_path).exists():
+            try:
+                set_aside_journal(tasks_path)
+            except OSError:
+                pass
+
+    # Tasks: pomodoro.db with storage "sqlite" [REQ-POMODORO-15-04], else tasks.txt
+    # (large files are memory-mapped and parsed lazily) [REQ-POMODORO-13-01]
+    tasks: TaskList | None = None
+    if settings["storage"] == "sqlite":
+        stored, tasks = _load_sqlite(base, settings)
+        settings.update(stored)
+    if tasks is None:
+        if tasks_path.exists():
+            try:
+                tasks = load_tasks(tasks_path)
+            except OSError:
+                tasks = TaskList()
+        else:
+            tasks = TaskList()
 
     # Clamp active_task_index to tasks length
     ai = settings.get("active_task_index")
@@ -99,21 +191,70 @@ def load_config() -> dict[str, Any]:
         idx = int(ai)
         active_idx = idx if 0 <= idx < len(tasks) else None
     settings["active_task_index"] = active_idx
+    settings["tasks"] = tasks
+    return settings
 
-    return {**settings, "tasks": tasks}
 
+# [END SPEC:POMODORO-28:CONFIG_SNAPSHOT]
 
-def save_config(data: dict[str, Any]) -> None:
+
+# [START SPEC:POMODORO-15:CONFIG_SQLITE]
+# req_refs: REQ-POMODORO-15-04
+def _load_sqlite(
+    base: Path, settings: dict[str, Any]
+) -> tuple[dict[str, Any], TaskList | None]:
+    """
+    Settings and tasks from pomodoro.db; an empty database is first filled from
+    tasks.txt and config.json. On a database error falls back to the text files
+    for this session: returns (settings with storage "text", None).
+    """
+    import sqlite3
+
+    from pomodoro import storage_sqlite
+
+    try:
+        store = storage_sqlite.get_store(base)
+        if store.is_empty():
+            tasks_path = base / TASKS_FILENAME
+            if tasks_path.exists():
+                store.import_text(tasks_path.read_text(encoding="utf-8"))
+            store.save_settings(settings)
+        stored = _validate_settings({**settings, **store.load_settings(), "storage": "sqlite"})
+        return stored, store.load_tasks()
+    except (sqlite3.Error, OSError, ValueError):
+        return {**settings, "storage": "text"}, None
+
+
+def record_session(data: dict[str, Any], phase: str, seconds: int, task: str = "") -> None:
+    """Add a finished interval to the session history (SQLite storage only)."""
+    if data.get("storage") != "sqlite":
+        return
+    import sqlite3
+
+    from pomodoro import storage_sqlite
+
+    try:
+        storage_sqlite.get_store(get_base_dir()).record_session(phase, seconds, task)
+    except sqlite3.Error:
+        pass
+
+
+# [END SPEC:POMODORO-15:CONFIG_SQLITE]
+
+
+# [START SPEC:POMODORO-8:CONFIG_ATOMIC]
+# req_refs: REQ-POMODORO-8-03, REQ-POMODORO-8-04
+def render_config(data: dict[str, Any]) -> tuple[str, str]:
     """
-    Save settings to config.json (no tasks) and tasks to tasks.txt.
+    File contents for data: (config.json text, tasks.txt text).
     Pre: data has keys alpha, work_minutes, break_minutes, theme, active_task_index, tasks.
     """
-    import json
+    return render_settings(data), TaskList.coerce(data.get("tasks")).to_text()
 
-    base = get_base_dir()
-    base.mkdir(parents=True, exist_ok=True)
-    config_path = base / CONFIG_FILENAME
-    tasks_path = base / TASKS_FILENAME
+
+def render_settings(data: dict[str, Any]) -> str:
+    """config.json text for data (settings only)."""
+    import json
 
     settings = {
         "alpha": data.get("alpha", 0.85),
@@ -121,14 +262,54 @@ def save_config(data: dict[str, Any]) -> None:
         "break_minutes": data.get("break_minutes", 5),
         "theme": data.get("theme", "light"),
         "active_task_index": data.get("active_task_index"),
+        "save_delay_ms": data.get("save_delay_ms", 500),
+        "virtual_threshold": data.get("virtual_threshold", 5000),
+        "storage": data.get("storage", "text"),
+        "coalesce_ms": data.get("coalesce_ms", 0),
+        "undo_max_kb": data.get("undo_max_kb", 1024),
+        "audio_sink": data.get("audio_sink", "auto"),
+        "notify_channels": data.get("notify_channels", ["sound", "flash"]),
+        "notify_timeout_ms": data.get("notify_timeout_ms", 3000),
+        "notify_hook": data.get("notify_hook", ""),
+        "notify_webhook": data.get("notify_webhook", ""),
     }
-    config_path.write_text(
-        json.dumps(settings, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    return json.dumps(settings, ensure_ascii=False, indent=2)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write text via a temp file in the same directory + os.replace.
+    Post: path holds either the old or the new content, never a partial write.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def save_config(data: dict[str, Any]) -> None:
+    """
+    Save settings to config.json (no tasks) and tasks to tasks.txt, atomically;
+    with storage "sqlite" both go to pomodoro.db (changed rows only).
+    Pre: data has keys alpha, work_minutes, break_minutes, theme, active_task_index, tasks.
+    """
+    base = get_base_dir()
+    base.mkdir(parents=True, exist_ok=True)
+    if data.get("storage") == "sqlite":
+        from pomodoro import storage_sqlite
+
+        settings = _validate_settings(data)
+        storage_sqlite.get_store(base).save(settings, TaskList.coerce(data.get("tasks")))
+        return
+    config_text, tasks_text = render_config(data)
+    atomic_write_text(base / CONFIG_FILENAME, config_text)
+    atomic_write_text(base / TASKS_FILENAME, tasks_text)
+    discard_journal(base / TASKS_FILENAME)
+
 
-    tasks = data.get("tasks", [])
-    tasks_path.write_text(_tasks_to_text(tasks), encoding="utf-8")
+# [END SPEC:POMODORO-8:CONFIG_ATOMIC]
 
 
 # [END SPEC:POMODORO-1:CONFIG]
@@ -0,0 +1,290 @@
+"""Timer event fan-out: one bounded queue and thread per notification channel, timeouts, drops."""
+# [START SPEC:POMODORO-26:DISPATCH]
+# req_refs: REQ-POMODORO-26-01, REQ-POMODORO-26-02, REQ-POMODORO-26-03
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+from pomodoro.config import DEFAULT_NOTIFY_CHANNELS
+from pomodoro.engine import BREAK
+from pomodoro.profiling import Histogram
+
+DEFAULT_TIMEOUT_MS = 3000
+# Events waiting per channel; when full the oldest is dropped.
+QUEUE_SIZE = 8
+PHASE_END = "phase_end"
+
+
+class TimerEvent:
+    """What happened: kind (PHASE_END), finished phase, active task, wall-clock time."""
+
+    __slots__ = ("kind", "phase", "task", "at")
+
+    def __init__(self, kind: str, phase: str, task: str = "", at: float | None = None) -> None:
+        self.kind = kind
+        self.phase = phase
+        self.task = task
+        self.at = time.time() if at is None else at
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"event": self.kind, "phase": self.phase, "task": self.task, "time": self.at}
+
+    def message(self) -> str:
+        if self.phase == BREAK:
+            return "Перерыв окончен"
+        return f"Помодоро окончен: {self.task}" if self.task else "Помодоро окончен"
+
+
+# --- channels: send() runs on the channel's own thread and may block ---
+
+
+class CallChannel:
+    """Calls fn() per event (sound request, taskbar flash posted to the UI thread)."""
+
+    def __init__(self, name: str, fn: Callable[[], Any], timeout_s: float) -> None:
+        self.name = name
+        self.timeout_s = timeout_s
+        self._fn = fn
+
+    def send(self, event: TimerEvent) -> None:
+        self._fn()
+
+
+class CommandChannel:
+    """
+    Runs a command per event. Desktop notifications: notify-send (talks to the
+    org.freedesktop.Notifications D-Bus service; any stand-in with the same
+    arguments works). Shell hook: the user's command line with POMODORO_EVENT,
+    POMODORO_PHASE, POMODORO_TASK and POMODORO_TIME in the environment.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        command: "list[str] | str",
+        timeout_s: float,
+        with_message: bool = False,
+    ) -> None:
+        self.name = name
+        self.timeout_s = timeout_s
+        self._command = command
+        self._with_message = with_message
+
+    def send(self, event: TimerEvent) -> None:
+        import os
+        import subprocess
+
+        env = dict(os.environ)
+        env.update({
+            "POMODORO_EVENT": event.kind,
+            "POMODORO_PHASE": event.phase,
+            "POMODORO_TASK": event.task,
+            "POMODORO_TIME": str(event.at),
+        })
+        command = self._command
+        if self._with_message and isinstance(command, list):
+            command = command + ["Pomodoro", event.message()]
+        subprocess.run(
+            command,
+            shell=isinstance(command, str),
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=self.timeout_s,
+            check=True,
+        )
+
+
+class WebhookChannel:
+    """POSTs the event as JSON to url (e.g. a local automation server)."""
+
+    def __init__(self, url: str, timeout_s: float, name: str = "webhook") -> None:
+        self.name = name
+        self.timeout_s = timeout_s
+        self._url = url
+
+    def send(self, event: TimerEvent) -> None:
+        import json
+        import urllib.request
+
+        request = urllib.request.Request(
+            self._url,
+            data=json.dumps(event.as_dict(), ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout_s) as response:
+            response.read()
+
+
+def make_channels(
+    cfg: dict, sound: Callable[[], Any], flash: Callable[[], Any]
+) -> list[Any]:
+    """Channels enabled in cfg; hook/webhook only when their command/url is set."""
+    import shutil
+
+    timeout_s = int(cfg.get("notify_timeout_ms", DEFAULT_TIMEOUT_MS)) / 1000.0
+    names = cfg.get("notify_channels", DEFAULT_NOTIFY_CHANNELS)
+    channels: list[Any] = []
+    if "sound" in names:
+        channels.append(CallChannel("sound", sound, timeout_s))
+    if "flash" in names:
+        channels.append(CallChannel("flash", flash, timeout_s))
+    if "desktop" in names:
+        notify_send = shutil.which("notify-send")
+        if notify_send is not None:
+            channels.append(
+                CommandChannel(
+                    "desktop", [notify_send, "--app-name=Pomodoro"], timeout_s, with_message=True
+                )
+            )
+    hook = str(cfg.get("notify_hook", "")).strip()
+    if "hook" in names and hook:
+        channels.append(CommandChannel("hook", hook, timeout_s))
+    url = str(cfg.get("notify_webhook", "")).strip()
+    if "webhook" in names and url:
+        channels.append(WebhookChannel(url, timeout_s))
+    return channels
+
+
+class _Lane:
+    """
+    One channel's bounded queue and thread. Each send runs on a short-lived
+    thread joined with the channel timeout; a send still running after it is
+    abandoned (counted in timeouts) and, while it stays stuck, new events for
+    the channel are dropped instead of piling up more threads.
+    """
+
+    def __init__(
+        self, channel: Any, size: int, latency: Histogram, clock: Callable[[], float]
+    ) -> None:
+        self.channel = channel
+        self.latency = latency
+        self._size = size
+        self._clock = clock
+        self._queue: deque[tuple[float, TimerEvent]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._stuck: threading.Thread | None = None
+        self.sent = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.dropped = 0
+        self.last_error = ""
+        self._thread = threading.Thread(
+            target=self._run, name=f"pomodoro-notify-{channel.name}", daemon=True
+        )
+        self._thread.start()
+
+    def offer(self, queued_at: float, event: TimerEvent) -> None:
+        with self._cond:
+            if len(self._queue) >= self._size:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append((queued_at, event))
+            self._cond.notify()
+
+    def close(self, timeout: float) -> None:
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify()
+        self._thread.join(timeout=timeout)
+
+    def _send(self, event: TimerEvent, outcome: list[Exception]) -> None:
+        try:
+            self.channel.send(event)
+        except Exception as e:  # reported through stats, never raised into the loop
+            outcome.append(e)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                queued_at, event = self._queue.popleft()
+            if self._stuck is not None and self._stuck.is_alive():
+                with self._cond:
+                    self.dropped += 1
+                continue
+            self._stuck = None
+            outcome: list[Exception] = []
+            call = threading.Thread(
+                target=self._send, args=(event, outcome), name=self._thread.name, daemon=True
+            )
+            call.start()
+            call.join(self.channel.timeout_s)
+            with self._cond:
+                if call.is_alive():
+                    self._stuck = call
+                    self.timeouts += 1
+                    continue
+                self.latency.record((self._clock() - queued_at) * 1000.0)
+                if outcome:
+                    self.errors += 1
+                    self.last_error = f"{type(outcome[0]).__name__}: {outcome[0]}"
+                else:
+                    self.sent += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "sent": self.sent,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "dropped": self.dropped,
+                "queued": len(self._queue),
+                "hung": self._stuck is not None and self._stuck.is_alive(),
+                "last_error": self.last_error,
+                "latency": self.latency.as_dict(),
+            }
+
+
+class NotificationDispatcher:
+    """
+    Fans timer events out to channels. publish() is called on the UI thread
+    (on_timer_finish) and only appends to each channel's bounded queue, so a
+    slow or hung channel never delays the next tick or the other channels.
+    Per-channel latency (publish -> send done), errors, timeouts and drops are
+    in stats(); `histogram(name)` supplies the latency histograms (e.g.
+    Profiler.histogram, so --profile reports them).
+    """
+
+    def __init__(
+        self,
+        channels: list[Any],
+        queue_size: int = QUEUE_SIZE,
+        clock: Callable[[], float] = time.perf_counter,
+        histogram: Callable[[str], Histogram] | None = None,
+    ) -> None:
+        self._clock = clock
+        new_histogram = histogram or (lambda name: Histogram())
+        self._lanes = [
+            _Lane(c, queue_size, new_histogram(f"notify:{c.name}"), clock) for c in channels
+        ]
+        self.published = 0
+
+    def publish(self, event: TimerEvent) -> None:
+        """UI thread, O(channels), never blocks on a channel."""
+        self.published += 1
+        now = self._clock()
+        for lane in self._lanes:
+            lane.offer(now, event)
+
+    def close(self, timeout: float = 1.0) -> None:
+        for lane in self._lanes:
+            lane.close(timeout / max(1, len(self._lanes)))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "published": self.published,
+            "channels": {lane.channel.name: lane.stats() for lane in self._lanes},
+        }
+
+
+# [END SPEC:POMODORO-26:DISPATCH]
@@ -0,0 +1,196 @@
+"""Headless timer state machine: WORK/BREAK phases on an injectable clock (no tkinter)."""
+# [START SPEC:POMODORO-6:ENGINE]
+# req_refs: REQ-POMODORO-6-01, REQ-POMODORO-6-02, REQ-POMODORO-6-03
+
+import time
+from typing import Callable
+
+from pomodoro.ticker import DeadlineTicker, TickStats, whole_seconds
+
+WORK = "work"
+BREAK = "break"
+
+
+def format_mmss(seconds: float) -> str:
+    m, s = divmod(whole_seconds(seconds), 60)
+    return f"{m:02d}:{s:02d}"
+
+
+class TimerEngine:
+    """
+    Pomodoro logic without any widgets: selected mode, current phase, run state,
+    deadline countdown and the automatic WORK <-> BREAK switch on finish.
+    Front ends call tick() when next_delay_ms() elapses and redraw in on_display.
+    Pre: get_config() returns dict with work_minutes and break_minutes.
+    """
+
+    def __init__(
+        self,
+        get_config: Callable[[], dict],
+        clock: Callable[[], float] = time.monotonic,
+        on_finish: Callable[[str], None] | None = None,
+        on_run_state_changed: Callable[[bool], None] | None = None,
+        on_phase_changed: Callable[[str], None] | None = None,
+        on_display: Callable[[], None] | None = None,
+    ) -> None:
+        self._get_config = get_config
+        self._clock = clock
+        self._on_finish = on_finish or (lambda _: None)
+        self._on_run_state = on_run_state_changed or (lambda _: None)
+        self._on_phase = on_phase_changed or (lambda _: None)
+        self._on_display = on_display or (lambda: None)
+        self._ticker = DeadlineTicker(clock)
+        self._remaining: float = 0
+        self._total_seconds: float = 0
+        self._phase: str = WORK
+        self._selected_mode: str = WORK
+        self._running = False
+
+    # --- state ---
+
+    @property
+    def phase(self) -> str:
+        return self._phase
+
+    @property
+    def selected_mode(self) -> str:
+        return self._selected_mode
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def remaining(self) -> float:
+        """Fractional seconds left in the current phase."""
+        if self._running:
+            return self._ticker.remaining()
+        return self._remaining
+
+    @property
+    def deadline(self) -> float | None:
+        """Clock value at which the running phase ends (None when stopped)."""
+        return self._ticker.deadline
+
+    @property
+    def display_text(self) -> str:
+        return format_mmss(self.remaining)
+
+    @property
+    def progress(self) -> float:
+        """Percent of the phase still left (100 right after start)."""
+        if self._total_seconds <= 0:
+            return 0.0
+        return 100.0 * self.remaining / self._total_seconds
+
+    @property
+    def stats(self) -> TickStats:
+        return self._ticker.stats
+
+    def _duration(self, mode: str) -> int:
+        cfg = self._get_config()
+        if mode == WORK:
+            return int(cfg["work_minutes"]) * 60
+        return int(cfg["break_minutes"]) * 60
+
+    def _load_phase(self, mode: str) -> None:
+        """Selected mode and phase = mode, full duration. Pre: not running."""
+        self._selected_mode = mode
+        self._phase = mode
+        self._remaining = self._duration(mode)
+        self._total_seconds = self._remaining
+
+    # --- commands ---
+
+    def select_mode(self, mode: str) -> None:
+        """Switch Pomodoro/Break tab. Ignored while running."""
+        if self._running:
+            return
+        self._load_phase(mode)
+        self._on_display()
+        self._on_phase(self._phase)
+
+    def refresh(self) -> None:
+        """Apply current work/break settings to the stopped timer."""
+        if self._running:
+            return
+        self._load_phase(self._selected_mode)
+        self._on_phase(self._phase)
+        self._on_display()
+
+    def reset_to_work(self) -> None:
+        if self._running:
+            self.pause()
+        self._load_phase(WORK)
+        self._on_phase(self._phase)
+        self._on_display()
+
+    def start_break(self) -> None:
+        """Switch to break mode with full duration (e.g. after work finishes)."""
+        if self._running:
+            self.pause()
+        self._load_phase(BREAK)
+        self._on_phase(BREAK)
+        self._on_display()
+
+    def start(self) -> None:
+        """Start or resume. Post: running; next_delay_ms() gives the first wakeup."""
+        if self._running:
+            return
+        if self._remaining <= 0:
+            self._load_phase(self._selected_mode)
+            self._on_phase(self._phase)
+        # _total_seconds stays the phase length: a resume continues the progress bar.
+        self._running = True
+        self._ticker.start(self._remaining)
+        self._on_display()
+        self._on_run_state(True)
+
+    def pause(self) -> None:
+        if self._running:
+            # Keep the fractional second so resume does not lose or gain time.
+            self._remaining = self._ticker.stop()
+        self._running = False
+        self._on_display()
+        self._on_run_state(False)
+
+    def toggle(self) -> None:
+        if self._running:
+            self.pause()
+        else:
+            self.start()
+
+    def next_delay_ms(self) -> int:
+        """Delay until the clock face changes; schedule tick() after it."""
+        return self._ticker.next_delay_ms()
+
+    def deadline_delay_ms(self) -> int:
+        """Delay until the running phase ends; schedule tick() after it (hidden window)."""
+        return self._ticker.deadline_delay_ms()
+
+    def tick(self) -> bool:
+        """
+        Handle a scheduled wakeup. On finish: stop, report, switch to the other
+        mode with full duration. Returns True if the timer is still running.
+        """
+        if not self._running:
+            return False
+        self._ticker.on_wakeup()
+        if self._ticker.remaining() > 0:
+            self._on_display()
+            return True
+        self._ticker.finish()
+        self._remaining = 0
+        self._running = False
+        self._on_display()
+        self._on_run_state(False)
+        finished = self._phase
+        self._on_finish(finished)
+        # Switch to other mode with full duration so user can press Start
+        self._load_phase(BREAK if finished == WORK else WORK)
+        self._on_phase(self._phase)
+        self._on_display()
+        return False
+
+
+# [END SPEC:POMODORO-6:ENGINE]
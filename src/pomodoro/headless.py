@@ -0,0 +1,265 @@
+"""Terminal front end (--headless): one updating status line, keys on raw stdin, no tkinter."""
+# [START SPEC:POMODORO-27:HEADLESS]
+# req_refs: REQ-POMODORO-27-01, REQ-POMODORO-27-02, REQ-POMODORO-27-03
+
+import asyncio
+import os
+import sys
+from typing import Any, Callable, TextIO
+
+from pomodoro import config
+from pomodoro.audio import AudioPlayer, make_sinks
+from pomodoro.dispatch import PHASE_END, NotificationDispatcher, TimerEvent, make_channels
+from pomodoro.engine import BREAK, WORK, TimerEngine
+from pomodoro.instance import InstanceLock, InstanceServer, engine_state
+from pomodoro.scheduler import AsyncioBackend, TimerHandle, TimerScheduler
+from pomodoro.task_model import TaskList, TaskModel
+from pomodoro.view_model import ViewModel
+
+BAR_WIDTH = 20
+HELP = "пробел — старт/пауза, d — задача выполнена, q — выход"
+# Windows console has no selectable stdin: keys are polled this often.
+KEY_POLL_S = 0.05
+# Ctrl+C, Ctrl+D (cbreak mode still delivers SIGINT for Ctrl+C; this covers raw reads).
+_QUIT_KEYS = ("q", "Q", "\x03", "\x04")
+
+
+def render_line(engine: TimerEngine, task: str, width: int = BAR_WIDTH) -> str:
+    """'> Работа 24:59 [####----] task' ('||' when paused)."""
+    label = "Работа" if engine.phase == WORK else "Перерыв"
+    filled = min(width, max(0, round(engine.progress * width / 100.0)))
+    state = ">" if engine.running else "||"
+    line = f"{state} {label} {engine.display_text} [{'#' * filled}{'-' * (width - filled)}]"
+    return f"{line} {task}" if task else line
+
+
+class RawKeys:
+    """
+    Single key presses from stdin delivered to on_key on the asyncio loop.
+    POSIX: terminal in cbreak mode (restored on exit) and loop.add_reader;
+    end of input counts as "q". Windows: msvcrt polled every KEY_POLL_S.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, on_key: Callable[[str], None]) -> None:
+        self._loop = loop
+        self._on_key = on_key
+        self._fd = sys.stdin.fileno()
+        self._saved: Any = None
+        self._poll: asyncio.TimerHandle | None = None
+
+    def __enter__(self) -> "RawKeys":
+        if sys.platform == "win32":
+            self._poll = self._loop.call_later(KEY_POLL_S, self._poll_console)
+            return self
+        if os.isatty(self._fd):
+            import termios
+            import tty
+
+            self._saved = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+        self._loop.add_reader(self._fd, self._read)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._poll is not None:
+            self._poll.cancel()
+            return
+        if sys.platform != "win32":
+            import termios
+
+            self._loop.remove_reader(self._fd)
+            if self._saved is not None:
+                termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+
+    def _read(self) -> None:
+        data = os.read(self._fd, 64)
+        if not data:
+            self._loop.remove_reader(self._fd)
+            self._on_key("q")
+            return
+        for ch in data.decode("utf-8", "replace"):
+            self._on_key(ch)
+
+    def _poll_console(self) -> None:
+        import msvcrt
+
+        while msvcrt.kbhit():
+            self._on_key(msvcrt.getwch())
+        self._poll = self._loop.call_later(KEY_POLL_S, self._poll_console)
+
+
+class HeadlessApp:
+    """
+    TimerEngine on a TimerScheduler over asyncio, the active task from the
+    same config/tasks files as the overlay, a status line redrawn only when it
+    changes. Phase ends go through the notification dispatcher: sound and the
+    configured desktop/hook/webhook channels; "flash" rings the terminal bell
+    (tmux marks the window).
+    """
+
+    def __init__(
+        self,
+        cfg: dict,
+        out: TextIO | None = None,
+        lock: InstanceLock | None = None,
+        command: tuple[str, str] | None = None,
+    ) -> None:
+        self._cfg = cfg
+        self._lock = lock
+        self._command = command
+        self._out = out or sys.stdout
+        self._model = TaskModel(TaskList.coerce(cfg.get("tasks")))
+        self._view = ViewModel()
+        self._tick_handle: TimerHandle | None = None
+        self._done: asyncio.Event | None = None
+
+    # --- output ---
+
+    def _write_line(self, line: str) -> None:
+        # \r + erase to end of line: the status stays on one terminal line (never wraps).
+        import shutil
+
+        columns = shutil.get_terminal_size().columns
+        self._out.write("\r" + line[: max(1, columns - 1)] + "\x1b[K")
+        self._out.flush()
+
+    def _render(self) -> None:
+        line = render_line(self._engine, self._model.active_text())
+        self._view.push("line", line, self._write_line)
+
+    def _bell(self) -> None:
+        self._out.write("\a")
+        self._out.flush()
+
+    # --- timer ---
+
+    def _arm(self) -> None:
+        self._disarm()
+        delay_ms = self._engine.next_delay_ms()
+        self._tick_handle = self._scheduler.add(delay_ms / 1000.0, self._tick, name="clock")
+
+    def _disarm(self) -> None:
+        if self._tick_handle is not None:
+            self._scheduler.cancel(self._tick_handle)
+            self._tick_handle = None
+
+    def _tick(self) -> None:
+        self._tick_handle = None
+        if self._engine.tick():
+            self._arm()
+
+    def _on_run_state(self, running: bool) -> None:
+        if running:
+            self._arm()
+        else:
+            self._disarm()
+
+    def _on_finish(self, phase: str) -> None:
+        task = "" if phase == BREAK else self._model.active_text()
+        self._notifier.publish(TimerEvent(PHASE_END, phase, task))
+        key = "break_minutes" if phase == BREAK else "work_minutes"
+        config.record_session(self._cfg, phase, 60 * int(self._cfg.get(key, 0)), task)
+
+    # --- keys ---
+
+    def _on_key(self, key: str) -> None:
+        if key == " ":
+            self._engine.toggle()
+        elif key in ("d", "D", "в", "В"):
+            self._complete_active()
+        elif key in _QUIT_KEYS or key in ("й", "Й"):
+            if self._done is not None:
+                self._done.set()
+
+    def _complete_active(self) -> None:
+        """Tick off the active task and save tasks like the overlay does."""
+        idx = self._model.active_index
+        if idx is None:
+            return
+        self._model.set_done(idx, True)
+        self._cfg["tasks"] = self._model.tasks
+        self._cfg["active_task_index"] = self._model.active_index
+        config.save_config(self._cfg)
+        self._render()
+
+    # [START SPEC:POMODORO-29:HEADLESS_COMMANDS]
+    # req_refs: REQ-POMODORO-29-02
+    def handle_command(self, name: str, text: str) -> dict[str, Any]:
+        """Loop thread: a command forwarded by a later launch (show only redraws)."""
+        if name == "start":
+            self._engine.start()
+        elif name == "pause":
+            self._engine.pause()
+        elif name == "toggle":
+            self._engine.toggle()
+        elif name == "add-task":
+            line = " ".join(text.split())
+            if line:
+                self._model.replace_lines(self._model.total, 0, [line])
+                self._cfg["tasks"] = self._model.tasks
+                self._cfg["active_task_index"] = self._model.active_index
+                config.save_config(self._cfg)
+                self._render()
+        return engine_state(self._engine)
+
+    # [END SPEC:POMODORO-29:HEADLESS_COMMANDS]
+
+    # --- run ---
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._done = asyncio.Event()
+        # Sound loads on the first phase end (no preload: keeps startup and RSS small).
+        audio = AudioPlayer(make_sinks(self._cfg.get("audio_sink", "auto")))
+        self._notifier = NotificationDispatcher(
+            make_channels(
+                self._cfg, sound=audio.play, flash=lambda: loop.call_soon_threadsafe(self._bell)
+            )
+        )
+        self._scheduler = TimerScheduler(AsyncioBackend(loop))
+        self._engine = TimerEngine(
+            lambda: self._cfg,
+            on_finish=self._on_finish,
+            on_run_state_changed=self._on_run_state,
+            on_display=self._render,
+        )
+        self._out.write(HELP + "\n")
+        self._engine.reset_to_work()
+        server: InstanceServer | None = None
+        if self._lock is not None:
+            server = InstanceServer(
+                config.get_base_dir(), self.handle_command, loop.call_soon_threadsafe
+            )
+            try:
+                server.start()
+            except OSError:
+                server = None
+        if self._command is not None:
+            self.handle_command(*self._command)
+        try:
+            with RawKeys(loop, self._on_key):
+                await self._done.wait()
+        finally:
+            if server is not None:
+                server.close()
+            if self._lock is not None:
+                self._lock.release()
+            self._disarm()
+            self._notifier.close()
+            audio.close()
+            self._out.write("\n")
+            self._out.flush()
+
+
+def run_headless(
+    lock: InstanceLock | None = None, command: tuple[str, str] | None = None
+) -> None:
+    """Entry point of python -m pomodoro --headless (lock/command: see main.main)."""
+    cfg = config.load_config()
+    try:
+        asyncio.run(HeadlessApp(cfg, lock=lock, command=command).run())
+    except KeyboardInterrupt:
+        pass
+
+
+# [END SPEC:POMODORO-27:HEADLESS]
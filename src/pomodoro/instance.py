@@ -0,0 +1,316 @@
+"""Single instance: a lock plus a local socket (named pipe on Windows) that takes commands."""
+# [START SPEC:POMODORO-29:INSTANCE]
+# req_refs: REQ-POMODORO-29-01, REQ-POMODORO-29-02
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from pomodoro.engine import TimerEngine
+from pomodoro.profiling import Histogram
+
+# Commands a later launch forwards: python -m pomodoro [command [text]].
+COMMANDS = ("show", "start", "pause", "toggle", "add-task")
+DEFAULT_COMMAND = "show"
+# The lock is taken before Tk starts, the listener only after the first paint:
+# a launch in between keeps retrying the connection this long.
+CONNECT_WAIT_S = 3.0
+CONNECT_RETRY_S = 0.02
+REPLY_TIMEOUT_S = 5.0
+MAX_REQUEST = 64 * 1024
+
+
+def _key(base: Path) -> str:
+    """Instances are per data directory: the config.json/tasks.txt they would share."""
+    import hashlib
+
+    return hashlib.sha1(str(base.resolve()).encode("utf-8")).hexdigest()[:12]
+
+
+def runtime_dir() -> Path:
+    """
+    Per-user directory for the lock and socket: XDG_RUNTIME_DIR, else
+    <temp>/pomodoro-<uid> (mode 0700). OSError if it belongs to someone else.
+    """
+    xdg = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg and os.path.isdir(xdg):
+        return Path(xdg)
+    import tempfile
+
+    if sys.platform == "win32":
+        return Path(tempfile.gettempdir())
+    path = Path(tempfile.gettempdir()) / f"pomodoro-{os.getuid()}"
+    path.mkdir(mode=0o700, exist_ok=True)
+    if path.stat().st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user")
+    return path
+
+
+def address(base: Path) -> str:
+    """Socket path (named pipe name on Windows) of the instance for base."""
+    if sys.platform == "win32":
+        user = os.environ.get("USERNAME", "user")
+        return rf"\\.\pipe\pomodoro-{user}-{_key(base)}"
+    return str(runtime_dir() / f"pomodoro-{_key(base)}.sock")
+
+
+class InstanceLock:
+    """
+    Exclusive lock on <runtime dir>/pomodoro-<key>.lock held by the running
+    instance. The OS drops it when the process exits or crashes, so a stale
+    lock never blocks the next launch.
+    """
+
+    def __init__(self, base: Path) -> None:
+        self.path = runtime_dir() / f"pomodoro-{_key(base)}.lock"
+        self._fd: int | None = None
+
+    def acquire(self) -> bool:
+        """True if this process is now the instance, False if another one holds it."""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)  # closing the descriptor drops the lock
+            self._fd = None
+
+
+# --- transport: one JSON line per request and per reply ---
+
+
+class _SocketConn:
+    """AF_UNIX stream socket."""
+
+    def __init__(self, sock: Any) -> None:
+        self._sock = sock
+        self._file = sock.makefile("rb")
+
+    def send(self, data: bytes) -> None:
+        self._sock.sendall(data + b"\n")
+
+    def recv(self) -> bytes:
+        return self._file.readline(MAX_REQUEST)
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+
+class _PipeConn:
+    """Windows named pipe (multiprocessing.connection, message framed)."""
+
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+
+    def send(self, data: bytes) -> None:
+        self._conn.send_bytes(data)
+
+    def recv(self) -> bytes:
+        if not self._conn.poll(REPLY_TIMEOUT_S):
+            raise TimeoutError("no data")
+        return self._conn.recv_bytes(MAX_REQUEST)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _connect(addr: str) -> "_SocketConn | _PipeConn":
+    if sys.platform == "win32":
+        from multiprocessing.connection import Client
+
+        return _PipeConn(Client(addr, family="AF_PIPE"))
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(REPLY_TIMEOUT_S)
+    try:
+        sock.connect(addr)
+    except OSError:
+        sock.close()
+        raise
+    return _SocketConn(sock)
+
+
+def forward(
+    base: Path, command: str, text: str = "", wait_s: float = CONNECT_WAIT_S
+) -> dict[str, Any]:
+    """
+    Send one command to the running instance and return its reply:
+    {"ok": True, "state": {...}} or {"ok": False, "error": "..."}.
+    OSError if no instance answers within wait_s.
+    """
+    addr = address(base)
+    deadline = time.monotonic() + wait_s
+    while True:
+        try:
+            conn = _connect(addr)
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(CONNECT_RETRY_S)
+    try:
+        conn.send(json.dumps({"cmd": command, "arg": text}, ensure_ascii=False).encode("utf-8"))
+        data = conn.recv()
+    finally:
+        conn.close()
+    if not data:
+        raise ConnectionError("instance closed the connection without a reply")
+    return json.loads(data)
+
+
+def engine_state(engine: TimerEngine) -> dict[str, Any]:
+    """The reply to a forwarded command: phase, shown time, running."""
+    return {"phase": engine.phase, "time": engine.display_text, "running": engine.running}
+
+
+def format_state(state: dict[str, Any]) -> str:
+    """'work 24:13 running' — what a forwarding launch prints."""
+    run = "running" if state.get("running") else "paused"
+    return f"{state.get('phase', '')} {state.get('time', '')} {run}".strip()
+
+
+class InstanceServer:
+    """
+    Listener of the running instance, on its own daemon thread. Each
+    connection carries one request {"cmd", "arg"}; handler(cmd, arg) runs on
+    the UI thread through `post` (root.after_idle, loop.call_soon_threadsafe)
+    and the state dict it returns is the reply. stats(): requests, errors
+    and how long a request waited for the UI thread.
+    """
+
+    def __init__(
+        self,
+        base: Path,
+        handler: Callable[[str, str], dict[str, Any]],
+        post: Callable[[Callable[[], None]], Any],
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._base = base
+        self._handler = handler
+        self._post = post
+        self._clock = clock
+        self._address = ""
+        self._listener: Any = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.requests = 0
+        self.errors = 0
+        self.ui_wait = Histogram()
+
+    def start(self) -> None:
+        """Bind the socket / pipe (the caller holds the InstanceLock) and start accepting."""
+        self._address = address(self._base)
+        if sys.platform == "win32":
+            from multiprocessing.connection import Listener
+
+            self._listener = Listener(self._address, family="AF_PIPE")
+        else:
+            import socket
+
+            try:
+                os.unlink(self._address)  # left behind by an instance that crashed
+            except FileNotFoundError:
+                pass
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(self._address)
+            sock.listen(8)
+            self._listener = sock
+        self._thread = threading.Thread(
+            target=self._run, name="pomodoro-instance", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._listener is None or self._closed:
+            return
+        self._closed = True
+        try:
+            _connect(self._address).close()  # wake the blocking accept()
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._listener.close()
+        if sys.platform != "win32":
+            try:
+                os.unlink(self._address)
+            except OSError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        return {"requests": self.requests, "errors": self.errors, "ui_wait": self.ui_wait.as_dict()}
+
+    def _accept(self) -> "_SocketConn | _PipeConn":
+        if sys.platform == "win32":
+            return _PipeConn(self._listener.accept())
+        sock, _ = self._listener.accept()
+        sock.settimeout(REPLY_TIMEOUT_S)
+        return _SocketConn(sock)
+
+    def _run(self) -> None:
+        while not self._closed:
+            try:
+                conn = self._accept()
+            except OSError:
+                if self._closed:
+                    return
+                continue
+            try:
+                if not self._closed:
+                    reply = self._serve(conn.recv())
+                    conn.send(json.dumps(reply, ensure_ascii=False).encode("utf-8"))
+            except (OSError, ValueError):
+                self.errors += 1
+            finally:
+                conn.close()
+
+    def _serve(self, data: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(data)
+            command, text = request["cmd"], str(request.get("arg", ""))
+        except (ValueError, KeyError, TypeError):
+            self.errors += 1
+            return {"ok": False, "error": "malformed request"}
+        if command not in COMMANDS:
+            self.errors += 1
+            return {"ok": False, "error": f"unknown command: {command}"}
+        self.requests += 1
+        queued = self._clock()
+        done = threading.Event()
+        reply: dict[str, Any] = {}
+
+        def run() -> None:
+            self.ui_wait.record((self._clock() - queued) * 1000.0)
+            try:
+                reply.update(ok=True, state=self._handler(command, text))
+            except Exception as e:  # reported to the caller, never raised into the UI loop
+                reply.update(ok=False, error=f"{type(e).__name__}: {e}")
+            done.set()
+
+        self._post(run)
+        if not done.wait(REPLY_TIMEOUT_S):
+            self.errors += 1
+            return {"ok": False, "error": "instance did not respond in time"}
+        return dict(reply)
+
+
+# [END SPEC:POMODORO-29:INSTANCE]
@@ -4,77 +4,144 @@
 # req_refs: REQ-POMODORO-2-01, REQ-POMODORO-2-03, REQ-POMODORO-2-04, REQ-POMODORO-2-05
 
 import tkinter as tk
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pomodoro import config
-from pomodoro.ui.theme import theme_colors
+from pomodoro.coalesce import Coalescer
+from pomodoro.persist import ConfigWriter
+from pomodoro.profiling import ProfiledBackend, Profiler, StartupTimer
+from pomodoro.scheduler import TimerScheduler, TkBackend
+from pomodoro.view_model import ViewModel
+from pomodoro.worker import BackgroundWorker
+from pomodoro.ui.theme import ThemeEngine, load_palettes
 from pomodoro.ui.timer import TimerWidget, BREAK
-from pomodoro.ui.window import set_alpha, setup_overlay
-from pomodoro.ui.notify import notify_timer_end
-from pomodoro.ui.tasks import TasksWidget
-from pomodoro.ui.settings import SettingsWidget
+from pomodoro.ui.window import set_alpha, setup_overlay, tk_object_counts, track_visibility
+
+# Task editor, settings, sound and notification channels are imported when the
+# panel is built, after the clock is on screen [REQ-POMODORO-28-01].
+if TYPE_CHECKING:
+    from pomodoro.audio import AudioPlayer
+    from pomodoro.dispatch import NotificationDispatcher
+    from pomodoro.instance import InstanceLock, InstanceServer
+    from pomodoro.memprofile import MemoryProfiler
+    from pomodoro.ui.settings import SettingsWidget
+    from pomodoro.ui.tasks import TasksWidget
 
 COMPACT_GEOMETRY = "280x220"
 FULL_GEOMETRY = "360x680"
+# Panel is built after the first paint; this is the fallback if no <Expose> arrives.
+PANEL_FALLBACK_MS = 500
 
 
-def apply_theme(
-    root: tk.Tk,
-    content: tk.Frame,
-    top_section: tk.Frame,
-    active_label: tk.Label,
-    full_section: tk.Frame,
-    timer_widget: TimerWidget,
-    tasks_widget: TasksWidget,
-    settings_widget: SettingsWidget,
-    theme: str,
+# [START SPEC:POMODORO-22:MAIN_PROFILE]
+# req_refs: REQ-POMODORO-22-01
+# Hot paths timed by --profile: (module, class, method, report name). Modules are
+# named, not imported: the task editor module loads only with --profile or the panel.
+PROFILED_METHODS = (
+    ("pomodoro.ui.timer", "TimerWidget", "_tick", "_tick"),
+    ("pomodoro.ui.tasks", "TasksWidget", "_on_edit", "_on_edit"),
+    ("pomodoro.ui.tasks", "TasksWidget", "_flush_update", "_flush_update"),
+    ("pomodoro.ui.tasks", "TasksWidget", "_sync_to_config", "_sync_to_config"),
+    ("pomodoro.ui.theme", "ThemeEngine", "switch", "apply_theme"),
+    ("pomodoro.persist", "ConfigWriter", "request", "save_request"),
+    ("pomodoro.persist", "ConfigWriter", "_write", "save_config"),
+)
+
+
+def _instrument(profiler: Profiler) -> None:
+    """Wrap the hot-path methods at class level, before any widget binds them."""
+    import importlib
+
+    for module, cls, attr, name in PROFILED_METHODS:
+        profiler.patch(getattr(importlib.import_module(module), cls), attr, name)
+
+
+# [END SPEC:POMODORO-22:MAIN_PROFILE]
+
+
+def _flash(root: tk.Tk) -> None:
+    """Taskbar flash / urgency hint; ui.notify (and ctypes) load on the first phase end."""
+    from pomodoro.ui.notify import flash_window
+
+    flash_window(root)
+
+
+def main(
+    profile: str | None = None,
+    memprofile: str | None = None,
+    startup: StartupTimer | None = None,
+    lock: "InstanceLock | None" = None,
+    command: tuple[str, str] | None = None,
 ) -> None:
-    colors = theme_colors(theme)
-    bg = str(colors.get("bg", "#f0f0f0"))
-    fg = str(colors.get("fg", "#1a1a1a"))
-    root.configure(bg=bg)
-    content["bg"] = bg
-    top_section["bg"] = bg
-    active_label["bg"] = bg
-    active_label["fg"] = fg
-    if active_label.master:
-        active_label.master["bg"] = bg
-    for w in top_section.winfo_children():
-        try:
-            w["bg"] = bg
-        except tk.TclError:
-            pass
-        for c in w.winfo_children():
-            try:
-                c["bg"] = bg
-            except tk.TclError:
-                pass
-            if isinstance(c, tk.Label):
-                try:
-                    c["fg"] = fg
-                except tk.TclError:
-                    pass
-    full_section["bg"] = bg
-    timer_widget.apply_theme(colors)
-    tasks_widget.apply_theme(colors)
-    settings_widget.apply_theme(colors)
-
-
-def main() -> None:
-    """Launch overlay window and run mainloop."""
-    cfg = config.load_config()
+    """
+    Launch overlay window and run mainloop. profile: path of a JSON/CSV report
+    of handler latencies and after() lag written on exit (None = no profiling).
+    memprofile: path of a JSON report of tracemalloc snapshots and Tk object
+    counts taken every SNAPSHOT_INTERVAL seconds (None = no memory profiling).
+    startup: --startup-bench; marks the startup path, prints the report as
+    JSON once the panel is built and closes the overlay.
+    lock: held single-instance lock; later launches then forward their
+    commands here. command: (command, text) to run once the panel is built.
+    """
+    profiler: Profiler | None = None
+    if profile:
+        profiler = Profiler()
+        _instrument(profiler)
+    # Settings snapshot only: tasks are read when the panel is built. [REQ-POMODORO-28-02]
+    cfg = config.load_settings()
     root = tk.Tk()
+    if startup is not None:
+        startup.mark("tk")
+
+    # Write-behind: handlers only mark config dirty; writes are coalesced.
+    writer = ConfigWriter(delay=cfg.get("save_delay_ms", 500) / 1000.0)
 
     def save() -> None:
-        config.save_config(cfg)
+        writer.request(cfg)
+
+    # Parsing that cannot be done incrementally runs here; results come back via after_idle.
+    worker = BackgroundWorker(lambda fn: root.after_idle(fn))
+
+    # Bursts of edit events run their handlers once per idle cycle (or frame).
+    coalesce_ms = int(cfg.get("coalesce_ms", 0))
+    if coalesce_ms > 0:
+        coalescer = Coalescer(lambda fn: root.after(coalesce_ms, fn))
+    else:
+        coalescer = Coalescer(lambda fn: root.after_idle(fn))
+
+    # Built with the panel, after the first paint (see build_panel below).
+    audio: "AudioPlayer | None" = None
+    notifier: "NotificationDispatcher | None" = None
+    tasks_widget: "TasksWidget | None" = None
+    settings_widget: "SettingsWidget | None" = None
+    server: "InstanceServer | None" = None
 
     def on_close() -> None:
-        tasks_widget.sync_to_config()
-        save()
-        root.destroy()
+        if server is not None:
+            server.close()
+        try:
+            coalescer.flush()
+        finally:
+            # A raising update must not cost the tasks save or the rest of shutdown.
+            if tasks_widget is not None:
+                tasks_widget.sync_to_config()
+            worker.close()
+            writer.close()
+            if notifier is not None:
+                notifier.close()
+            if audio is not None:
+                audio.close()
+            root.destroy()
 
     setup_overlay(root, cfg.get("alpha", 0.85), on_close=on_close)
     root.geometry(FULL_GEOMETRY)
-    root.configure(bg=str(theme_colors(cfg.get("theme", "light")).get("bg", "#f0f0f0")))
+
+    # Widgets register once by role; a switch reconfigures only changed options.
+    theme = ThemeEngine(
+        load_palettes(), cfg.get("theme", "light"), post=lambda fn: root.after_idle(fn)
+    )
+    theme.register(root, "surface")
 
     content = tk.Frame(root, padx=0, pady=0)
     content.pack(fill=tk.BOTH, expand=True)
@@ -105,7 +172,14 @@ def main() -> None:
     timer_widget: TimerWidget | None = None
 
     def on_timer_finish(phase: str) -> None:
-        notify_timer_end(root)
+        key = "break_minutes" if phase == BREAK else "work_minutes"
+        task = "" if phase == BREAK or tasks_widget is None else tasks_widget.get_active_text()
+        if notifier is not None:
+            from pomodoro.dispatch import PHASE_END, TimerEvent
+
+            notifier.publish(TimerEvent(PHASE_END, phase, task))
+        # Session history (SQLite storage only) [REQ-POMODORO-15-03]
+        config.record_session(cfg, phase, 60 * int(cfg.get(key, 0)), task)
         # Timer already switched to other mode with full duration in _tick()
 
     def _geometry_anchor_bottom(geom: str) -> None:
@@ -136,18 +210,29 @@ def main() -> None:
         else:
             if timer_widget is not None:
                 timer_widget.set_compact(False)
+            build_panel()  # first expansion builds the panel if it is not there yet
             full_section.pack(fill=tk.BOTH, expand=True)
             active_label["wraplength"] = _full_width - 16
             _geometry_anchor_bottom(FULL_GEOMETRY)
 
-    tasks_ref: list[TasksWidget | None] = [None]
+    # Widget options are pushed to Tk only when the rendered value changes.
+    view = ViewModel()
+
+    def show_active(text: str) -> None:
+        active_label["text"] = text
 
     def on_phase_changed(_phase: str) -> None:
         if _phase == BREAK:
-            active_label["text"] = "Перерыв"
+            view.push("active.text", "Перерыв", show_active)
         else:
-            w = tasks_ref[0]
-            active_label["text"] = (w.get_active_text() or "") if w else ""
+            w = tasks_widget
+            view.push("active.text", (w.get_active_text() or "") if w else "", show_active)
+
+    # One heap-based scheduler arms a single after() for every timer in the app.
+    backend: TkBackend | ProfiledBackend = TkBackend(root)
+    if profiler is not None:
+        backend = profiler.backend(backend)  # records scheduled vs actual after() firing
+    scheduler = TimerScheduler(backend)
 
     timer_widget = TimerWidget(
         top_section,
@@ -155,43 +240,31 @@ def main() -> None:
         on_finish=on_timer_finish,
         on_run_state_changed=on_run_state_changed,
         on_phase_changed=on_phase_changed,
+        scheduler=scheduler,
+        view=view,
     )
 
+    # Withdrawn, iconified or covered: one wakeup per phase instead of one per second.
+    track_visibility(root, timer_widget.set_hidden)
+
     full_section = tk.Frame(content)
     full_section.pack(fill=tk.BOTH, expand=True)
 
-    def on_active_changed() -> None:
+    def relabel_active() -> None:
         if timer_widget is not None and timer_widget.get_phase() == BREAK:
-            active_label["text"] = "Перерыв"
+            view.push("active.text", "Перерыв", show_active)
         else:
-            t = tasks_widget.get_active_text()
-            active_label["text"] = t if t else ""
+            t = tasks_widget.get_active_text() if tasks_widget is not None else ""
+            view.push("active.text", t if t else "", show_active)
 
-    tasks_widget = TasksWidget(full_section, cfg, save, on_active_changed)
-    tasks_ref[0] = tasks_widget
-    on_active_changed()
+    def on_active_changed() -> None:
+        coalescer.schedule("active-label", relabel_active)
 
     def set_alpha_cb(a: float) -> None:
         set_alpha(root, a)
 
     def on_theme_changed() -> None:
-        theme = cfg.get("theme", "light")
-        apply_theme(
-            root,
-            content,
-            top_section,
-            active_label,
-            full_section,
-            timer_widget,
-            tasks_widget,
-            settings_widget,
-            theme,
-        )
-        colors = theme_colors(theme)
-        active_label["bg"] = str(colors.get("bg", "#f0f0f0"))
-        active_label["fg"] = str(colors.get("fg", "#1a1a1a"))
-        if active_label.master:
-            active_label.master["bg"] = str(colors.get("bg", "#f0f0f0"))
+        theme.switch(cfg.get("theme", "light"))
 
     def on_work_break_changed() -> None:
         """Apply new work/break minutes to timer display when not running."""
@@ -202,19 +275,140 @@ def main() -> None:
         if timer_widget is not None:
             timer_widget.set_selected_mode(mode)
 
-    settings_widget = SettingsWidget(
-        full_section,
-        cfg,
-        save,
-        set_alpha_cb,
-        on_theme_changed=on_theme_changed,
-        on_work_break_changed=on_work_break_changed,
-        on_select_mode=on_select_mode,
-    )
+    # [START SPEC:POMODORO-28:DEFERRED_PANEL]
+    # req_refs: REQ-POMODORO-28-01, REQ-POMODORO-28-02
+    def build_panel() -> None:
+        """
+        Tasks, task editor, settings, sound and notification channels; once,
+        after the clock is painted (or on the first expansion if earlier).
+        """
+        nonlocal audio, notifier, tasks_widget, settings_widget, server
+        if tasks_widget is not None:
+            return
+        from pomodoro.audio import AudioPlayer, make_sinks
+        from pomodoro.dispatch import NotificationDispatcher, make_channels
+        from pomodoro.ui.settings import SettingsWidget
+        from pomodoro.ui.tasks import TasksWidget
+
+        # Tasks join the settings snapshot; pomodoro.db may replace its settings.
+        config.load_tasks_into(cfg)
+        if cfg.get("storage") == "sqlite":
+            set_alpha(root, cfg.get("alpha", 0.85))
+            theme.switch(cfg.get("theme", "light"))
+            if timer_widget is not None:
+                timer_widget.refresh_display()
+
+        # Sound resolved, decoded and its sink prepared on the audio thread.
+        audio = AudioPlayer(
+            make_sinks(cfg.get("audio_sink", "auto")),
+            latency=profiler.histogram("notify_latency") if profiler is not None else None,
+        )
+        audio.preload()
+        # Sound, flash and the optional desktop/hook/webhook channels, each on its own
+        # bounded queue: a slow channel never holds up the Tk loop. [REQ-POMODORO-26-01]
+        notifier = NotificationDispatcher(
+            make_channels(cfg, sound=audio.play, flash=lambda: root.after_idle(_flash, root)),
+            histogram=profiler.histogram if profiler is not None else None,
+        )
+
+        # Large task files are parsed in the background; prime the writer afterwards.
+        tasks_widget = TasksWidget(
+            full_section,
+            cfg,
+            save,
+            on_active_changed,
+            on_loaded=lambda: writer.prime(cfg),
+            worker=worker,
+            coalescer=coalescer,
+        )
+        relabel_active()
+        settings_widget = SettingsWidget(
+            full_section,
+            cfg,
+            save,
+            set_alpha_cb,
+            on_theme_changed=on_theme_changed,
+            on_work_break_changed=on_work_break_changed,
+            on_select_mode=on_select_mode,
+            coalescer=coalescer,
+            themes=theme.names,
+        )
+        tasks_widget.register_theme(theme)
+        settings_widget.register_theme(theme)
+        if lock is not None:
+            from pomodoro.instance import InstanceServer
+
+            # Later launches connect here instead of starting a second overlay.
+            server = InstanceServer(
+                config.get_base_dir(), handle_command, lambda fn: root.after_idle(fn)
+            )
+            try:
+                server.start()
+            except OSError:
+                server = None
+        if command is not None:
+            cmd = command  # bound: the narrowing of `command` does not reach into the lambda
+            root.after_idle(lambda: handle_command(*cmd))
+        if startup is not None:
+            startup.mark("panel")
+            root.after_idle(report_startup)
+
+    # [START SPEC:POMODORO-29:MAIN_COMMANDS]
+    # req_refs: REQ-POMODORO-29-02
+    def handle_command(name: str, text: str) -> dict[str, object]:
+        """UI thread: a command forwarded by a later launch (or given to this one)."""
+        from pomodoro.instance import engine_state
+
+        build_panel()
+        if timer_widget is None or tasks_widget is None:
+            return {}
+        if name == "start":
+            timer_widget.start()
+        elif name == "pause":
+            timer_widget.pause()
+        elif name == "toggle":
+            if timer_widget.is_running():
+                timer_widget.pause()
+            else:
+                timer_widget.start()
+        elif name == "add-task":
+            tasks_widget.add_task(text)
+        elif name == "show":
+            root.deiconify()
+            root.lift()
+            root.focus_force()
+        return engine_state(timer_widget.engine)
+
+    # [END SPEC:POMODORO-29:MAIN_COMMANDS]
+
+    def report_startup() -> None:
+        import json
+
+        if startup is not None:
+            print(json.dumps(startup.report()), flush=True)
+        on_close()
+
+    def on_first_expose(_event: tk.Event) -> None:
+        # Tk redraws in idle callbacks queued by the Expose; this one runs after them.
+        root.unbind("<Expose>", expose_binding)
+        root.after_idle(after_first_paint)
+
+    def after_first_paint() -> None:
+        if startup is not None:
+            startup.mark("first_paint")
+        root.after(0, build_panel)  # back through the event loop: the clock is flushed first
+
+    # <Expose> of any child reaches the toplevel's binding (its bind tag).
+    expose_binding = root.bind("<Expose>", on_first_expose, add="+")
+    root.after(PANEL_FALLBACK_MS, build_panel)
+    # [END SPEC:POMODORO-28:DEFERRED_PANEL]
 
     def _on_root_click(event: tk.Event) -> None:
         """Move focus to root when clicking outside entries and tasks (saves values)."""
         w = event.widget
+        if settings_widget is None or tasks_widget is None:
+            root.focus_set()
+            return
         try:
             if (
                 w != settings_widget._work_entry
@@ -230,11 +424,14 @@ def main() -> None:
     # [START SPEC:POMODORO-3:HOTKEYS]
     # req_refs: REQ-POMODORO-3-01 — only Space for Start/Pause; no R reset
     def _on_hotkey(event: tk.Event) -> None:
-        if tasks_widget.contains_focus(root):
+        if tasks_widget is not None and tasks_widget.contains_focus(root):
             return
         try:
             w = root.focus_get()
-            if w in (settings_widget._work_entry, settings_widget._break_entry):
+            if settings_widget is not None and w in (
+                settings_widget._work_entry,
+                settings_widget._break_entry,
+            ):
                 return
         except (AttributeError, tk.TclError):
             pass
@@ -248,11 +445,52 @@ def main() -> None:
                 timer_widget.start()
 
     # [END SPEC:POMODORO-3:HOTKEYS]
-    root.bind_all("<KeyPress>", _on_hotkey)
-
-    on_theme_changed()
-
-    root.mainloop()
+    if profiler is not None:
+        root.bind_all("<KeyPress>", profiler.wrap("_on_hotkey", _on_hotkey))
+    else:
+        root.bind_all("<KeyPress>", _on_hotkey)
+
+    # [START SPEC:POMODORO-18:MAIN_THEME]
+    # req_refs: REQ-POMODORO-18-01
+    for w in (content, top_section, header_row, active_frame, full_section):
+        theme.register(w, "surface")
+    theme.register(active_label, "label")
+    timer_widget.register_theme(theme)
+    # [END SPEC:POMODORO-18:MAIN_THEME]
+    if startup is not None:
+        startup.mark("clock")
+
+    # [START SPEC:POMODORO-23:MAIN_MEMPROFILE]
+    # req_refs: REQ-POMODORO-23-01, REQ-POMODORO-23-02
+    mem_profiler: "MemoryProfiler | None" = None
+    if memprofile:
+        from pomodoro.memprofile import SNAPSHOT_INTERVAL, MemoryProfiler
+
+        mem = mem_profiler = MemoryProfiler(
+            counters=lambda: {
+                **tk_object_counts(root),
+                "undo_bytes": tasks_widget.undo_stats()["bytes"] if tasks_widget else 0,
+            }
+        )
+        mem.start()
+
+        def take_snapshot() -> None:
+            mem.snapshot("periodic")
+            scheduler.add(SNAPSHOT_INTERVAL, take_snapshot, name="memprofile")
+
+        scheduler.add(SNAPSHOT_INTERVAL, take_snapshot, name="memprofile")
+    # [END SPEC:POMODORO-23:MAIN_MEMPROFILE]
+
+    try:
+        root.mainloop()
+    finally:
+        if lock is not None:
+            lock.release()
+        if profiler is not None and profile:
+            profiler.dump(Path(profile))
+        if mem_profiler is not None and memprofile:
+            mem_profiler.stop()
+            mem_profiler.dump(Path(memprofile))
 
 
 # [END SPEC:POMODORO-1:MAIN]
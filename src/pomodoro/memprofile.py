@@ -0,0 +1,268 @@
+"""Memory profiling (--memprofile): periodic tracemalloc snapshots, growth diffs, headless soak."""
+# [START SPEC:POMODORO-23:MEMPROFILE]
+# req_refs: REQ-POMODORO-23-01, REQ-POMODORO-23-02, REQ-POMODORO-23-03
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+# tracemalloc (and the pickle it pulls in) loads only when profiling starts:
+# __main__ imports this module on every launch for DEFAULT_MEMPROFILE_PATH.
+if TYPE_CHECKING:
+    import tracemalloc
+
+DEFAULT_MEMPROFILE_PATH = "pomodoro-memprofile.json"
+# Seconds between snapshots of a running app.
+SNAPSHOT_INTERVAL = 300.0
+TOP_SITES = 10
+# Frames kept per allocation (more = better attribution, more overhead).
+TRACE_FRAMES = 4
+
+
+def _ignored() -> "tuple[tracemalloc.Filter, ...]":
+    """The profiler's own records (and the soak driver below) are not what we look for."""
+    import tracemalloc
+
+    return (
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+
+def _site(stat: "tracemalloc.StatisticDiff") -> str:
+    frame = stat.traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def _top_growth(
+    snapshot: "tracemalloc.Snapshot", base: "tracemalloc.Snapshot", top: int
+) -> list[dict[str, Any]]:
+    """Allocation sites (file:line of the innermost frame) that grew the most."""
+    diffs = snapshot.compare_to(base, "lineno")
+    growing = [d for d in diffs if d.size_diff > 0][:top]
+    return [
+        {
+            "site": _site(d),
+            "size_diff": d.size_diff,
+            "count_diff": d.count_diff,
+            "size": d.size,
+            "count": d.count,
+        }
+        for d in growing
+    ]
+
+
+class MemoryProfiler:
+    """
+    tracemalloc snapshots on demand (snapshot()) or from a periodic timer.
+    Each record holds traced current/peak bytes, the top growing allocation
+    sites since the previous snapshot and since the first one, and extra
+    counters (e.g. Tk object counts) from `counters`. Tk's own C memory
+    (Text undo stack, canvas items) is not traced: watch it through counters.
+    """
+
+    def __init__(
+        self,
+        counters: Callable[[], dict[str, int]] | None = None,
+        top: int = TOP_SITES,
+        frames: int = TRACE_FRAMES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._counters = counters or (lambda: {})
+        self._top = top
+        self._frames = frames
+        self._clock = clock
+        self._started: float | None = None
+        self._first: "tracemalloc.Snapshot | None" = None
+        self._prev: "tracemalloc.Snapshot | None" = None
+        self.records: list[dict[str, Any]] = []
+
+    def set_counters(self, counters: Callable[[], dict[str, int]]) -> None:
+        self._counters = counters
+
+    def start(self) -> None:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+        self._started = self._clock()
+        self.snapshot("start")
+
+    def snapshot(self, label: str = "") -> dict[str, Any]:
+        import tracemalloc
+
+        snap = tracemalloc.take_snapshot().filter_traces(_ignored())
+        current, peak = tracemalloc.get_traced_memory()
+        started = self._started if self._started is not None else self._clock()
+        record: dict[str, Any] = {
+            "label": label,
+            "t_s": round(self._clock() - started, 3),
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "counters": self._counters(),
+            "growth_since_prev": (
+                _top_growth(snap, self._prev, self._top) if self._prev else []
+            ),
+            "growth_since_start": (
+                _top_growth(snap, self._first, self._top) if self._first else []
+            ),
+        }
+        if self._first is None:
+            self._first = snap
+        self._prev = snap
+        self.records.append(record)
+        return record
+
+    def stop(self) -> None:
+        import tracemalloc
+
+        self.snapshot("stop")
+        tracemalloc.stop()
+
+    def report(self) -> dict[str, Any]:
+        first = self.records[0] if self.records else None
+        last = self.records[-1] if self.records else None
+        growth = (last["traced_bytes"] - first["traced_bytes"]) if first and last else 0
+        return {
+            "snapshots": len(self.records),
+            "traced_growth_bytes": growth,
+            "records": self.records,
+        }
+
+    def dump(self, path: Path) -> None:
+        import json
+
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+
+
+# --- headless soak: timer ticks, theme switches, task edits without a display ---
+
+
+class _CountingWidget:
+    """Stand-in for a themed widget (ThemeEngine only needs configure)."""
+
+    def __init__(self) -> None:
+        self.options: dict[str, str] = {}
+
+    def configure(self, **options: str) -> None:
+        self.options.update(options)
+
+
+def soak(
+    profiler: MemoryProfiler,
+    ticks: int = 10000,
+    switches: int = 1000,
+    edits: int = 10000,
+    snapshots: int = 10,
+) -> dict[str, Any]:
+    """
+    Drive the display-independent layers the overlay exercises all day:
+    TimerEngine ticks through TimerScheduler and ViewModel, ThemeEngine
+    switches over role-registered widgets, incremental TaskModel edits and
+    pastes through the Coalescer. Snapshots are spread over the run.
+    Pre: profiler.start() was called.
+    """
+    import random
+
+    from pomodoro.coalesce import Coalescer
+    from pomodoro.engine import TimerEngine
+    from pomodoro.scheduler import TimerScheduler
+    from pomodoro.task_model import TaskModel
+    from pomodoro.ticker import VirtualClock
+    from pomodoro.ui.theme import ROLES, ThemeEngine
+    from pomodoro.view_model import ViewModel, quantize_progress
+
+    rng = random.Random(1)
+    clock = VirtualClock()
+    pending: list[Callable[[], None]] = []
+
+    class Loop:
+        def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any:
+            pending.append(callback)
+            return callback
+
+        def disarm(self, token: Any) -> None:
+            if token in pending:
+                pending.remove(token)
+
+    cfg = {"work_minutes": 25, "break_minutes": 5}
+    view = ViewModel(clock=clock)
+    label: list[Any] = [None, None]
+
+    def render() -> None:
+        view.push("clock.text", engine.display_text, lambda v: label.__setitem__(0, v))
+        view.push("clock.progress", quantize_progress(engine.progress), lambda v: None)
+
+    sched = TimerScheduler(Loop(), clock=clock)
+    engine = TimerEngine(lambda: cfg, clock=clock, on_display=render)
+    theme = ThemeEngine()
+    for role in ROLES:
+        for _ in range(3):
+            theme.register(_CountingWidget(), role)
+    theme.on_change(lambda palette: label.__setitem__(1, palette["bg"]))
+    model = TaskModel()
+    model.load_text("\n".join(f"Task {i}" for i in range(2000)))
+    idle: list[Callable[[], None]] = []
+    coalescer = Coalescer(idle.append)
+
+    def tick() -> None:
+        engine.tick()
+
+    def refresh_active() -> None:
+        model.active_text()  # what the coalesced UI update reads
+
+    steps = max(ticks, switches, edits)
+    every = max(1, steps // max(1, snapshots))
+    for step in range(steps):
+        if step < ticks:
+            if not engine.running:
+                engine.start()
+            delay = engine.next_delay_ms() / 1000.0
+            sched.add(delay, tick, name="clock")
+            clock.advance(delay)
+            while pending:
+                pending.pop()()
+        if step < switches:
+            theme.switch("dark" if step % 2 == 0 else "light")
+        if step < edits:
+            row = rng.randrange(model.total)
+            if step % 500 == 499:
+                # paste a block, then remove it again
+                model.replace_lines(row, 0, [f"pasted {step} {i}" for i in range(200)])
+                model.replace_lines(row, 200, [])
+            else:
+                model.replace_lines(row, 1, [f"Task {row} edit {step}"])
+            coalescer.schedule("tasks-edit", refresh_active)
+            while idle:
+                idle.pop()()
+        if (step + 1) % every == 0:
+            profiler.snapshot(f"soak step {step + 1}")
+    return {
+        "ticks": ticks,
+        "theme_switches": switches,
+        "edits": edits,
+        "view_model": view.stats(),
+        "theme": theme.stats(),
+        "coalescer": coalescer.stats(),
+        "scheduler_wakeups": sched.wakeups,
+    }
+
+
+def run_soak(path: Path, **kwargs: int) -> dict[str, Any]:
+    """Start tracing, run soak(), write the report (with soak stats) to path."""
+    profiler = MemoryProfiler()
+    profiler.start()
+    stats = soak(profiler, **kwargs)
+    profiler.stop()
+    report = profiler.report()
+    report["soak"] = stats
+    import json
+
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return report
+
+
+# [END SPEC:POMODORO-23:MEMPROFILE]
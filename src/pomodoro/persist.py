@@ -0,0 +1,225 @@
+"""Write-behind config persistence: debounced, background, skip-unchanged, atomic."""
+# [START SPEC:POMODORO-8:PERSIST]
+# req_refs: REQ-POMODORO-8-01, REQ-POMODORO-8-02, REQ-POMODORO-8-03, REQ-POMODORO-8-05,
+#   REQ-POMODORO-14-04
+
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Callable
+
+from pomodoro import config
+from pomodoro.task_journal import TaskFileWriter
+from pomodoro.task_model import TaskList
+
+
+def snapshot(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Shallow copy of data, O(settings): tasks stay a reference to the UI's
+    list and are read on the writer thread (TaskList.take_* hold its lock).
+    """
+    return dict(data)
+
+
+class ConfigWriter:
+    """
+    Coalesces save requests: request() only marks dirty and stores a snapshot;
+    a daemon thread writes the latest snapshot `delay` seconds after the first
+    request of a burst. config.json is rewritten atomically only when changed;
+    tasks.txt goes through TaskFileWriter (line patches in a journal, merged
+    in place). With storage "sqlite" both go to pomodoro.db (changed rows only).
+    The list written last to the same file hands over only the lines changed
+    since (TaskList.take_change), so a tick neither copies nor diffs all tasks;
+    any other list is copied and diffed in full.
+    flush()/close() write synchronously (call close() from on_close).
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.5,
+        base_dir: Callable[[], Path] = config.get_base_dir,
+    ) -> None:
+        self._delay = max(0.0, delay)
+        self._base_dir = base_dir
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending: dict[str, Any] | None = None
+        self._closed = False
+        self._last_written: dict[str, str] = {}
+        self._tasks_file: TaskFileWriter | None = None
+        # (weakref to the list, file) of the last successful tasks write.
+        self._tasks_written: tuple[Any, Path] | None = None
+        self.requested = 0
+        self.performed = 0
+        self.skipped_unchanged = 0
+        self.files_written = 0
+        self.errors = 0
+        self._thread = threading.Thread(
+            target=self._run, name="pomodoro-config-writer", daemon=True
+        )
+        self._thread.start()
+
+    def prime(self, data: dict[str, Any]) -> None:
+        """
+        Remember data as already on disk (after load_config, once tasks are parsed).
+        No-op after the first request(): the writer then knows what it wrote.
+        """
+        if self.requested:
+            return
+        config_text = config.render_settings(data)
+        lines = list(TaskList.coerce(data.get("tasks")).lines())
+        with self._write_lock:
+            self._last_written[config.CONFIG_FILENAME] = config_text
+            if data.get("storage") != "sqlite":
+                self._tasks_writer(self._base_dir()).prime(lines)
+
+    def request(self, data: dict[str, Any]) -> None:
+        """Mark config dirty (UI thread). Never touches the disk."""
+        snap = snapshot(data)
+        with self._cond:
+            self.requested += 1
+            self._pending = snap
+            self._cond.notify()
+
+    def flush(self) -> None:
+        """Write the pending snapshot now, on the calling thread."""
+        with self._cond:
+            snap = self._pending
+            self._pending = None
+        if snap is not None:
+            self._write(snap)
+
+    def close(self) -> None:
+        """Flush pending changes and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=5.0)
+        self.flush()
+        with self._write_lock:
+            if self._tasks_file is not None:
+                try:
+                    self._tasks_file.close()
+                except OSError:
+                    self.errors += 1
+
+    def stats(self) -> dict[str, int]:
+        out = {
+            "requested": self.requested,
+            "performed": self.performed,
+            "skipped_unchanged": self.skipped_unchanged,
+            "files_written": self.files_written,
+            "errors": self.errors,
+        }
+        if self._tasks_file is not None:
+            out.update(self._tasks_file.stats())
+        return out
+
+    def _tasks_writer(self, base: Path) -> TaskFileWriter:
+        path = base / config.TASKS_FILENAME
+        if self._tasks_file is None or self._tasks_file.path != path:
+            self._tasks_file = TaskFileWriter(path)
+        return self._tasks_file
+
+    def _task_update(
+        self, tasks: Any, target: Path
+    ) -> tuple[TaskList | None, tuple[int, int, list[str]] | None]:
+        """
+        Writer thread: what to persist of the UI's task list. The list last
+        written to target gives (None, its change since) - (None, None) if
+        unchanged; any other list gives (full copy, None) to diff (a lazily
+        loaded one is parsed here).
+        """
+        tasks = TaskList.coerce(tasks)
+        last = self._tasks_written
+        self._tasks_written = (weakref.ref(tasks), target)
+        if last is not None and last[0]() is tasks and last[1] == target:
+            return None, tasks.take_change()
+        return tasks.take_copy(), None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Coalescing window: later requests replace the snapshot meanwhile.
+                end = time.monotonic() + self._delay
+                while not self._closed:
+                    left = end - time.monotonic()
+                    if left <= 0:
+                        break
+                    self._cond.wait(timeout=left)
+                if self._closed:
+                    return
+                snap = self._pending
+                self._pending = None
+            if snap is not None:
+                self._write(snap)
+
+    def _write(self, snap: dict[str, Any]) -> None:
+        if snap.get("storage") == "sqlite":
+            self._write_sqlite(snap)
+            return
+        with self._write_lock:
+            config_text = config.render_settings(snap)
+            base = self._base_dir()
+            tasks_file = self._tasks_writer(base)
+            tasks, change = self._task_update(snap.get("tasks"), tasks_file.path)
+            wrote = False
+            try:
+                base.mkdir(parents=True, exist_ok=True)
+                name = config.CONFIG_FILENAME
+                if self._last_written.get(name) != config_text:
+                    config.atomic_write_text(base / name, config_text)
+                    self._last_written[name] = config_text
+                    self.files_written += 1
+                    wrote = True
+                if change is not None:
+                    wrote_tasks = tasks_file.patch(*change)
+                else:
+                    wrote_tasks = tasks is not None and tasks_file.write(list(tasks.lines()))
+                if wrote_tasks:
+                    self.files_written += 1
+                    wrote = True
+            except OSError:
+                self._tasks_written = None  # retry the tasks on the next request
+                self.errors += 1
+                return
+            if wrote:
+                self.performed += 1
+            else:
+                self.skipped_unchanged += 1
+
+    # [START SPEC:POMODORO-15:PERSIST_SQLITE]
+    # req_refs: REQ-POMODORO-15-04
+    def _write_sqlite(self, snap: dict[str, Any]) -> None:
+        import sqlite3
+
+        from pomodoro import storage_sqlite
+
+        with self._write_lock:
+            settings = {k: v for k, v in snap.items() if k != "tasks"}
+            try:
+                store = storage_sqlite.get_store(self._base_dir())
+                tasks, change = self._task_update(snap.get("tasks"), store.path)
+                changed = store.save_settings(settings) > 0
+                if change is not None:
+                    changed = store.save_change(*change) or changed
+                elif tasks is not None:
+                    changed = store.save_tasks(tasks) or changed
+            except sqlite3.Error:
+                self._tasks_written = None
+                self.errors += 1
+                return
+            if changed:
+                self.performed += 1
+            else:
+                self.skipped_unchanged += 1
+
+    # [END SPEC:POMODORO-15:PERSIST_SQLITE]
+
+
+# [END SPEC:POMODORO-8:PERSIST]
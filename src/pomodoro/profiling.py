@@ -0,0 +1,218 @@
+"""Opt-in profiling (--profile): handler latency histograms and event-loop lag, JSON/CSV dump."""
+# [START SPEC:POMODORO-22:PROFILING]
+# req_refs: REQ-POMODORO-22-01, REQ-POMODORO-22-02, REQ-POMODORO-22-03
+
+import bisect
+import functools
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Histogram bucket upper bounds, ms (the last bucket is everything above).
+BUCKETS_MS = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0
+)
+BUCKET_NAMES = [f"<={b:g}" for b in BUCKETS_MS] + ["inf"]
+LOOP_LAG = "after_lag"
+DEFAULT_PROFILE_PATH = "pomodoro-profile.json"
+
+
+class Histogram:
+    """Fixed log-scale buckets: O(log buckets) per sample, no samples kept."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (max for the last one)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                if i == len(BUCKETS_MS):
+                    return self.max_ms
+                return min(BUCKETS_MS[i], self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 4),
+            "p95_ms": round(self.percentile(95), 4),
+            "p99_ms": round(self.percentile(99), 4),
+            "max_ms": round(self.max_ms, 4),
+            "buckets": dict(zip(BUCKET_NAMES, self.counts)),
+        }
+
+
+class Profiler:
+    """
+    Latency histograms by name. Nothing is instrumented until wrap()/patch()/
+    backend() is called, so a disabled profiler costs nothing. Each wrapped
+    name records from the thread that runs it (ConfigWriter writes on their
+    own thread), so samples go straight into the histogram without a lock.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        self.histograms: dict[str, Histogram] = {}
+
+    def now(self) -> float:
+        return self._clock()
+
+    def histogram(self, name: str) -> Histogram:
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram()
+            return hist
+
+    def record(self, name: str, ms: float) -> None:
+        self.histogram(name).record(ms)
+
+    def wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """fn timed under name (works for plain functions and methods)."""
+        clock = self._clock
+        record = self.histogram(name).record
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            t0 = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record((clock() - t0) * 1000.0)
+
+        return timed
+
+    def patch(self, cls: type, attr: str, name: str | None = None) -> None:
+        """Time cls.attr for every instance; call before instances bind it to Tk events."""
+        setattr(cls, attr, self.wrap(name or attr, getattr(cls, attr)))
+
+    def backend(self, backend: Any) -> "ProfiledBackend":
+        return ProfiledBackend(backend, self)
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            handlers = {
+                name: h.as_dict()
+                for name, h in sorted(self.histograms.items())
+                if name != LOOP_LAG
+            }
+            lag = self.histograms.get(LOOP_LAG, Histogram()).as_dict()
+        return {
+            "duration_s": round(self._clock() - self._started, 3),
+            "handlers": handlers,
+            "loop_lag": lag,
+        }
+
+    def dump(self, path: Path) -> None:
+        """Write the report: CSV for *.csv (one row per histogram), JSON otherwise."""
+        report = self.report()
+        if path.suffix.lower() == ".csv":
+            import csv
+
+            rows = {**report["handlers"], LOOP_LAG: report["loop_lag"]}
+            columns = ["count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["name"] + columns + BUCKET_NAMES)
+                for name, row in rows.items():
+                    buckets = row["buckets"]
+                    writer.writerow(
+                        [name] + [row[c] for c in columns] + [buckets[b] for b in BUCKET_NAMES]
+                    )
+        else:
+            import json
+
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+class ProfiledBackend:
+    """Scheduler backend wrapper: records after() lag (actual - scheduled firing time)."""
+
+    def __init__(self, backend: Any, profiler: Profiler) -> None:
+        self._backend = backend
+        self._profiler = profiler
+
+    def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any:
+        now = self._profiler.now
+        record = self._profiler.histogram(LOOP_LAG).record
+        due = now() + delay_ms / 1000.0
+
+        def fire() -> None:
+            record(max(0.0, now() - due) * 1000.0)
+            callback()
+
+        return self._backend.arm(delay_ms, fire)
+
+    def disarm(self, token: Any) -> None:
+        self._backend.disarm(token)
+
+
+# [END SPEC:POMODORO-22:PROFILING]
+
+
+# [START SPEC:POMODORO-28:STARTUP_BENCH]
+# req_refs: REQ-POMODORO-28-03
+# Modules the fast startup path defers; the report tells which were loaded by first paint.
+# (pomodoro.audio/dispatch themselves load early for config's name lists; their
+# subprocess use does not.)
+DEFERRED_MODULES = (
+    "pomodoro.ui.tasks",
+    "pomodoro.ui.settings",
+    "pomodoro.ui.notify",
+    "subprocess",
+    "tracemalloc",
+    "ctypes",
+)
+
+
+class StartupTimer:
+    """
+    --startup-bench: named marks in ms since t0 (taken by __main__ before
+    anything is imported), e.g. import, tk, clock, first_paint, panel.
+    A mark is kept the first time it is hit.
+    """
+
+    def __init__(
+        self, t0: float | None = None, clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        self._clock = clock
+        self._t0 = clock() if t0 is None else t0
+        self.marks: dict[str, float] = {}
+        self.loaded_at_paint: list[str] = []
+
+    def mark(self, name: str) -> None:
+        if name in self.marks:
+            return
+        self.marks[name] = round((self._clock() - self._t0) * 1000.0, 3)
+        if name == "first_paint":
+            import sys
+
+            self.loaded_at_paint = [m for m in DEFERRED_MODULES if m in sys.modules]
+
+    def report(self) -> dict[str, Any]:
+        return {"marks_ms": dict(self.marks), "deferred_loaded_at_paint": self.loaded_at_paint}
+
+
+# [END SPEC:POMODORO-28:STARTUP_BENCH]
@@ -0,0 +1,276 @@
+"""Central timer scheduler: one min-heap of deadlines, one armed event-loop wakeup."""
+# [START SPEC:POMODORO-7:SCHEDULER]
+# req_refs: REQ-POMODORO-7-01, REQ-POMODORO-7-02, REQ-POMODORO-7-03, REQ-POMODORO-7-04
+
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Protocol
+
+# Entries due within this much of "now" fire in the same wakeup (after() rounds to ms).
+FIRE_EPSILON = 0.001
+# Window (seconds) for the wakeups-per-minute rate.
+RATE_WINDOW = 60.0
+# Window (seconds) for the wakeups-per-hour rate.
+HOUR_WINDOW = 3600.0
+
+
+class Backend(Protocol):
+    """Event loop adapter: arm one callback after delay_ms, cancel it by token."""
+
+    def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any: ...
+
+    def disarm(self, token: Any) -> None: ...
+
+
+class TkBackend:
+    """Backend over any Tk widget (after/after_cancel); no tkinter import needed here."""
+
+    def __init__(self, widget: Any) -> None:
+        self._widget = widget
+
+    def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any:
+        return self._widget.after(delay_ms, callback)
+
+    def disarm(self, token: Any) -> None:
+        self._widget.after_cancel(token)
+
+
+class AsyncioBackend:
+    """Backend over an asyncio event loop (call_later handles)."""
+
+    def __init__(self, loop: Any) -> None:
+        self._loop = loop
+
+    def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any:
+        return self._loop.call_later(delay_ms / 1000.0, callback)
+
+    def disarm(self, token: Any) -> None:
+        token.cancel()
+
+
+class TimerHandle:
+    """One scheduled callback. Returned by TimerScheduler.add; pass back to cancel/pause."""
+
+    __slots__ = ("deadline", "seq", "callback", "name", "index", "paused_left")
+
+    def __init__(
+        self, deadline: float, seq: int, callback: Callable[[], None], name: str
+    ) -> None:
+        self.deadline = deadline
+        self.seq = seq
+        self.callback = callback
+        self.name = name
+        self.index = -1  # position in heap, -1 when not scheduled
+        self.paused_left: float | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.index >= 0
+
+    def _key(self) -> tuple[float, int]:
+        return (self.deadline, self.seq)
+
+
+class TimerScheduler:
+    """
+    All timers of the process in one indexed min-heap keyed by deadline.
+    Exactly one backend wakeup is armed, for the earliest deadline (plus slack).
+    add/cancel/pause/resume are O(log n); idle timers cost no wakeups.
+    slack: seconds a wakeup may be delayed so near-simultaneous deadlines share it.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        clock: Callable[[], float] = time.monotonic,
+        slack: float = 0.0,
+    ) -> None:
+        self._backend = backend
+        self._clock = clock
+        self._slack = max(0.0, slack)
+        self._heap: list[TimerHandle] = []
+        self._seq = 0
+        self._armed_token: Any = None
+        self._armed_at: float | None = None
+        self._firing = False
+        self._started = clock()
+        self._recent: deque[float] = deque()
+        self._hour: deque[float] = deque()
+        self.wakeups = 0
+        self.fired = 0
+        self.arms = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    # --- public API ---
+
+    def add(
+        self, delay: float, callback: Callable[[], None], name: str = ""
+    ) -> TimerHandle:
+        """Schedule callback in `delay` seconds. O(log n)."""
+        self._seq += 1
+        handle = TimerHandle(self._clock() + max(0.0, delay), self._seq, callback, name)
+        self._push(handle)
+        self._rearm()
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        """Remove a pending or paused timer. O(log n); no-op if already fired."""
+        handle.paused_left = None
+        if handle.active:
+            self._remove(handle)
+            self._rearm()
+
+    def pause(self, handle: TimerHandle) -> None:
+        """Take the timer out of the heap, keeping its remaining time. O(log n)."""
+        if not handle.active:
+            return
+        handle.paused_left = max(0.0, handle.deadline - self._clock())
+        self._remove(handle)
+        self._rearm()
+
+    def resume(self, handle: TimerHandle) -> None:
+        """Re-insert a paused timer with the time it had left. O(log n)."""
+        if handle.active or handle.paused_left is None:
+            return
+        handle.deadline = self._clock() + handle.paused_left
+        handle.paused_left = None
+        self._push(handle)
+        self._rearm()
+
+    def next_deadline(self) -> float | None:
+        return self._heap[0].deadline if self._heap else None
+
+    def wakeups_per_minute(self) -> float:
+        """Backend wakeups per minute over the last minute (or since start)."""
+        now = self._clock()
+        self._trim(now)
+        span = min(RATE_WINDOW, now - self._started)
+        if span <= 0:
+            return 0.0
+        return len(self._recent) * 60.0 / span
+
+    def wakeups_per_hour(self) -> float:
+        """Backend wakeups per hour over the last hour (or since start). [REQ-POMODORO-21-03]"""
+        now = self._clock()
+        self._trim(now)
+        span = min(HOUR_WINDOW, now - self._started)
+        if span <= 0:
+            return 0.0
+        return len(self._hour) * 3600.0 / span
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "timers": len(self._heap),
+            "wakeups": self.wakeups,
+            "fired": self.fired,
+            "arms": self.arms,
+            "wakeups_per_minute": round(self.wakeups_per_minute(), 3),
+            "wakeups_per_hour": round(self.wakeups_per_hour(), 1),
+        }
+
+    # --- wakeup ---
+
+    def _on_wakeup(self) -> None:
+        self._armed_token = None
+        self._armed_at = None
+        now = self._clock()
+        self.wakeups += 1
+        self._recent.append(now)
+        self._hour.append(now)
+        self._trim(now)
+        # Timers added by the callbacks below wait for the next wakeup (as after(0)),
+        # so one that re-adds itself with a tiny delay cannot spin here.
+        last_seq = self._seq
+        self._firing = True
+        try:
+            while self._heap and self._heap[0].deadline <= now + FIRE_EPSILON:
+                handle = self._heap[0]
+                if handle.seq > last_seq:
+                    break
+                self._remove(handle)
+                self.fired += 1
+                handle.callback()
+        finally:
+            self._firing = False
+            self._rearm()
+
+    def _rearm(self) -> None:
+        """Keep exactly one backend wakeup armed, for the earliest deadline."""
+        if self._firing:
+            return
+        if not self._heap:
+            if self._armed_token is not None:
+                self._backend.disarm(self._armed_token)
+                self._armed_token = None
+                self._armed_at = None
+            return
+        head = self._heap[0].deadline
+        target = head + self._slack
+        if self._armed_token is not None:
+            if self._armed_at is not None and head <= self._armed_at <= target:
+                return  # the armed wakeup already serves the earliest deadline
+            self._backend.disarm(self._armed_token)
+        delay_ms = max(0, math.ceil((target - self._clock()) * 1000))
+        self._armed_at = target
+        self._armed_token = self._backend.arm(delay_ms, self._on_wakeup)
+        self.arms += 1
+
+    def _trim(self, now: float) -> None:
+        while self._recent and self._recent[0] < now - RATE_WINDOW:
+            self._recent.popleft()
+        while self._hour and self._hour[0] < now - HOUR_WINDOW:
+            self._hour.popleft()
+
+    # --- indexed binary heap ---
+
+    def _push(self, handle: TimerHandle) -> None:
+        handle.index = len(self._heap)
+        self._heap.append(handle)
+        self._sift_up(handle.index)
+
+    def _remove(self, handle: TimerHandle) -> None:
+        i = handle.index
+        last = self._heap.pop()
+        handle.index = -1
+        if last is handle:
+            return
+        self._heap[i] = last
+        last.index = i
+        if i > 0 and last._key() < self._heap[(i - 1) // 2]._key():
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        heap[i].index = i
+        heap[j].index = j
+
+    def _sift_up(self, i: int) -> None:
+        heap = self._heap
+        while i > 0:
+            parent = (i - 1) // 2
+            if heap[i]._key() >= heap[parent]._key():
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int) -> None:
+        heap = self._heap
+        n = len(heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and heap[child]._key() < heap[smallest]._key():
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+
+# [END SPEC:POMODORO-7:SCHEDULER]
@@ -0,0 +1,399 @@
+"""Optional SQLite storage for settings, tasks and session history (stdlib sqlite3)."""
+# [START SPEC:POMODORO-15:SQLITE]
+# req_refs: REQ-POMODORO-15-01, REQ-POMODORO-15-02, REQ-POMODORO-15-03, REQ-POMODORO-15-05
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from pomodoro.task_journal import diff_lines, discard_journal
+from pomodoro.task_model import TaskList, parse_task_line
+
+DB_FILENAME = "pomodoro.db"
+# Spacing of task positions; inserted rows take free positions between neighbours.
+POS_GAP = 1 << 16
+
+STATUS_PENDING = 0
+STATUS_DONE = 1
+STATUS_BLANK = 2  # not done, empty text: never the active task
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    pos INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    status INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_counts (status INTEGER PRIMARY KEY, n INTEGER NOT NULL);
+INSERT OR IGNORE INTO task_counts (status, n) VALUES (0, 0), (1, 0), (2, 0);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    phase TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    seconds INTEGER NOT NULL,
+    task TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started_at);
+"""
+
+# Indexes and the per-status counters kept by triggers. Dropped and recreated
+# around bulk imports, which is much faster than maintaining them row by row.
+_TASK_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS tasks_pos ON tasks (pos)",
+    "CREATE INDEX IF NOT EXISTS tasks_status_pos ON tasks (status, pos)",
+    "CREATE TRIGGER IF NOT EXISTS tasks_count_ins AFTER INSERT ON tasks BEGIN "
+    "UPDATE task_counts SET n = n + 1 WHERE status = NEW.status; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_count_del AFTER DELETE ON tasks BEGIN "
+    "UPDATE task_counts SET n = n - 1 WHERE status = OLD.status; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_count_upd AFTER UPDATE OF status ON tasks "
+    "WHEN OLD.status <> NEW.status BEGIN "
+    "UPDATE task_counts SET n = n - 1 WHERE status = OLD.status; "
+    "UPDATE task_counts SET n = n + 1 WHERE status = NEW.status; END",
+]
+_DROP_TASK_INDEXES = [
+    "DROP INDEX IF EXISTS tasks_pos",
+    "DROP INDEX IF EXISTS tasks_status_pos",
+    "DROP TRIGGER IF EXISTS tasks_count_ins",
+    "DROP TRIGGER IF EXISTS tasks_count_del",
+    "DROP TRIGGER IF EXISTS tasks_count_upd",
+]
+
+
+def _row(line: str) -> tuple[str, int]:
+    """tasks.txt line -> (text, status)."""
+    text, done = parse_task_line(line)
+    if done:
+        return text, STATUS_DONE
+    return text, STATUS_PENDING if text.strip() else STATUS_BLANK
+
+
+class SqliteStore:
+    """
+    pomodoro.db in WAL mode. Tasks are rows (pos, text, status) indexed on pos
+    and (status, pos): "next pending" is one index seek; per-status counts are
+    kept by triggers, so "done count" is a primary-key lookup.
+    save_tasks() diffs against the last loaded/saved lines and touches only the
+    changed rows (a tick is one UPDATE by id); save_change() skips the diff when
+    the caller knows the changed range. Row ids and positions are mirrored in
+    memory; rows are inserted between neighbour positions, with a renumbering
+    only when a gap is used up. Thread-safe (one lock).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        with self._tx() as db:
+            for statement in _TASK_INDEXES:
+                db.execute(statement)
+        self._lines: list[str] | None = None
+        self._ids = array("q")
+        self._pos = array("q")
+        self.row_updates = 0
+        self.row_inserts = 0
+        self.row_deletes = 0
+        self.renumbers = 0
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            tasks = self._db.execute("SELECT 1 FROM tasks LIMIT 1").fetchone()
+            settings = self._db.execute("SELECT 1 FROM settings LIMIT 1").fetchone()
+        return tasks is None and settings is None
+
+    # --- settings ---
+
+    def load_settings(self) -> dict[str, Any]:
+        with self._lock:
+            rows = self._db.execute("SELECT key, value FROM settings").fetchall()
+        return {k: json.loads(v) for k, v in rows}
+
+    def save_settings(self, settings: dict[str, Any]) -> int:
+        """Upsert settings; rows whose value did not change are left alone."""
+        with self._tx() as db:
+            before = db.total_changes
+            db.executemany(
+                "INSERT INTO settings (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value "
+                "WHERE value <> excluded.value",
+                [(k, json.dumps(v, ensure_ascii=False)) for k, v in settings.items()],
+            )
+            return db.total_changes - before
+
+    # --- tasks ---
+
+    def load_tasks(self) -> TaskList:
+        """All tasks in order; also becomes the base for the next save_tasks()."""
+        return self._load_tasks()[0]
+
+    def _saved_lines(self) -> list[str]:
+        """Lines last loaded or saved: what save_tasks() diffs against (lock held)."""
+        if self._lines is None:
+            return self._load_tasks()[1]
+        return self._lines
+
+    def _load_tasks(self) -> tuple[TaskList, list[str]]:
+        texts: list[str] = []
+        done = bytearray()
+        ids = array("q")
+        pos = array("q")
+        with self._lock:
+            for row_id, p, text, status in self._db.execute(
+                "SELECT id, pos, text, status FROM tasks ORDER BY pos"
+            ):
+                ids.append(row_id)
+                pos.append(p)
+                texts.append(text)
+                done.append(status == STATUS_DONE)
+            tasks = TaskList(texts, done)
+            self._ids, self._pos = ids, pos
+            lines = self._lines = list(tasks.lines())
+        return tasks, lines
+
+    def save_tasks(self, tasks: TaskList) -> bool:
+        """Apply the difference to the last saved state. False if nothing changed."""
+        with self._lock:
+            saved = self._saved_lines()
+            lines = list(tasks.lines())
+            change = diff_lines(saved, lines)
+            if change is None:
+                return False
+            self._save_change(saved, *change)
+        return True
+
+    def save_change(self, first: int, old_count: int, new_lines: list[str]) -> bool:
+        """
+        Apply a known replacement of lines [first, first + old_count) of the last
+        saved state (TaskList.take_change): no diff over all tasks, a tick is
+        set_line(). False if those lines are saved already.
+        """
+        with self._lock:
+            saved = self._saved_lines()
+            if saved[first : first + old_count] == new_lines:
+                return False
+            if old_count == len(new_lines) == 1:
+                self.set_line(first, new_lines[0])
+            else:
+                self._save_change(saved, first, old_count, new_lines)
+        return True
+
+    def _save_change(
+        self, saved: list[str], first: int, old_count: int, new_lines: list[str]
+    ) -> None:
+        try:
+            with self._tx() as db:
+                self._apply(db, first, old_count, new_lines)
+        except sqlite3.Error:
+            self._lines = None  # in-memory mirror may be half-updated: reload next time
+            raise
+        saved[first : first + old_count] = new_lines
+
+    def set_line(self, i: int, line: str) -> None:
+        """Rewrite task i in place (e.g. tick it): one UPDATE by row id."""
+        with self._lock:
+            saved = self._saved_lines()
+            with self._tx() as db:
+                db.execute(
+                    "UPDATE tasks SET text = ?, status = ? WHERE id = ?",
+                    (*_row(line), self._ids[i]),
+                )
+            saved[i] = line
+            self.row_updates += 1
+
+    def _apply(
+        self, db: sqlite3.Connection, first: int, old_count: int, new_lines: list[str]
+    ) -> None:
+        common = min(old_count, len(new_lines))
+        if common:
+            db.executemany(
+                "UPDATE tasks SET text = ?, status = ? WHERE id = ?",
+                [
+                    (*_row(line), self._ids[first + k])
+                    for k, line in enumerate(new_lines[:common])
+                ],
+            )
+            self.row_updates += common
+        i = first + common
+        j = first + old_count
+        if j > i:
+            db.executemany(
+                "DELETE FROM tasks WHERE id = ?", [(row_id,) for row_id in self._ids[i:j]]
+            )
+            del self._ids[i:j]
+            del self._pos[i:j]
+            self.row_deletes += j - i
+        extra = new_lines[common:]
+        if not extra:
+            return
+        positions = self._free_positions(db, i, len(extra))
+        ids = array("q")
+        for p, line in zip(positions, extra):
+            cur = db.execute(
+                "INSERT INTO tasks (pos, text, status) VALUES (?, ?, ?)", (p, *_row(line))
+            )
+            if cur.lastrowid is None:
+                raise sqlite3.DatabaseError("INSERT into tasks returned no row id")
+            ids.append(cur.lastrowid)
+        self._ids[i:i] = ids
+        self._pos[i:i] = array("q", positions)
+        self.row_inserts += len(extra)
+
+    def _free_positions(self, db: sqlite3.Connection, i: int, count: int) -> list[int]:
+        """`count` increasing positions between rows i - 1 and i."""
+        lo = self._pos[i - 1] if i > 0 else None
+        hi = self._pos[i] if i < len(self._pos) else None
+        span = POS_GAP * (count + 1)
+        if lo is None:
+            lo = (hi if hi is not None else span) - span
+        if hi is None:
+            hi = lo + span
+        step = (hi - lo) // (count + 1)
+        if step == 0:
+            self._renumber(db, max(POS_GAP, count + 1))
+            return self._free_positions(db, i, count)
+        return [lo + step * (k + 1) for k in range(count)]
+
+    def _renumber(self, db: sqlite3.Connection, gap: int) -> None:
+        self._pos = array("q", range(0, len(self._ids) * gap, gap))
+        db.executemany(
+            "UPDATE tasks SET pos = ? WHERE id = ?", zip(self._pos, self._ids)
+        )
+        self.renumbers += 1
+
+    def next_pending(self) -> tuple[int, str] | None:
+        """(row id, text) of the first pending task: one (status, pos) index seek."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT id, text FROM tasks WHERE status = ? ORDER BY pos LIMIT 1",
+                (STATUS_PENDING,),
+            ).fetchone()
+
+    def done_count(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT n FROM task_counts WHERE status = ?", (STATUS_DONE,)
+            ).fetchone()[0]
+
+    def task_count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT sum(n) FROM task_counts").fetchone()[0]
+
+    # --- text format ---
+
+    def import_text(self, text: str) -> int:
+        """Replace all tasks with tasks.txt content. Returns the number of tasks."""
+        lines = text.splitlines()  # as TaskList.from_text: a trailing newline adds no task
+        with self._tx() as db:
+            for statement in _DROP_TASK_INDEXES:
+                db.execute(statement)
+            db.execute("DELETE FROM tasks")
+            db.executemany(
+                "INSERT INTO tasks (id, pos, text, status) VALUES (?, ?, ?, ?)",
+                ((k + 1, k * POS_GAP, *_row(line)) for k, line in enumerate(lines)),
+            )
+            db.execute(
+                "UPDATE task_counts SET n = (SELECT count(*) FROM tasks "
+                "WHERE tasks.status = task_counts.status)"
+            )
+            for statement in _TASK_INDEXES:
+                db.execute(statement)
+            self._ids = array("q", range(1, len(lines) + 1))
+            self._pos = array("q", range(0, len(lines) * POS_GAP, POS_GAP))
+            self._lines = list(TaskList.from_lines(lines).lines())
+        return len(lines)
+
+    def export_text(self) -> str:
+        """All tasks in tasks.txt format."""
+        return self.load_tasks().to_text()
+
+    # --- sessions ---
+
+    def record_session(
+        self, phase: str, seconds: int, task: str = "", started_at: float | None = None
+    ) -> None:
+        """One finished work/break interval."""
+        if started_at is None:
+            started_at = time.time() - seconds
+        with self._tx() as db:
+            db.execute(
+                "INSERT INTO sessions (phase, started_at, seconds, task) VALUES (?, ?, ?, ?)",
+                (phase, started_at, seconds, task),
+            )
+
+    def sessions(self, since: float = 0.0) -> list[tuple[str, float, int, str]]:
+        """(phase, started_at, seconds, task) started at or after `since`, oldest first."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT phase, started_at, seconds, task FROM sessions "
+                "WHERE started_at >= ? ORDER BY started_at",
+                (since,),
+            ).fetchall()
+
+    def save(self, settings: dict[str, Any], tasks: TaskList) -> bool:
+        """Settings + tasks; True if any row changed."""
+        changed = self.save_settings(settings) > 0
+        return self.save_tasks(tasks) or changed
+
+
+_stores: dict[Path, SqliteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(base: Path) -> SqliteStore:
+    """The shared store of base dir (one connection per database file)."""
+    path = base / DB_FILENAME
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = SqliteStore(path)
+        return store
+
+
+def main() -> None:
+    """python -m pomodoro.storage_sqlite import|export: move tasks between tasks.txt and pomodoro.db."""
+    from pomodoro import config
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("command", choices=["import", "export"])
+    args = parser.parse_args()
+    base = config.get_base_dir()
+    store = get_store(base)
+    tasks_path = base / config.TASKS_FILENAME
+    if args.command == "import":
+        text = tasks_path.read_text(encoding="utf-8") if tasks_path.exists() else ""
+        print(f"imported {store.import_text(text)} tasks into {store.path}")
+    else:
+        config.atomic_write_text(tasks_path, store.export_text())
+        discard_journal(tasks_path)
+        print(f"exported {store.task_count()} tasks to {tasks_path}")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# [END SPEC:POMODORO-15:SQLITE]
@@ -0,0 +1,169 @@
+"""Streaming tasks.txt loader: memory-mapped file, chunk offset index, lazy parsing."""
+# [START SPEC:POMODORO-13:TASK_FILE]
+# req_refs: REQ-POMODORO-13-01, REQ-POMODORO-13-02, REQ-POMODORO-13-03
+
+import mmap
+import re
+from pathlib import Path
+from typing import Iterator
+
+from pomodoro.task_model import TaskList
+
+# Smaller files are read and parsed at once (TaskList.from_text), as before.
+MAP_MIN_BYTES = 1 << 20
+# Target size of one index chunk; chunks always end on a line boundary.
+CHUNK_BYTES = 1 << 20
+
+# Done lines with leading whitespace; plain "\n+" is counted with bytes.count.
+_INDENTED_DONE = re.compile(rb"\n[ \t\r\f\v]+\+")
+
+
+class MappedTaskList(TaskList):
+    """
+    TaskList over a memory-mapped tasks.txt. Opening makes one pass of C-level
+    byte counts over the file and builds an offset index of ~CHUNK_BYTES chunks
+    (start, end, lines, done lines), so len() and done_count are known before
+    any task is parsed. Chunks are parsed in file order on demand (text(i),
+    ensure_loaded, load_more); the parsed prefix is a plain TaskList.
+    The mapping is closed once the last chunk is parsed.
+    Lines are split on '\\n' only ('\\r\\n' works; bare '\\r' does not split).
+    """
+
+    __slots__ = ("_mm", "_chunks", "_next_chunk", "_rest_lines", "_rest_done")
+
+    def __init__(self, mm: mmap.mmap) -> None:
+        super().__init__()
+        self._mm: mmap.mmap | None = mm
+        self._chunks: list[tuple[int, int, int, int]] = []
+        self._next_chunk = 0
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = min(size, start + CHUNK_BYTES)
+            if end < size:
+                nl = mm.find(b"\n", end - 1)
+                end = size if nl < 0 else nl + 1
+            # Prefix the newline that precedes the chunk so every line start is "\n".
+            data = mm[start - 1 : end] if start else b"\n" + mm[:end]
+            lines = data.count(b"\n") - data.endswith(b"\n")
+            done = data.count(b"\n+") + len(_INDENTED_DONE.findall(data))
+            self._chunks.append((start, end, lines, done))
+            start = end
+        self._rest_lines = sum(c[2] for c in self._chunks)
+        self._rest_done = sum(c[3] for c in self._chunks)
+        self.done_count = self._rest_done
+        if not self._chunks:
+            self.close()
+
+    @property
+    def chunks(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def fully_loaded(self) -> bool:
+        return self._mm is None
+
+    def close(self) -> None:
+        """Release the mapping. Pre: every chunk is parsed (or the file is dropped)."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def load_more(self) -> bool:
+        """Parse the next chunk. O(chunk); False when the whole file is parsed."""
+        # Under the lock: the config writer may parse the rest for copy() meanwhile.
+        with self._lock:
+            if self._mm is None:
+                return False
+            start, end, lines, done = self._chunks[self._next_chunk]
+            self._next_chunk += 1
+            text = self._mm[start:end].decode("utf-8", errors="replace")
+            parts = text.split("\n")
+            if text.endswith("\n"):
+                parts.pop()
+            chunk = TaskList.from_lines(parts)
+            self._texts += chunk._texts
+            self._done += chunk._done
+            self._rest_lines -= lines
+            self._rest_done -= done
+            # The scan count is exact for ASCII whitespace; the parser has the last word.
+            self.done_count += chunk.done_count - done
+            if self._next_chunk == len(self._chunks):
+                self.close()
+            return True
+
+    def load_all(self) -> None:
+        while self.load_more():
+            pass
+
+    # --- TaskList API: parse up to what is touched ---
+
+    def __len__(self) -> int:
+        return len(self._texts) + self._rest_lines
+
+    @property
+    def total(self) -> int:
+        return len(self._texts) + self._rest_lines
+
+    def __iter__(self) -> Iterator[tuple[str, bool]]:
+        self.load_all()
+        return super().__iter__()
+
+    def __eq__(self, other: object) -> bool:
+        self.load_all()
+        if isinstance(other, MappedTaskList):
+            other.load_all()
+        return super().__eq__(other)
+
+    def lines(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        self.ensure_loaded(len(self) if stop is None else stop)
+        return super().lines(start, stop)
+
+    def copy(self) -> TaskList:
+        self.load_all()
+        return super().copy()
+
+    def take_copy(self) -> TaskList:
+        self.load_all()
+        return super().take_copy()
+
+    def text(self, i: int) -> str:
+        self.ensure_loaded(i + 1)
+        return super().text(i)
+
+    def is_done(self, i: int) -> bool:
+        self.ensure_loaded(i + 1)
+        return super().is_done(i)
+
+    def is_pending(self, i: int) -> bool:
+        self.ensure_loaded(i + 1)
+        return super().is_pending(i)
+
+    def set_done(self, i: int, done: bool) -> None:
+        self.ensure_loaded(i + 1)
+        super().set_done(i, done)
+
+    def set_text(self, i: int, text: str) -> None:
+        self.ensure_loaded(i + 1)
+        super().set_text(i, text)
+
+    def replace_lines(self, first: int, old_count: int, new_lines: list[str]) -> None:
+        # Appending at the very end (first == len) parses everything first.
+        self.ensure_loaded(first + old_count)
+        super().replace_lines(first, old_count, new_lines)
+
+
+def load_tasks(path: Path) -> TaskList:
+    """
+    Tasks from tasks.txt: small files parsed at once, large ones memory-mapped
+    (MappedTaskList). Raises OSError if the file cannot be read.
+    """
+    size = path.stat().st_size
+    if size < MAP_MIN_BYTES:
+        return TaskList.from_text(path.read_text(encoding="utf-8"))
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return MappedTaskList(mm)
+
+
+# [END SPEC:POMODORO-13:TASK_FILE]
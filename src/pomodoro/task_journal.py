@@ -0,0 +1,350 @@
+"""Incremental tasks.txt persistence: line diff, append-only journal, in-place checkpoint."""
+# [START SPEC:POMODORO-14:TASK_JOURNAL]
+# req_refs: REQ-POMODORO-14-01, REQ-POMODORO-14-02, REQ-POMODORO-14-03
+
+import json
+import os
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any
+
+# Journal grown past this is merged into tasks.txt (also done on close).
+JOURNAL_MAX_BYTES = 256 * 1024
+# Lines compared per slice while searching the common prefix/suffix.
+DIFF_BLOCK = 1024
+
+
+def journal_path(path: Path) -> Path:
+    return path.with_name(path.name + ".journal")
+
+
+def file_stamp(path: Path) -> tuple[int, int] | None:
+    """(size, mtime_ns) of tasks.txt, None if it is missing: detects edits made outside."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _prefix_crc(path: Path, end: int) -> int | None:
+    """crc32 of the first `end` bytes of path; None if the file is shorter."""
+    crc = 0
+    with open(path, "rb") as f:
+        while end > 0:
+            chunk = f.read(min(end, 1 << 20))
+            if not chunk:
+                return None
+            crc = zlib.crc32(chunk, crc)
+            end -= len(chunk)
+    return crc
+
+
+def split_lines(text: str) -> list[str]:
+    """tasks.txt text -> lines, the inverse of "\\n".join (empty text = no lines)."""
+    return text.split("\n") if text else []
+
+
+def _byte_len(line: str) -> int:
+    return len(line) if line.isascii() else len(line.encode("utf-8"))
+
+
+def diff_lines(old: list[str], new: list[str]) -> tuple[int, int, list[str]] | None:
+    """
+    Smallest single replacement turning old into new: (first, old_count, new_lines),
+    or None if equal. Common prefix/suffix are found with C-level slice compares.
+    """
+    n = min(len(old), len(new))
+    lo = 0
+    while lo < n:
+        hi = min(n, lo + DIFF_BLOCK)
+        if old[lo:hi] == new[lo:hi]:
+            lo = hi
+            continue
+        while old[lo] == new[lo]:
+            lo += 1
+        break
+    if lo == len(old) == len(new):
+        return None
+    limit = n - lo
+    suf = 0
+    len_old, len_new = len(old), len(new)
+    while suf < limit:
+        step = min(DIFF_BLOCK, limit - suf)
+        if old[len_old - suf - step : len_old - suf] == new[len_new - suf - step : len_new - suf]:
+            suf += step
+            continue
+        while suf < limit and old[len_old - 1 - suf] == new[len_new - 1 - suf]:
+            suf += 1
+        break
+    return lo, len_old - lo - suf, new[lo : len_new - suf]
+
+
+# --- journal records: "<crc32 hex> <json>\n"; a torn or corrupt tail is ignored ---
+
+
+def _encode_record(record: dict[str, Any]) -> bytes:
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"%08x " % zlib.crc32(payload) + payload + b"\n"
+
+
+def read_journal(path: Path) -> list[dict[str, Any]]:
+    """Valid records of the journal of tasks file `path`, up to the first bad one."""
+    try:
+        data = journal_path(path).read_bytes()
+    except FileNotFoundError:
+        return []
+    records: list[dict[str, Any]] = []
+    for raw in data.split(b"\n")[:-1]:  # the last piece has no newline: torn or empty
+        crc, _, payload = raw.partition(b" ")
+        try:
+            if int(crc, 16) != zlib.crc32(payload):
+                break
+            records.append(json.loads(payload))
+        except ValueError:
+            break
+    return records
+
+
+def _write_tail(path: Path, start: int, tail: bytes) -> None:
+    """tasks.txt bytes from `start` replaced by tail (file truncated after it)."""
+    mode = "r+b" if path.exists() else "w+b"
+    with open(path, mode) as f:
+        f.seek(start)
+        f.write(tail)
+        f.truncate()
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def set_aside_journal(path: Path) -> Path:
+    """
+    Move a journal that cannot be applied to tasks.txt.journal.bad (kept for
+    the user, replacing an older one) so new records never extend it.
+    """
+    bad = journal_path(path).with_name(journal_path(path).name + ".bad")
+    os.replace(journal_path(path), bad)
+    return bad
+
+
+def recover(path: Path) -> bool:
+    """
+    Apply a journal left behind by a crash to tasks.txt, then delete it.
+    The last checkpoint record is redone (idempotent) if the bytes before its
+    offset are still the ones it was computed for; line patches are replayed
+    only onto the file they were recorded against (size and mtime of the
+    "base" record) and written atomically. A journal that does not match
+    tasks.txt (edited by hand since) is set aside instead, ValueError.
+    Returns True if a journal was found.
+    """
+    from pomodoro.config import atomic_write_text
+
+    jpath = journal_path(path)
+    if not jpath.exists():
+        return False
+    records = read_journal(path)
+    last_cp = -1
+    for i, rec in enumerate(records):
+        if rec.get("op") == "checkpoint":
+            last_cp = i
+    if last_cp >= 0:
+        cp = records[last_cp]
+        start = int(cp["start"])
+        if not path.exists() or _prefix_crc(path, start) != cp.get("prefix"):
+            set_aside_journal(path)
+            raise ValueError("tasks.txt changed before the interrupted checkpoint")
+        _write_tail(path, start, str(cp["tail"]).encode("utf-8"))
+    elif records and not _matches_base(path, records[0]):
+        set_aside_journal(path)
+        raise ValueError("tasks.txt changed after the journal was started")
+    patches = [rec for rec in records[last_cp + 1 :] if rec.get("op") == "patch"]
+    if patches:
+        text = path.read_text(encoding="utf-8") if path.exists() else ""
+        lines = split_lines(text)
+        for rec in patches:
+            first = int(rec["first"])
+            lines[first : first + int(rec["old"])] = list(rec["lines"])
+        atomic_write_text(path, "\n".join(lines))
+    os.remove(jpath)
+    return True
+
+
+def _matches_base(path: Path, record: dict[str, Any]) -> bool:
+    if record.get("op") != "base":
+        return False
+    stamp = file_stamp(path)
+    return stamp is not None and [record.get("size"), record.get("mtime")] == list(stamp)
+
+
+def discard_journal(path: Path) -> None:
+    """Drop the journal after tasks.txt was rewritten whole."""
+    try:
+        os.remove(journal_path(path))
+    except FileNotFoundError:
+        pass
+
+
+class TaskFileWriter:
+    """
+    Persists task lines to one tasks.txt without full rewrites. write() diffs
+    the new lines against the last persisted ones (patch() takes a change the
+    caller already knows) and appends one patch record (first, old count, new
+    lines) to tasks.txt.journal with fsync: ticking a task costs one short append. checkpoint() merges the journal into tasks.txt
+    by rewriting only from the first changed byte (pure appends write only the
+    new lines); the new tail is journaled first, so a crash at any point is
+    recovered by recover() on the next load.
+    The first write of a session is a full atomic rewrite unless prime()d lines
+    match the file byte for byte. tasks.txt edited by hand meanwhile (size or
+    mtime differ from the last write) is never patched in place: the merge
+    falls back to a full rewrite.
+    """
+
+    def __init__(self, path: Path, journal_max: int = JOURNAL_MAX_BYTES) -> None:
+        self.path = path
+        self._journal_path = journal_path(path)
+        self._journal_max = journal_max
+        self._journal: Any = None
+        self._journal_size = 0
+        self._lines: list[str] | None = None
+        self._sizes = array("q")
+        self._stamp: tuple[int, int] | None = None
+        self._dirty_from: int | None = None
+        self._primed: list[str] | None = None
+        self.patches = 0
+        self.checkpoints = 0
+        self.full_writes = 0
+        self.bytes_written = 0
+
+    def prime(self, lines: list[str]) -> None:
+        """Lines believed to be in tasks.txt; verified against the file on first write."""
+        self._primed = lines
+
+    def write(self, lines: list[str]) -> bool:
+        """Persist lines. Returns False if nothing changed since the last write."""
+        base = self._lines
+        if base is None:
+            base = self._adopt_primed()
+            if base is None:
+                self._full_write(lines)
+                return True
+        change = diff_lines(base, lines)
+        if change is None:
+            return False
+        return self.patch(*change)
+
+    def patch(self, first: int, old_count: int, new_lines: list[str]) -> bool:
+        """
+        Persist a known replacement of lines [first, first + old_count) of the
+        last written lines, without a diff. Pre: write() has set the base.
+        Returns False if those lines already match.
+        """
+        base = self._lines
+        if base is None:
+            raise ValueError("patch() before the first write()")
+        if base[first : first + old_count] == new_lines:
+            return False
+        self._append({"op": "patch", "first": first, "old": old_count, "lines": new_lines})
+        base[first : first + old_count] = new_lines
+        self._sizes[first : first + old_count] = array("q", map(_byte_len, new_lines))
+        self._dirty_from = first if self._dirty_from is None else min(self._dirty_from, first)
+        self.patches += 1
+        if self._journal_size >= self._journal_max:
+            self.checkpoint()
+        return True
+
+    def checkpoint(self) -> None:
+        """Merge the journal into tasks.txt, rewriting from the first changed byte."""
+        if self._lines is not None and self._dirty_from is not None:
+            k = min(self._dirty_from, len(self._lines))
+            if k == 0:
+                start, tail = 0, "\n".join(self._lines)
+            else:
+                # Rewrite from the newline before line k (covers appends to a file
+                # without a trailing newline and truncation after removed lines).
+                start = sum(self._sizes[:k]) + k - 1
+                tail = "\n" + "\n".join(self._lines[k:]) if k < len(self._lines) else ""
+            if self._stamp is None or file_stamp(self.path) != self._stamp:
+                self._full_write(self._lines)  # changed outside: offsets are not ours
+                return
+            prefix = _prefix_crc(self.path, start)
+            self._append({"op": "checkpoint", "start": start, "tail": tail, "prefix": prefix})
+            data = tail.encode("utf-8")
+            _write_tail(self.path, start, data)
+            self._stamp = file_stamp(self.path)
+            self.bytes_written += len(data)
+            self.checkpoints += 1
+            self._dirty_from = None
+        self._close_journal()
+        discard_journal(self.path)
+
+    def close(self) -> None:
+        self.checkpoint()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "patches": self.patches,
+            "checkpoints": self.checkpoints,
+            "full_writes": self.full_writes,
+            "bytes_written": self.bytes_written,
+        }
+
+    # --- internals ---
+
+    def _adopt_primed(self) -> list[str] | None:
+        """Primed lines as the base if tasks.txt holds exactly them, else None."""
+        primed, self._primed = self._primed, None
+        if primed is None or self._journal_path.exists():
+            return None
+        try:
+            on_disk = self.path.read_bytes()
+        except OSError:
+            return None
+        if on_disk != "\n".join(primed).encode("utf-8"):
+            return None
+        self._set_base(primed)
+        return primed
+
+    def _full_write(self, lines: list[str]) -> None:
+        from pomodoro.config import atomic_write_text
+
+        text = "\n".join(lines)
+        self._close_journal()
+        atomic_write_text(self.path, text)
+        discard_journal(self.path)
+        self._set_base(list(lines))
+        self.full_writes += 1
+        self.bytes_written += _byte_len(text)
+
+    def _set_base(self, lines: list[str]) -> None:
+        self._lines = lines
+        self._sizes = array("q", map(_byte_len, lines))
+        self._stamp = file_stamp(self.path)
+        self._dirty_from = None
+
+    def _append(self, record: dict[str, Any]) -> None:
+        data = _encode_record(record)
+        if self._journal is None:
+            self._journal = open(self._journal_path, "ab")
+            if self._journal.tell() > 0:
+                # Left over from another session (recover() failed): never extend it.
+                self._journal.close()
+                set_aside_journal(self.path)
+                self._journal = open(self._journal_path, "ab")
+            size, mtime = self._stamp or (None, None)
+            data = _encode_record({"op": "base", "size": size, "mtime": mtime}) + data
+            self._journal_size = 0
+        self._journal.write(data)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_size += len(data)
+        self.bytes_written += len(data)
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+            self._journal_size = 0
+
+
+# [END SPEC:POMODORO-14:TASK_JOURNAL]
@@ -0,0 +1,488 @@
+"""Task storage and incremental task model (no tkinter)."""
+# [START SPEC:POMODORO-10:TASK_LIST]
+# req_refs: REQ-POMODORO-10-01, REQ-POMODORO-10-02, REQ-POMODORO-10-03, REQ-POMODORO-13-02
+
+import threading
+from typing import Iterable, Iterator
+
+
+def parse_task_line(raw: str) -> tuple[str, bool]:
+    """One line of tasks text -> (text, done). Line starting with '+' = done."""
+    raw = raw.rstrip("\n\r")
+    if raw.lstrip().startswith("+"):
+        return raw.lstrip("+ \t"), True
+    return raw, False
+
+
+class TaskList:
+    """
+    Tasks as parallel arrays: texts (list[str]) and done flags (bytearray).
+    Keeps a running done counter so progress is O(1). Same text format as
+    tasks.txt: one task per line, '+' at the start = done.
+    Mutations hold the list's lock and widen one changed range, so another
+    thread (the config writer) can take a consistent copy() or just the lines
+    changed since its last take (take_change), without a diff over all tasks.
+    """
+
+    __slots__ = ("_texts", "_done", "done_count", "_change", "_lock", "__weakref__")
+
+    def __init__(
+        self, texts: list[str] | None = None, done: bytearray | None = None
+    ) -> None:
+        self._texts: list[str] = texts if texts is not None else []
+        self._done = done if done is not None else bytearray(len(self._texts))
+        self.done_count = self._done.count(1)
+        # (first, old_count, new_count) changed since the last take, or None.
+        self._change: tuple[int, int, int] | None = None
+        self._lock = threading.Lock()
+
+    # --- load / save ---
+
+    @classmethod
+    def from_text(cls, text: str) -> "TaskList":
+        """Parse multiline text: one task per line (str.splitlines)."""
+        return cls.from_lines(text.splitlines())
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "TaskList":
+        texts: list[str] = []
+        done = bytearray()
+        for line in lines:
+            t, d = parse_task_line(line)
+            texts.append(t)
+            done.append(d)
+        return cls(texts, done)
+
+    @classmethod
+    def from_dicts(cls, tasks: Iterable[dict]) -> "TaskList":
+        """Legacy list[dict] with 'text'/'done' keys."""
+        texts: list[str] = []
+        done = bytearray()
+        for t in tasks:
+            texts.append(t.get("text", ""))
+            done.append(bool(t.get("done", False)))
+        return cls(texts, done)
+
+    @classmethod
+    def coerce(cls, tasks: "TaskList | Iterable[dict] | None") -> "TaskList":
+        if isinstance(tasks, TaskList):
+            return tasks
+        return cls.from_dicts(tasks or [])
+
+    def to_text(self) -> str:
+        """Serialize to tasks.txt format, lines joined by newline."""
+        return "\n".join(self.lines())
+
+    def lines(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        texts, done = self._texts, self._done
+        stop = len(texts) if stop is None else min(stop, len(texts))
+        for i in range(start, stop):
+            yield "+ " + texts[i] if done[i] else texts[i]
+
+    def copy(self) -> "TaskList":
+        """Consistent copy; safe to call on another thread while the UI edits."""
+        with self._lock:
+            return TaskList(list(self._texts), bytearray(self._done))
+
+    def take_copy(self) -> "TaskList":
+        """copy() that also becomes the base of the next take_change()."""
+        with self._lock:
+            self._change = None
+            return TaskList(list(self._texts), bytearray(self._done))
+
+    def take_change(self) -> tuple[int, int, list[str]] | None:
+        """
+        Lines changed since the last take_copy()/take_change() as one replacement
+        of the list as it was then: (first, old_count, new_lines); None if unchanged.
+        """
+        with self._lock:
+            change, self._change = self._change, None
+            if change is None:
+                return None
+            first, old_count, new_count = change
+            # Changed lines are parsed; a lazy list's lines() would take the lock again.
+            return first, old_count, list(TaskList.lines(self, first, first + new_count))
+
+    def _note_change(self, first: int, old_count: int, new_count: int) -> None:
+        """Lines [first, first + old_count) became new_count lines (lock held)."""
+        if self._change is None:
+            self._change = (first, old_count, new_count)
+            return
+        lo, base_count, cur_count = self._change
+        # Union in current line numbers; lines after the range shift by the
+        # range's growth, so the end maps back to the base with that offset.
+        start = min(lo, first)
+        end = max(lo + cur_count, first + old_count)
+        self._change = (
+            start, end - cur_count + base_count - start, end - old_count + new_count - start
+        )
+
+    # --- lazy loading (a plain TaskList is always fully loaded) ---
+
+    @property
+    def loaded(self) -> int:
+        """Tasks parsed so far; any others follow them in file order."""
+        return len(self._texts)
+
+    def load_more(self) -> bool:
+        """Parse the next part of a lazily loaded list. False when nothing is left."""
+        return False
+
+    def ensure_loaded(self, stop: int) -> None:
+        """Parse at least the first `stop` tasks (or all of them)."""
+        while len(self._texts) < stop and self.load_more():
+            pass
+
+    # --- access ---
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __iter__(self) -> Iterator[tuple[str, bool]]:
+        for t, d in zip(self._texts, self._done):
+            yield t, bool(d)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TaskList):
+            return NotImplemented
+        return self._texts == other._texts and self._done == other._done
+
+    def text(self, i: int) -> str:
+        return self._texts[i]
+
+    def is_done(self, i: int) -> bool:
+        return bool(self._done[i])
+
+    def is_pending(self, i: int) -> bool:
+        """Not done and non-empty: can be the active task."""
+        return not self._done[i] and bool(self._texts[i].strip())
+
+    @property
+    def total(self) -> int:
+        return len(self._texts)
+
+    def pending_bits(self, start: int = 0, stop: int | None = None) -> bytearray:
+        """1 per pending task in [start, stop), 0 otherwise. stop defaults to `loaded`."""
+        texts, done = self._texts, self._done
+        stop = len(texts) if stop is None else min(stop, len(texts))
+        return bytearray(
+            not done[i] and bool(texts[i].strip()) for i in range(start, stop)
+        )
+
+    # --- mutation ---
+
+    def set_done(self, i: int, done: bool) -> None:
+        if bool(self._done[i]) != done:
+            with self._lock:
+                self._done[i] = done
+                self.done_count += 1 if done else -1
+                self._note_change(i, 1, 1)
+
+    def set_text(self, i: int, text: str) -> None:
+        with self._lock:
+            self._texts[i] = text
+            self._note_change(i, 1, 1)
+
+    def replace_lines(self, first: int, old_count: int, new_lines: list[str]) -> None:
+        """Lines [first, first + old_count) replaced by parsed new_lines."""
+        end = first + old_count
+        texts: list[str] = []
+        done = bytearray()
+        for line in new_lines:
+            t, d = parse_task_line(line)
+            texts.append(t)
+            done.append(d)
+        with self._lock:
+            self.done_count += done.count(1) - self._done[first:end].count(1)
+            self._texts[first:end] = texts
+            self._done[first:end] = done
+            self._note_change(first, old_count, len(texts))
+
+
+# [END SPEC:POMODORO-10:TASK_LIST]
+
+
+# [START SPEC:POMODORO-11:PENDING_INDEX]
+# req_refs: REQ-POMODORO-11-01, REQ-POMODORO-11-02, REQ-POMODORO-11-03
+def _fw_build(values: list[int]) -> list[int]:
+    """Fenwick tree (1-based) over values in O(n)."""
+    tree = [0] + values
+    n = len(values)
+    for i in range(1, n + 1):
+        j = i + (i & -i)
+        if j <= n:
+            tree[j] += tree[i]
+    return tree
+
+
+def _fw_add(tree: list[int], pos: int, delta: int) -> None:
+    """values[pos] += delta (pos 0-based)."""
+    i = pos + 1
+    n = len(tree) - 1
+    while i <= n:
+        tree[i] += delta
+        i += i & -i
+
+
+def _fw_prefix(tree: list[int], count: int) -> int:
+    """Sum of the first `count` values."""
+    total = 0
+    i = count
+    while i > 0:
+        total += tree[i]
+        i -= i & -i
+    return total
+
+
+def _fw_search(tree: list[int], k: int) -> tuple[int, int]:
+    """
+    Smallest 0-based pos whose prefix sum reaches k (k >= 1).
+    Returns (pos, k - prefix(pos)), i.e. the 1-based rank inside values[pos].
+    """
+    n = len(tree) - 1
+    pos = 0
+    step = 1 << (n.bit_length() - 1) if n else 0
+    while step:
+        nxt = pos + step
+        if nxt <= n and tree[nxt] < k:
+            pos = nxt
+            k -= tree[nxt]
+        step >>= 1
+    return pos, k
+
+
+class PendingIndex:
+    """
+    Ordered index of pending task positions: "pending" bits kept in blocks of
+    ~BLOCK lines, with Fenwick trees over block sizes and block pending counts.
+    Flipping a bit (ticking a task) is O(log n); finding the k-th pending task
+    is O(log n) plus a C-level find inside one block. Inserting/deleting lines
+    touches one block; the block-level trees are rebuilt only when blocks
+    split or vanish (O(n / BLOCK)).
+    """
+
+    BLOCK = 512
+
+    def __init__(self, bits: bytearray | None = None) -> None:
+        bits = bits or bytearray()
+        step = self.BLOCK
+        self._blocks = [bits[i : i + step] for i in range(0, len(bits), step)]
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        if not self._blocks:
+            self._blocks = [bytearray()]
+        self._sizes = [len(b) for b in self._blocks]
+        self._counts = [b.count(1) for b in self._blocks]
+        self._size_fw = _fw_build(self._sizes)
+        self._pend_fw = _fw_build(self._counts)
+        self._len = sum(self._sizes)
+        self._pending = sum(self._counts)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def pending_count(self) -> int:
+        return self._pending
+
+    def _locate(self, i: int) -> tuple[int, int]:
+        """Line i -> (block, offset). i == len() maps to the end of the last block."""
+        if i >= self._len:
+            last = len(self._blocks) - 1
+            return last, len(self._blocks[last])
+        block, rank = _fw_search(self._size_fw, i + 1)
+        return block, rank - 1
+
+    def set(self, i: int, pending: bool) -> None:
+        """Flip one position in place. O(log n)."""
+        block, off = self._locate(i)
+        blk = self._blocks[block]
+        if bool(blk[off]) == pending:
+            return
+        blk[off] = pending
+        delta = 1 if pending else -1
+        self._counts[block] += delta
+        _fw_add(self._pend_fw, block, delta)
+        self._pending += delta
+
+    def kth(self, k: int) -> int | None:
+        """Position of the k-th (0-based) pending task, or None."""
+        if k < 0 or k >= self._pending:
+            return None
+        block, rank = _fw_search(self._pend_fw, k + 1)
+        blk = self._blocks[block]
+        off = -1
+        for _ in range(rank):
+            off = blk.find(1, off + 1)
+        return _fw_prefix(self._size_fw, block) + off
+
+    def first(self) -> int | None:
+        return self.kth(0)
+
+    def upcoming(self, count: int) -> list[int]:
+        """Positions of the first `count` pending tasks, in order."""
+        out: list[int] = []
+        start = self.first()
+        if start is None:
+            return out
+        block, off = self._locate(start)
+        base = _fw_prefix(self._size_fw, block)
+        while len(out) < count and block < len(self._blocks):
+            blk = self._blocks[block]
+            off = blk.find(1, off)
+            if off < 0:
+                base += len(blk)
+                block += 1
+                off = 0
+                continue
+            out.append(base + off)
+            off += 1
+        return out
+
+    def replace(self, first: int, old_count: int, new_bits: bytearray) -> None:
+        """Positions [first, first + old_count) replaced by new_bits."""
+        if old_count == len(new_bits):
+            for k, bit in enumerate(new_bits):
+                self.set(first + k, bool(bit))
+            return
+        start_block, start_off = self._locate(first)
+        block, off = start_block, start_off
+        remaining = old_count
+        while remaining > 0 and block < len(self._blocks):
+            blk = self._blocks[block]
+            take = min(remaining, len(blk) - off)
+            del blk[off : off + take]
+            remaining -= take
+            block += 1
+            off = 0
+        blk = self._blocks[start_block]
+        blk[start_off:start_off] = new_bits
+        if block - start_block <= 1 and 0 < len(blk) <= 2 * self.BLOCK:
+            # Only one block changed: point-update the block-level trees.
+            size_delta = len(blk) - self._sizes[start_block]
+            pend_delta = blk.count(1) - self._counts[start_block]
+            self._sizes[start_block] += size_delta
+            self._counts[start_block] += pend_delta
+            _fw_add(self._size_fw, start_block, size_delta)
+            _fw_add(self._pend_fw, start_block, pend_delta)
+            self._len += size_delta
+            self._pending += pend_delta
+            return
+        # Blocks emptied or overgrown: re-split and rebuild the block-level trees.
+        step = self.BLOCK
+        blocks: list[bytearray] = []
+        for b in self._blocks:
+            if len(b) > 2 * step:
+                blocks.extend(b[i : i + step] for i in range(0, len(b), step))
+            elif b:
+                blocks.append(b)
+        self._blocks = blocks
+        self._rebuild()
+
+
+# [END SPEC:POMODORO-11:PENDING_INDEX]
+
+
+# [START SPEC:POMODORO-9:TASK_MODEL]
+# req_refs: REQ-POMODORO-9-01, REQ-POMODORO-9-02, REQ-POMODORO-9-03, REQ-POMODORO-11-04, REQ-POMODORO-13-02,
+#   REQ-POMODORO-16-03
+class TaskModel:
+    """
+    One task per editor line. replace_lines() applies an edit in O(changed lines):
+    done/total counters and the active index (first pending non-empty task,
+    kept in a PendingIndex) are updated without re-parsing the buffer.
+    load_text() is the full fallback.
+    """
+
+    def __init__(self, tasks: TaskList | None = None) -> None:
+        self.tasks = TaskList()
+        self._index = PendingIndex()
+        self.full_parses = 0
+        self.incremental_updates = 0
+        self.reset(tasks or TaskList())
+
+    def reset(self, tasks: TaskList) -> None:
+        """Adopt a task list (e.g. from load_config). O(loaded tasks)."""
+        self.tasks = tasks
+        self._index = PendingIndex(tasks.pending_bits())
+
+    def load_more(self) -> bool:
+        """Parse the next chunk of a lazily loaded list. False when fully loaded."""
+        more = self.tasks.load_more()
+        self._catch_up()
+        return more
+
+    def _catch_up(self) -> None:
+        """Index tasks parsed since the last call (lazy lists load on access)."""
+        n, m = len(self._index), self.tasks.loaded
+        if m > n:
+            self._index.replace(n, 0, self.tasks.pending_bits(n, m))
+
+    def load_text(self, text: str) -> None:
+        """Full re-parse of the editor text (fallback path)."""
+        self.full_parses += 1
+        self.reset(TaskList.from_text(text))
+
+    def adopt(self, parsed: "tuple[TaskList, PendingIndex]") -> None:
+        """Take a list and its index built elsewhere (parse_text on a worker thread)."""
+        self.full_parses += 1
+        self.tasks, self._index = parsed
+
+    @staticmethod
+    def parse_text(text: str) -> "tuple[TaskList, PendingIndex]":
+        """Full parse without touching any model: safe to run off the UI thread."""
+        tasks = TaskList.from_text(text)
+        return tasks, PendingIndex(tasks.pending_bits())
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def done_count(self) -> int:
+        return self.tasks.done_count
+
+    @property
+    def active_index(self) -> int | None:
+        """First pending non-empty task. O(log n); parses lazily loaded chunks only until found."""
+        self._catch_up()
+        idx = self._index.first()
+        while idx is None and self.load_more():
+            idx = self._index.first()
+        return idx
+
+    def active_text(self) -> str:
+        idx = self.active_index
+        if idx is None:
+            return ""
+        return self.tasks.text(idx)
+
+    def upcoming(self, count: int) -> list[int]:
+        """Indexes of the next `count` pending tasks, active first."""
+        self._catch_up()
+        while self._index.pending_count < count and self.load_more():
+            pass
+        return self._index.upcoming(count)
+
+    def replace_lines(self, first: int, old_count: int, new_lines: list[str]) -> None:
+        """
+        Lines [first, first + old_count) were replaced by new_lines (0-based).
+        Pre: 0 <= first <= total; first + old_count <= total.
+        """
+        self.incremental_updates += 1
+        self.tasks.ensure_loaded(first + old_count)
+        self._catch_up()
+        self.tasks.replace_lines(first, old_count, new_lines)
+        bits = self.tasks.pending_bits(first, first + len(new_lines))
+        self._index.replace(first, old_count, bits)
+
+    def set_done(self, i: int, done: bool) -> None:
+        """Tick / untick one task; the pending index is updated in O(log n)."""
+        self.tasks.ensure_loaded(i + 1)
+        self._catch_up()
+        self.tasks.set_done(i, done)
+        self._index.set(i, self.tasks.is_pending(i))
+
+
+# [END SPEC:POMODORO-9:TASK_MODEL]
@@ -0,0 +1,170 @@
+"""Deadline-based countdown: remaining time from a monotonic clock, drift/jitter stats."""
+# [START SPEC:POMODORO-5:TICKER]
+# req_refs: REQ-POMODORO-5-01, REQ-POMODORO-5-02, REQ-POMODORO-5-03, REQ-POMODORO-5-04
+
+import math
+import time
+from typing import Callable
+
+# Wake up slightly after the second boundary so the display has already flipped.
+WAKE_MARGIN_MS = 2
+
+
+def whole_seconds(remaining: float) -> int:
+    """Seconds shown on the clock: 1499.2 s left -> 1500 (still '25:00')."""
+    return max(0, math.ceil(remaining - 1e-9))
+
+
+class VirtualClock:
+    """
+    Manually advanced monotonic clock for simulations and benchmarks.
+    Usage: clock = VirtualClock(); clock.advance(1.5); clock() -> 1.5.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += max(0.0, seconds)
+
+
+class TickStats:
+    """Lag of each wakeup (actual - scheduled) and end-of-phase error, in ms."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.wakeups = 0
+        self.skipped_seconds = 0
+        self.max_lag_ms = 0.0
+        self.last_end_error_ms = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def record_lag(self, lag_ms: float) -> None:
+        # Welford: running mean/variance without keeping samples.
+        self.wakeups += 1
+        delta = lag_ms - self._mean
+        self._mean += delta / self.wakeups
+        self._m2 += delta * (lag_ms - self._mean)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    @property
+    def mean_lag_ms(self) -> float:
+        return self._mean
+
+    @property
+    def jitter_ms(self) -> float:
+        """Standard deviation of wakeup lag."""
+        if self.wakeups < 2:
+            return 0.0
+        return math.sqrt(self._m2 / (self.wakeups - 1))
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "wakeups": self.wakeups,
+            "skipped_seconds": self.skipped_seconds,
+            "mean_lag_ms": round(self.mean_lag_ms, 3),
+            "jitter_ms": round(self.jitter_ms, 3),
+            "max_lag_ms": round(self.max_lag_ms, 3),
+            "last_end_error_ms": round(self.last_end_error_ms, 3),
+        }
+
+
+class DeadlineTicker:
+    """
+    Countdown driven by a deadline instead of decrementing per callback.
+    Late callbacks never accumulate: remaining() always reads the clock.
+    Pre: clock is monotonic (time.monotonic or VirtualClock).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._deadline: float | None = None
+        self._expected: float | None = None
+        self._last_shown: int | None = None
+        self.stats = TickStats()
+
+    @property
+    def running(self) -> bool:
+        return self._deadline is not None
+
+    @property
+    def deadline(self) -> float | None:
+        return self._deadline
+
+    def start(self, seconds: float) -> None:
+        """Arm the deadline `seconds` from now. Post: running is True."""
+        self._deadline = self._clock() + max(0.0, seconds)
+        self._expected = None
+        self._last_shown = whole_seconds(seconds)
+
+    def stop(self) -> float:
+        """Disarm and return the (fractional) seconds that were left."""
+        left = self.remaining()
+        self._deadline = None
+        self._expected = None
+        return left
+
+    def remaining(self) -> float:
+        if self._deadline is None:
+            return 0.0
+        return max(0.0, self._deadline - self._clock())
+
+    def next_delay_ms(self) -> int:
+        """
+        Delay until the display should next change (next whole-second boundary
+        of the remaining time), plus a small margin. Post: expected wakeup is recorded.
+        """
+        left = self.remaining()
+        frac = left - math.floor(left)
+        if frac <= 1e-6:
+            frac = 1.0 if left > 0 else 0.0
+        delay_ms = math.ceil(frac * 1000) + WAKE_MARGIN_MS
+        self._expected = self._clock() + delay_ms / 1000.0
+        return delay_ms
+
+    # [START SPEC:POMODORO-21:TICKER_DEADLINE]
+    # req_refs: REQ-POMODORO-21-02
+    def deadline_delay_ms(self) -> int:
+        """
+        Delay until the phase ends (plus margin): one wakeup instead of one per
+        second while nothing is shown. The seconds skipped on purpose are not
+        counted as stalls at the next wakeup.
+        """
+        delay_ms = math.ceil(self.remaining() * 1000) + WAKE_MARGIN_MS
+        self._expected = self._clock() + delay_ms / 1000.0
+        self._last_shown = None
+        return delay_ms
+
+    # [END SPEC:POMODORO-21:TICKER_DEADLINE]
+
+    def on_wakeup(self) -> int:
+        """
+        Call at the start of each scheduled callback. Records lag against the
+        expected wakeup and returns the whole seconds to display.
+        """
+        now = self._clock()
+        if self._expected is not None:
+            self.stats.record_lag(max(0.0, now - self._expected) * 1000.0)
+            self._expected = None
+        shown = whole_seconds(self.remaining())
+        if self._last_shown is not None and self._last_shown - shown > 1:
+            # Stall: catch up by jumping over the missed seconds.
+            self.stats.skipped_seconds += self._last_shown - shown - 1
+        self._last_shown = shown
+        return shown
+
+    def finish(self) -> None:
+        """Record how late the phase ended relative to its deadline, then disarm."""
+        if self._deadline is not None:
+            self.stats.last_end_error_ms = (self._clock() - self._deadline) * 1000.0
+        self._deadline = None
+        self._expected = None
+
+
+# [END SPEC:POMODORO-5:TICKER]
@@ -1,53 +1,13 @@
-"""Play sound and flash taskbar on timer end (Windows)."""
+"""Draw attention to the overlay on timer end: taskbar flash (Windows), urgency hint (X11)."""
 
-import sys
 import tkinter as tk
-from pathlib import Path
 from typing import Any
 
-_PKG_DIR = Path(__file__).resolve().parent.parent
-
-
-def _sound_candidates() -> list[Path]:
-    """sound.mp3: when frozen (exe) use sys._MEIPASS, else package or project root."""
-    paths: list[Path] = []
-    meipass: str | None = getattr(sys, "_MEIPASS", None)
-    if getattr(sys, "frozen", False) and meipass is not None:
-        paths.append(Path(meipass) / "sound.mp3")
-    paths.extend([
-        _PKG_DIR / "sound.mp3",
-        _PKG_DIR.parent.parent / "sound.mp3",
-    ])
-    return paths
-
-
-def _find_sound() -> Path | None:
-    for p in _sound_candidates():
-        if p.is_file():
-            return p
-    return None
-
-
-def play_sound() -> None:
-    """Play sound.mp3 if present (Windows MCI). Close alias before reopen so repeat plays."""
-    path = _find_sound()
-    if path is None:
-        return
-    try:
-        import ctypes
-
-        winmm = ctypes.windll.winmm
-        alias = "pomodoro_snd"
-        winmm.mciSendStringW(f"close {alias}", None, 0, None)
-        path_str = str(path.resolve())
-        cmd_open = f'open "{path_str}" type mpegvideo alias {alias}'
-        buf = ctypes.create_unicode_buffer(256)
-        err = winmm.mciSendStringW(cmd_open, buf, len(buf), None)
-        if err != 0:
-            return
-        winmm.mciSendStringW(f"play {alias}", None, 0, None)
-    except Exception:
-        pass
+# XWMHints.flags bit for the urgency hint (Xutil.h XUrgencyHint).
+_X_URGENCY_HINT = 1 << 8
+# Roots whose <FocusIn> already clears the urgency hint / that have it set now.
+_urgency_bound: set[str] = set()
+_urgent: set[str] = set()
 
 
 def flash_taskbar(hwnd: int, count: int = 3) -> None:
@@ -80,12 +40,88 @@ def flash_taskbar(hwnd: int, count: int = 3) -> None:
         pass
 
 
-def notify_timer_end(root: Any) -> None:
-    """Play sound and flash taskbar 3 times. root is tk.Tk()."""
-    play_sound()
+# [START SPEC:POMODORO-26:ATTENTION]
+# req_refs: REQ-POMODORO-26-02
+def set_urgency_hint(root: Any, urgent: bool) -> None:
+    """X11: set/clear UrgencyHint in WM_HINTS of the toplevel's frame (taskbar highlight)."""
+    try:
+        import ctypes
+        import ctypes.util
+
+        lib = ctypes.util.find_library("X11")
+        if lib is None:
+            return
+        x11 = ctypes.CDLL(lib)
+
+        class XWMHints(ctypes.Structure):
+            _fields_ = [
+                ("flags", ctypes.c_long),
+                ("input", ctypes.c_int),
+                ("initial_state", ctypes.c_int),
+                ("icon_pixmap", ctypes.c_ulong),
+                ("icon_window", ctypes.c_ulong),
+                ("icon_x", ctypes.c_int),
+                ("icon_y", ctypes.c_int),
+                ("icon_mask", ctypes.c_ulong),
+                ("window_group", ctypes.c_ulong),
+            ]
+
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XGetWMHints.restype = ctypes.POINTER(XWMHints)
+        x11.XGetWMHints.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        x11.XSetWMHints.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(XWMHints)]
+        x11.XFree.argtypes = [ctypes.c_void_p]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        window = int(root.wm_frame(), 16)
+        display = x11.XOpenDisplay(None)
+        if not display:
+            return
+        try:
+            hints = XWMHints()
+            current = x11.XGetWMHints(display, window)
+            if current:
+                ctypes.pointer(hints)[0] = current[0]
+                x11.XFree(current)
+            if urgent:
+                hints.flags |= _X_URGENCY_HINT
+            else:
+                hints.flags &= ~_X_URGENCY_HINT
+            x11.XSetWMHints(display, window, ctypes.byref(hints))
+            x11.XFlush(display)
+        finally:
+            x11.XCloseDisplay(display)
+    except (OSError, ValueError, AttributeError, tk.TclError):
+        pass
+
+
+def _clear_urgency(root: Any) -> None:
+    if str(root) in _urgent:
+        _urgent.discard(str(root))
+        set_urgency_hint(root, False)
+
+
+def flash_window(root: Any) -> None:
+    """
+    UI thread: flash the taskbar button 3 times (Windows) or set the X11
+    urgency hint until the overlay gets focus. root is tk.Tk().
+    """
     try:
-        hwnd = root.winfo_id()
-        if hwnd:
-            flash_taskbar(hwnd, 3)
+        system = root.tk.call("tk", "windowingsystem")
+        if system == "win32":
+            hwnd = root.winfo_id()
+            if hwnd:
+                flash_taskbar(hwnd, 3)
+        elif system == "x11":
+            key = str(root)
+            if key not in _urgency_bound:
+                _urgency_bound.add(key)
+                root.bind("<FocusIn>", lambda e: _clear_urgency(root), add="+")
+            _urgent.add(key)
+            set_urgency_hint(root, True)
     except (tk.TclError, AttributeError):
         pass
+
+
+# [END SPEC:POMODORO-26:ATTENTION]
@@ -1,7 +1,7 @@
 """Rounded button (Canvas-based) for light/dark theme."""
 
 import tkinter as tk
-from typing import Callable
+from typing import Callable, Mapping
 
 RADIUS = 8
 
@@ -15,6 +15,7 @@ def _rounded_rect(
     r: int,
     fill: str = "",
     outline: str = "",
+    tags: str = "",
 ) -> list[int]:
     """Create rounded rectangle on canvas. Returns created item ids."""
     ids: list[int] = []
@@ -29,6 +30,7 @@ def _rounded_rect(
             extent=90,
             fill=fill,
             outline=outline,
+            tags=tags,
         )
     )
     ids.append(
@@ -41,6 +43,7 @@ def _rounded_rect(
             extent=90,
             fill=fill,
             outline=outline,
+            tags=tags,
         )
     )
     ids.append(
@@ -53,6 +56,7 @@ def _rounded_rect(
             extent=90,
             fill=fill,
             outline=outline,
+            tags=tags,
         )
     )
     ids.append(
@@ -65,19 +69,28 @@ def _rounded_rect(
             extent=90,
             fill=fill,
             outline=outline,
+            tags=tags,
         )
     )
     ids.append(
-        canvas.create_rectangle(x1 + r, y1, x2 - r, y2, fill=fill, outline=outline)
+        canvas.create_rectangle(x1 + r, y1, x2 - r, y2, fill=fill, outline=outline, tags=tags)
     )
     ids.append(
-        canvas.create_rectangle(x1, y1 + r, x2, y2 - r, fill=fill, outline=outline)
+        canvas.create_rectangle(x1, y1 + r, x2, y2 - r, fill=fill, outline=outline, tags=tags)
     )
     return ids
 
 
+# Canvas tag shared by the six shape items: one itemconfig recolors the whole button.
+SHAPE_TAG = "shape"
+
+
 class RoundedButton(tk.Canvas):
-    """Clickable rounded button. Use config(background=..., ...) and apply_theme(colors)."""
+    """
+    Clickable rounded button. Use config(background=..., ...) and apply_theme(colors).
+    Canvas items are created once; text/color changes mutate them with itemconfig,
+    and only when the shown value actually changes.
+    """
 
     def __init__(
         self,
@@ -97,22 +110,28 @@ class RoundedButton(tk.Canvas):
         self._radius = radius
         self._command = command
         self._text = text
-        self._rect_ids: list[int] = []
-        self._text_id: int | None = None
         self._bg = "#e8e8e8"
         self._fg = "#1a1a1a"
+        self._active_bg = self._bg
+        self._canvas_bg: str | None = None
+        self._hover = False
         self._disabled = False
+        self.items_created = 0
+        self.itemconfig_calls = 0
+        self.updates_skipped = 0
+        self._rect_ids: list[int] = []
+        self._text_id = 0
         self._draw()
+        self._shown = (self._bg, self._fg, self._text)
         if command is not None:
             self.bind("<Button-1>", self._on_click)
             self.bind("<Enter>", self._on_enter)
             self.bind("<Leave>", self._on_leave)
-        self._hover = False
 
     # [START SPEC:POMODORO-3:NO_CLIP]
     # req_refs: REQ-POMODORO-3-04
     def _draw(self) -> None:
-        self.delete("all")
+        """Create the canvas items (once, from __init__)."""
         # Draw to (width, height) so full rect is inside (width+1)x(height+1) canvas
         self._rect_ids = _rounded_rect(
             self,
@@ -123,6 +142,7 @@ class RoundedButton(tk.Canvas):
             self._radius,
             fill=self._bg,
             outline="",
+            tags=SHAPE_TAG,
         )
         self._text_id = self.create_text(
             (self._width + 1) // 2,
@@ -131,34 +151,66 @@ class RoundedButton(tk.Canvas):
             fill=str(self._fg),
             font=("Segoe UI", 10),
         )
+        self.items_created += len(self._rect_ids) + 1
 
     # [END SPEC:POMODORO-3:NO_CLIP]
 
+    # [START SPEC:POMODORO-19:BUTTON_ITEMS]
+    # req_refs: REQ-POMODORO-19-01, REQ-POMODORO-19-02
+    def _sync(self) -> None:
+        """Push fill / text color / label to the existing items where they differ."""
+        fill = self._active_bg if self._hover else self._bg
+        shown_fill, shown_fg, shown_text = self._shown
+        if (fill, self._fg, self._text) == self._shown:
+            self.updates_skipped += 1
+            return
+        if fill != shown_fill:
+            self.itemconfig(SHAPE_TAG, fill=fill)
+            self.itemconfig_calls += 1
+        if self._fg != shown_fg or self._text != shown_text:
+            self.itemconfig(self._text_id, fill=self._fg, text=self._text)
+            self.itemconfig_calls += 1
+        self._shown = (fill, self._fg, self._text)
+
+    def set_text(self, text: str) -> None:
+        self._text = text
+        self._sync()
+
+    def set_fill(self, bg: str) -> None:
+        """Base fill (e.g. highlighted tab); hover still shows the active color."""
+        self._bg = bg
+        self._sync()
+
+    def render_stats(self) -> dict[str, int]:
+        return {
+            "items_created": self.items_created,
+            "itemconfig_calls": self.itemconfig_calls,
+            "updates_skipped": self.updates_skipped,
+        }
+
+    # [END SPEC:POMODORO-19:BUTTON_ITEMS]
+
     def _on_click(self, _event: tk.Event) -> None:
         if self._command is not None:
             self._command()
 
     def _on_enter(self, _event: tk.Event) -> None:
         self._hover = True
-        self._update_fill()
+        self._sync()
 
     def _on_leave(self, _event: tk.Event) -> None:
         self._hover = False
-        self._update_fill()
-
-    def _update_fill(self) -> None:
-        fill = getattr(self, "_btn_active", self._bg) if self._hover else self._bg
-        for iid in self._rect_ids:
-            self.itemconfig(iid, fill=fill)
+        self._sync()
 
-    def apply_theme(self, colors: dict) -> None:
+    def apply_theme(self, colors: Mapping[str, str]) -> None:
         self._bg = str(colors.get("btn_bg", self._bg))
         self._fg = str(colors.get("btn_fg", self._fg))
-        self._btn_active = str(colors.get("btn_active", self._bg))
-        self.configure(bg=str(colors.get("bg", self._bg)))
-        self._draw()
-        if self._text_id is not None:
-            self.itemconfig(self._text_id, fill=self._fg)
+        self._active_bg = str(colors.get("btn_active", self._bg))
+        canvas_bg = str(colors.get("bg", self._bg))
+        if canvas_bg != self._canvas_bg:
+            self._canvas_bg = canvas_bg
+            self.configure(bg=canvas_bg)
+        self._sync()
 
     def enable(self, disabled: bool) -> None:
         """Disable button if disabled=True, enable if disabled=False."""
@@ -1,16 +1,25 @@
-"""Settings: alpha, work/break durations, theme toggle; save on change; theme."""
+"""Settings: alpha, work/break durations, theme choice; save on change; theme."""
 # [START SPEC:POMODORO-1:SETTINGS]
 # [START SPEC:POMODORO-2:SETTINGS]
 # req_refs: REQ-POMODORO-2-04
 
 import tkinter as tk
-from typing import Callable
+from typing import Callable, Sequence
+
+from pomodoro.coalesce import Coalescer
+from pomodoro.ui.theme import ThemeEngine
+
+# Coalescer key: FocusOut / Return / KeyRelease of the duration entries.
+WORK_BREAK_KEY = "settings-work-break"
+# Captions of the built-in palettes, in radio order; custom themes show their file name.
+THEME_LABELS = {"dark": "Тёмная", "light": "Светлая"}
 
 
 class SettingsWidget:
     """
-    Controls for transparency, timer durations, and theme (light/dark).
-    Persists on change. apply_theme(colors) for dark/light.
+    Controls for transparency, timer durations, and theme (one radio per
+    palette in `themes`, i.e. ThemeEngine.names: built-ins and themes/*.json).
+    Persists on change. register_theme(engine) for the palette itself.
     """
 
     def __init__(
@@ -22,6 +31,8 @@ class SettingsWidget:
         on_theme_changed: Callable[[], None] | None = None,
         on_work_break_changed: Callable[[], None] | None = None,
         on_select_mode: Callable[[str], None] | None = None,
+        coalescer: Coalescer | None = None,
+        themes: Sequence[str] = ("dark", "light"),
     ) -> None:
         self._config = config
         self._save = save_callback
@@ -33,6 +44,7 @@ class SettingsWidget:
         frame = tk.LabelFrame(parent, text="Настройки", padx=4, pady=4)
         frame.pack(fill=tk.X, padx=8, pady=4)
         self._frame = frame
+        self._coalescer = coalescer or Coalescer(lambda fn: frame.after_idle(fn))
 
         # Рабочий интервал и перерыв (сверху)
         row1 = tk.Frame(frame)
@@ -41,9 +53,8 @@ class SettingsWidget:
         self._work_var = tk.StringVar(value=str(config.get("work_minutes", 25)))
         work_entry = tk.Entry(row1, textvariable=self._work_var, width=6)
         work_entry.pack(side=tk.LEFT, padx=4)
-        work_entry.bind("<FocusOut>", lambda e: self._apply_work_break())
-        work_entry.bind("<Return>", lambda e: self._apply_work_break())
-        work_entry.bind("<KeyRelease>", lambda e: self._apply_work_break())
+        for seq in ("<FocusOut>", "<Return>", "<KeyRelease>"):
+            work_entry.bind(seq, self._on_work_break_event)
         work_entry.bind("<FocusIn>", lambda e: self._on_select_mode("work"))
 
         tk.Label(row1, text="Перерыв (мин):", anchor=tk.W).pack(
@@ -52,9 +63,8 @@ class SettingsWidget:
         self._break_var = tk.StringVar(value=str(config.get("break_minutes", 5)))
         break_entry = tk.Entry(row1, textvariable=self._break_var, width=6)
         break_entry.pack(side=tk.LEFT, padx=4)
-        break_entry.bind("<FocusOut>", lambda e: self._apply_work_break())
-        break_entry.bind("<Return>", lambda e: self._apply_work_break())
-        break_entry.bind("<KeyRelease>", lambda e: self._apply_work_break())
+        for seq in ("<FocusOut>", "<Return>", "<KeyRelease>"):
+            break_entry.bind(seq, self._on_work_break_event)
         break_entry.bind("<FocusIn>", lambda e: self._on_select_mode("break"))
         self._row1 = row1
         self._work_entry = work_entry
@@ -80,29 +90,26 @@ class SettingsWidget:
         self._row0 = row0
         self._scale = scale
 
-        # Тема: светлая / тёмная
+        # Тема: встроенные и свои (themes/*.json)
         row_theme = tk.Frame(frame)
         row_theme.pack(fill=tk.X, pady=2)
         tk.Label(row_theme, text="Тема:", width=14, anchor=tk.W).pack(side=tk.LEFT)
-        self._theme_var = tk.StringVar(value=config.get("theme", "light"))
-        dark_btn = tk.Radiobutton(
-            row_theme,
-            text="Тёмная",
-            variable=self._theme_var,
-            value="dark",
-            command=self._on_theme_sel,
-        )
-        dark_btn.pack(side=tk.LEFT, padx=4)
-        light_btn = tk.Radiobutton(
-            row_theme,
-            text="Светлая",
-            variable=self._theme_var,
-            value="light",
-            command=self._on_theme_sel,
-        )
-        light_btn.pack(side=tk.LEFT, padx=4)
+        names = [n for n in THEME_LABELS if n in themes]
+        names += [n for n in themes if n not in THEME_LABELS]
+        theme = config.get("theme", "light")
+        self._theme_var = tk.StringVar(value=theme if theme in names else "light")
+        self._theme_btns: list[tk.Radiobutton] = []
+        for name in names:
+            btn = tk.Radiobutton(
+                row_theme,
+                text=THEME_LABELS.get(name, name),
+                variable=self._theme_var,
+                value=name,
+                command=self._on_theme_sel,
+            )
+            btn.pack(side=tk.LEFT, padx=4)
+            self._theme_btns.append(btn)
         self._theme_row = row_theme
-        self._theme_btns = [dark_btn, light_btn]
 
     def _on_theme_sel(self) -> None:
         self._config["theme"] = self._theme_var.get()
@@ -115,6 +122,14 @@ class SettingsWidget:
         self._set_alpha(a)
         self._save()
 
+    # [START SPEC:POMODORO-17:SETTINGS_COALESCE]
+    # req_refs: REQ-POMODORO-17-03
+    def _on_work_break_event(self, _event: tk.Event) -> None:
+        """All entry events of one burst apply the durations once."""
+        self._coalescer.schedule(WORK_BREAK_KEY, self._apply_work_break)
+
+    # [END SPEC:POMODORO-17:SETTINGS_COALESCE]
+
     def _apply_work_break(self) -> None:
         try:
             w = int(self._work_var.get())
@@ -127,31 +142,25 @@ class SettingsWidget:
         except ValueError:
             pass
 
-    def apply_theme(self, colors: dict) -> None:
-        bg = str(colors.get("frame_bg", "#f5f5f5"))
-        fg = str(colors.get("fg", "#1a1a1a"))
-        eb = str(colors.get("entry_bg", "#ffffff"))
-        pb = str(colors.get("progress_bg", "#e0e0e0"))
-        self._frame["bg"] = bg
+    # [START SPEC:POMODORO-18:SETTINGS_THEME]
+    # req_refs: REQ-POMODORO-18-01
+    def register_theme(self, theme: ThemeEngine) -> None:
+        """Register every settings widget once by role."""
         # [START SPEC:POMODORO-3:SETTINGS_FG] req_refs: REQ-POMODORO-3-05
-        self._frame["fg"] = fg
+        theme.register(self._frame, "panel")
         # [END SPEC:POMODORO-3:SETTINGS_FG]
-        for w in (self._theme_row, self._row0, self._row1):
-            w["bg"] = bg
-        for b in self._theme_btns:
-            b["bg"] = bg
-            b["fg"] = fg
-            b["selectcolor"] = bg
-        self._scale["bg"] = bg
-        self._scale["fg"] = fg
-        self._scale["troughcolor"] = pb
-        self._work_entry.config(bg=eb, fg=fg, insertbackground=fg)
-        self._break_entry.config(bg=eb, fg=fg, insertbackground=fg)
         for row in (self._theme_row, self._row0, self._row1):
+            theme.register(row, "panel_surface")
             for c in row.winfo_children():
                 if isinstance(c, tk.Label):
-                    c["bg"] = bg
-                    c["fg"] = fg
+                    theme.register(c, "panel_label")
+        for b in self._theme_btns:
+            theme.register(b, "radio")
+        theme.register(self._scale, "scale")
+        theme.register(self._work_entry, "entry")
+        theme.register(self._break_entry, "entry")
+
+    # [END SPEC:POMODORO-18:SETTINGS_THEME]
 
 
 # [END SPEC:POMODORO-1:SETTINGS]
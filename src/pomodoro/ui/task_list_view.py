@@ -0,0 +1,237 @@
+"""Virtualized task list: only the visible rows of a large TaskModel are rendered."""
+# [START SPEC:POMODORO-12:VIRTUAL_LIST]
+# req_refs: REQ-POMODORO-12-01, REQ-POMODORO-12-02, REQ-POMODORO-12-03
+
+import tkinter as tk
+from tkinter import font as tkfont
+from typing import Callable, Mapping
+
+from pomodoro.task_model import TaskModel
+
+ROW_BUFFER = 2
+CHECK_WIDTH = 22
+CHECK_DONE = "☑"
+CHECK_OPEN = "☐"
+
+
+class VirtualTaskList:
+    """
+    Fixed pool of row widgets (visible rows + ROW_BUFFER) recycled while
+    scrolling; row texts are read from the model on demand.
+    Click on the box = tick/untick; double-click on the text = edit that one
+    row (Return/FocusOut = save, Escape = cancel, empty text = delete row).
+    Double-click below the last row appends a task. on_changed() after edits.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        model: TaskModel,
+        on_changed: Callable[[], None],
+        font: tuple = ("Segoe UI", 10),
+    ) -> None:
+        self._model = model
+        self._on_changed = on_changed
+        self._font = tkfont.Font(root=parent, font=font)
+        self._bold = tkfont.Font(root=parent, font=font)
+        self._bold.configure(weight="bold")
+        self._done_font = tkfont.Font(root=parent, font=font)
+        self._done_font.configure(overstrike=True)
+        self._row_h = self._font.metrics("linespace") + 6
+        self._top = 0
+        self._rows: list[tuple[tk.Label, tk.Label]] = []
+        self._editor: tk.Entry | None = None
+        self._edit_index: int | None = None
+        self._colors: Mapping[str, str] = {}
+
+        frame = tk.Frame(parent)
+        self._frame = frame
+        self._body = tk.Frame(frame, height=8 * self._row_h)
+        self._body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._scroll = tk.Scrollbar(frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self._scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self._body.bind("<Configure>", self._on_configure)
+        self._body.bind("<Double-Button-1>", lambda e: self._begin_edit(self._model.total))
+        self._bind_wheel(self._body)
+
+    @property
+    def frame(self) -> tk.Frame:
+        return self._frame
+
+    def set_model(self, model: TaskModel) -> None:
+        self._cancel_edit()
+        self._model = model
+        self._top = 0
+        self.render()
+
+    def contains_focus(self, focus: tk.Misc | None) -> bool:
+        return focus is not None and focus == self._editor
+
+    # --- layout / scrolling ---
+
+    def _visible_rows(self) -> int:
+        return max(1, self._body.winfo_height() // self._row_h)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        needed = max(1, event.height // self._row_h) + ROW_BUFFER
+        while len(self._rows) < needed:
+            self._rows.append(self._make_row(len(self._rows)))
+        while len(self._rows) > needed:
+            chk, lbl = self._rows.pop()
+            chk.destroy()
+            lbl.destroy()
+        self._scroll_to(self._top)
+
+    def _make_row(self, slot: int) -> tuple[tk.Label, tk.Label]:
+        y = slot * self._row_h
+        chk = tk.Label(self._body, font=self._font, anchor=tk.CENTER)
+        chk.place(x=0, y=y, width=CHECK_WIDTH, height=self._row_h)
+        lbl = tk.Label(self._body, font=self._font, anchor=tk.W, padx=2)
+        lbl.place(x=CHECK_WIDTH, y=y, relwidth=1.0, width=-CHECK_WIDTH, height=self._row_h)
+        chk.bind("<Button-1>", lambda e, s=slot: self._toggle(s))
+        lbl.bind("<Double-Button-1>", lambda e, s=slot: self._begin_edit(self._top + s))
+        self._bind_wheel(chk)
+        self._bind_wheel(lbl)
+        self._apply_row_colors(chk, lbl)
+        return chk, lbl
+
+    def _bind_wheel(self, widget: tk.Misc) -> None:
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", lambda e: self._scroll_to(self._top - 3))
+        widget.bind("<Button-5>", lambda e: self._scroll_to(self._top + 3))
+
+    def _on_wheel(self, event: tk.Event) -> None:
+        delta = getattr(event, "delta", 0)
+        step = -3 if delta > 0 else 3
+        self._scroll_to(self._top + step)
+
+    def _on_scrollbar(self, *args: str) -> None:
+        total = self._model.total
+        visible = self._visible_rows()
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * total))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                amount *= visible
+            self._scroll_to(self._top + amount)
+
+    def _scroll_to(self, top: int) -> None:
+        max_top = max(0, self._model.total - self._visible_rows() + 1)
+        top = max(0, min(top, max_top))
+        if top != self._top:
+            self._cancel_edit()
+        self._top = top
+        self.render()
+
+    # --- rendering ---
+
+    def render(self) -> None:
+        """Fill the row pool from the model window [top, top + rows)."""
+        tasks = self._model.tasks
+        total = len(tasks)
+        active = self._model.active_index
+        for slot, (chk, lbl) in enumerate(self._rows):
+            i = self._top + slot
+            if i < total:
+                done = tasks.is_done(i)
+                chk.config(text=CHECK_DONE if done else CHECK_OPEN)
+                font = self._done_font if done else self._bold if i == active else self._font
+                lbl.config(text=tasks.text(i), font=font)
+            else:
+                chk.config(text="")
+                lbl.config(text="", font=self._font)
+        visible = self._visible_rows()
+        if total > 0:
+            self._scroll.set(self._top / total, min(1.0, (self._top + visible) / total))
+        else:
+            self._scroll.set(0.0, 1.0)
+
+    # --- editing ---
+
+    def _toggle(self, slot: int) -> None:
+        i = self._top + slot
+        if i >= self._model.total:
+            return
+        self._model.set_done(i, not self._model.tasks.is_done(i))
+        self.render()
+        self._on_changed()
+
+    def _begin_edit(self, index: int) -> None:
+        self._commit_edit()
+        index = max(0, min(index, self._model.total))
+        if index < self._top:
+            self._scroll_to(index)
+        elif index - self._top >= self._visible_rows():
+            self._scroll_to(index - self._visible_rows() + 1)
+        slot = index - self._top
+        value = ""
+        if index < self._model.total:
+            tasks = self._model.tasks
+            value = ("+ " if tasks.is_done(index) else "") + tasks.text(index)
+        editor = tk.Entry(self._body, font=self._font)
+        editor.insert(0, value)
+        editor.place(
+            x=CHECK_WIDTH, y=slot * self._row_h, relwidth=1.0, width=-CHECK_WIDTH,
+            height=self._row_h,
+        )
+        if self._colors:
+            fg = str(self._colors.get("fg", "#1a1a1a"))
+            editor.config(
+                bg=str(self._colors.get("entry_bg", "#ffffff")), fg=fg, insertbackground=fg
+            )
+        editor.bind("<Return>", lambda e: self._commit_edit())
+        editor.bind("<Escape>", lambda e: self._cancel_edit())
+        editor.bind("<FocusOut>", lambda e: self._commit_edit())
+        editor.focus_set()
+        self._editor = editor
+        self._edit_index = index
+
+    def _commit_edit(self) -> None:
+        editor, index = self._editor, self._edit_index
+        if editor is None or index is None:
+            return
+        value = editor.get()
+        self._editor = None
+        self._edit_index = None
+        editor.destroy()
+        model = self._model
+        if index >= model.total:
+            if value.strip():
+                model.replace_lines(model.total, 0, [value])
+        elif value.strip():
+            model.replace_lines(index, 1, [value])
+        else:
+            model.replace_lines(index, 1, [])
+        self.render()
+        self._on_changed()
+
+    def _cancel_edit(self) -> None:
+        if self._editor is not None:
+            editor = self._editor
+            self._editor = None
+            self._edit_index = None
+            editor.destroy()
+
+    # --- theme ---
+
+    def _apply_row_colors(self, chk: tk.Label, lbl: tk.Label) -> None:
+        if not self._colors:
+            return
+        bg = str(self._colors.get("entry_bg", "#ffffff"))
+        fg = str(self._colors.get("fg", "#1a1a1a"))
+        chk.config(bg=bg, fg=fg)
+        lbl.config(bg=bg, fg=fg)
+
+    def apply_theme(self, colors: Mapping[str, str]) -> None:
+        self._colors = colors
+        bg = str(colors.get("entry_bg", "#ffffff"))
+        self._frame.config(bg=str(colors.get("frame_bg", "#f5f5f5")))
+        self._body.config(bg=bg)
+        for chk, lbl in self._rows:
+            self._apply_row_colors(chk, lbl)
+
+
+# [END SPEC:POMODORO-12:VIRTUAL_LIST]
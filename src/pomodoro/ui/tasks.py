@@ -5,42 +5,28 @@
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable
+from typing import Any, Callable
 
+from pomodoro.coalesce import Coalescer
+from pomodoro.task_model import TaskList, TaskModel
+from pomodoro.ui.task_list_view import VirtualTaskList
+from pomodoro.ui.theme import Palette, ThemeEngine
+from pomodoro.undo import DEFAULT_UNDO_MAX_KB, Change, Pos, UndoJournal, advance
+from pomodoro.worker import BackgroundWorker
 
-def _tasks_to_text(tasks: list[dict]) -> str:
-    """Serialize tasks to multiline: '+ ' prefix if done, else plain text."""
-    lines: list[str] = []
-    for t in tasks:
-        text = t.get("text", "")
-        if t.get("done", False):
-            lines.append("+ " + text)
-        else:
-            lines.append(text)
-    return "\n".join(lines)
-
-
-def _text_to_tasks(text: str) -> list[dict]:
-    """Parse multiline text: line starting with '+' = done."""
-    tasks: list[dict] = []
-    for line in text.splitlines():
-        raw = line.rstrip("\n\r")
-        if raw.lstrip().startswith("+"):
-            rest = raw.lstrip("+ \t")
-            tasks.append({"text": rest, "done": True})
-        else:
-            tasks.append({"text": raw, "done": False})
-    return tasks
+# Lists longer than this open in the virtualized view (config: virtual_threshold).
+DEFAULT_VIRTUAL_THRESHOLD = 5000
+# Pause between background parse steps of a lazily loaded task file.
+LOAD_STEP_MS = 1
+# Worker job key of the full re-parse fallback (a newer snapshot replaces it).
+PARSE_JOB = "tasks-parse"
+# Coalescer key: KeyRelease / <<Modified>> / clicks of one burst -> one update.
+EDIT_KEY = "tasks-edit"
 
 
-def _first_active_task_index(tasks: list[dict]) -> int | None:
-    """First task that is not done and has non-empty text. Empty lines (empty text) ignored."""
-    for i, t in enumerate(tasks):
-        if t.get("done", False):
-            continue
-        if (t.get("text", "") or "").strip():
-            return i
-    return None
+def _index(pos: Pos) -> str:
+    """(line, column) -> Tk text index."""
+    return f"{pos[0]}.{pos[1]}"
 
 
 class TasksWidget:
@@ -55,10 +41,27 @@ class TasksWidget:
         config: dict,
         save_callback: Callable[[], None],
         on_active_changed: Callable[[], None],
+        on_loaded: Callable[[], None] | None = None,
+        worker: BackgroundWorker | None = None,
+        coalescer: Coalescer | None = None,
     ) -> None:
         self._config = config
         self._save = save_callback
         self._on_active = on_active_changed
+        self._on_loaded = on_loaded or (lambda: None)
+        self._loading = False
+        self._model = TaskModel()
+        self._tracking = False
+        self._needs_full_parse = False
+        self._parse_pending = False
+        self._sync_wanted = False
+        self._view: VirtualTaskList | None = None
+        self._virtual = False
+        self._colors: Palette | None = None
+        self._replaying = False
+        self._journal = UndoJournal(
+            int(config.get("undo_max_kb", DEFAULT_UNDO_MAX_KB)) * 1024
+        )
 
         frame = tk.LabelFrame(
             parent,
@@ -68,20 +71,23 @@ class TasksWidget:
         )
         frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=4)
 
+        # Tk's own undo stack is unbounded and keeps every paste: UndoJournal instead.
         self._text = tk.Text(
-            frame, height=8, font=("Segoe UI", 10), wrap=tk.WORD, undo=True
+            frame, height=8, font=("Segoe UI", 10), wrap=tk.WORD, undo=False
         )
         self._text.pack(fill=tk.BOTH, expand=True, pady=2)
+        self._install_proxy()
         self._text.bind("<KeyRelease>", self._on_edit)
-        self._text.bind("<FocusOut>", lambda e: self._sync_to_config())
+        self._text.bind("<FocusOut>", lambda e: self._request_update(sync=True))
         self._text.bind("<<Modified>>", self._on_modified)
-        self._text.bind(
-            "<ButtonRelease-1>", lambda e: self._update_active_and_progress()
-        )
+        self._text.bind("<ButtonRelease-1>", lambda e: self._request_update())
         self._text.bind("<Control-KeyPress>", self._on_control_key)
+        self._text.bind("<<Undo>>", lambda e: self._undo_step(redo=False))
+        self._text.bind("<<Redo>>", lambda e: self._undo_step(redo=True))
 
         prog_frame = tk.Frame(frame)
         prog_frame.pack(fill=tk.X, pady=4)
+        self._prog_frame = prog_frame
         self._progress_var = tk.DoubleVar(value=0.0)
         self._progress_bar = ttk.Progressbar(
             prog_frame, variable=self._progress_var, maximum=100
@@ -91,18 +97,36 @@ class TasksWidget:
         self._progress_label.pack(side=tk.RIGHT)
 
         self._frame = frame
+        self._worker = worker or BackgroundWorker(lambda fn: frame.after_idle(fn))
+        self._coalescer = coalescer or Coalescer(lambda fn: frame.after_idle(fn))
         self._sync_from_config()
 
     def _on_modified(self, _event: tk.Event) -> None:
         if self._text.edit_modified():
             self._text.edit_modified(False)
-            self._sync_to_config()
+            self._request_update(sync=True)
 
     def _on_edit(self, _event: tk.Event) -> None:
-        self._update_active_and_progress()
+        self._request_update()
+
+    # [START SPEC:POMODORO-17:TASKS_COALESCE]
+    # req_refs: REQ-POMODORO-17-03
+    def _request_update(self, sync: bool = False) -> None:
+        """Queue one update for the current event burst; sync=True also saves."""
+        self._sync_wanted = self._sync_wanted or sync
+        self._coalescer.schedule(EDIT_KEY, self._flush_update)
+
+    def _flush_update(self) -> None:
+        if self._sync_wanted:
+            self._sync_wanted = False
+            self._sync_to_config()
+        else:
+            self._update_active_and_progress()
+
+    # [END SPEC:POMODORO-17:TASKS_COALESCE]
 
     def _on_control_key(self, event: tk.Event) -> str | None:
-        """Ctrl+C/V/X/Z/A by keycode so they work on Russian layout."""
+        """Ctrl+C/V/X/Z/Y/A by keycode so they work on Russian layout."""
         if not (getattr(event, "state", 0) & 0x4):
             return None
         keycode = getattr(event, "keycode", None)
@@ -116,47 +140,228 @@ class TasksWidget:
             self._text.event_generate("<<Cut>>")
             return "break"
         if keycode == 90:
-            self._text.event_generate("<<Undo>>")
-            return "break"
+            shift = isinstance(event.state, int) and bool(event.state & 0x1)
+            return self._undo_step(redo=shift)  # Ctrl+Shift+Z = redo
+        if keycode == 89:
+            return self._undo_step(redo=True)
         if keycode == 65:
             self._text.tag_add(tk.SEL, "1.0", "end-1c")
             self._text.mark_set(tk.INSERT, "1.0")
             return "break"
         return None
 
+    # [START SPEC:POMODORO-24:TASKS_UNDO]
+    # req_refs: REQ-POMODORO-24-02, REQ-POMODORO-24-03
+    def _undo_step(self, redo: bool) -> str:
+        """Ctrl+Z / Ctrl+Y: replay one journal step as a tracked edit (model patched in place)."""
+        if self._tracking and not self._virtual:
+            if redo:
+                self._journal.redo(self._apply_change)
+            else:
+                self._journal.undo(self._apply_change)
+        return "break"
+
+    def _apply_change(self, change: Change) -> Change:
+        """Put change.removed back over [start, end); return the inverse change."""
+        start = _index(change.start)
+        end = _index(change.end)
+        inserted = str(self._text.tk.call(self._orig_cmd, "get", start, end))
+        self._replaying = True
+        try:
+            self._text.replace(start, end, change.removed)
+        finally:
+            self._replaying = False
+        new_end = advance(change.start, change.removed)
+        self._text.mark_set(tk.INSERT, _index(new_end))
+        self._text.see(tk.INSERT)
+        return Change(change.start, new_end, inserted)
+
+    def _pos_of(self, index: str) -> Pos:
+        """Normalized (line, column) of index, clamped before the final newline."""
+        call = self._text.tk.call
+        if self._text.tk.getboolean(call(self._orig_cmd, "compare", index, ">", "end-1c")):
+            index = "end-1c"
+        line, col = str(call(self._orig_cmd, "index", index)).split(".")
+        return int(line), int(col)
+
+    def _journal_before(self, operation: str, args: tuple[Any, ...]) -> tuple[Pos, str, str]:
+        """(start, removed text, inserted text) of an edit, read before it runs."""
+        if operation == "insert":
+            return self._pos_of(args[0]), "", "".join(str(a) for a in args[1::2])
+        start = self._pos_of(args[0])
+        if operation == "delete":
+            end = self._pos_of(args[1] if len(args) == 2 else f"{args[0]} +1c")
+            inserted = ""
+        else:
+            end = self._pos_of(args[1])
+            inserted = "".join(str(a) for a in args[2::2])
+        if end <= start:
+            return start, "", inserted
+        removed = self._text.tk.call(self._orig_cmd, "get", _index(start), _index(end))
+        return start, str(removed), inserted
+
+    def undo_stats(self) -> dict[str, int]:
+        return self._journal.stats()
+
+    # [END SPEC:POMODORO-24:TASKS_UNDO]
+
     def sync_to_config(self) -> None:
-        """Parse text into config and save. Call on FocusOut or before close."""
+        """
+        Parse text into config and save. Call on FocusOut or before close.
+        A re-parse still waiting for the worker is done here, synchronously:
+        the saved list always matches the buffer.
+        """
+        self._coalescer.cancel(EDIT_KEY)
+        self._sync_wanted = False
+        if not self._virtual and (self._needs_full_parse or self._parse_pending):
+            self._worker.cancel(PARSE_JOB)
+            self._needs_full_parse = False
+            self._parse_pending = False
+            self._model.adopt(TaskModel.parse_text(self._text.get("1.0", "end-1c")))
+        self._sync_to_config()
+
+    # [START SPEC:POMODORO-9:TASKS_INCREMENTAL]
+    # req_refs: REQ-POMODORO-9-01, REQ-POMODORO-9-02, REQ-POMODORO-9-04
+    def _install_proxy(self) -> None:
+        """
+        Route the Text widget command through _dispatch (as idlelib's
+        WidgetRedirector) so every insert/delete reports the lines it touched.
+        """
+        widget_cmd = str(self._text)
+        self._orig_cmd = widget_cmd + "_orig"
+        self._text.tk.call("rename", widget_cmd, self._orig_cmd)
+        self._text.tk.createcommand(widget_cmd, self._dispatch)
+
+    def _dispatch(self, operation: str, *args: Any) -> Any:
+        try:
+            if self._tracking and operation in ("insert", "delete", "replace"):
+                return self._tracked_edit(operation, args)
+            if operation == "edit" and args and args[0] in ("undo", "redo"):
+                # Undo/redo replays edits internally: fall back to a full parse.
+                self._needs_full_parse = True
+            return self._text.tk.call((self._orig_cmd, operation) + args)
+        except tk.TclError:
+            return ""
+
+    def _line_of(self, index: str) -> int:
+        return int(str(self._text.tk.call(self._orig_cmd, "index", index)).split(".")[0])
+
+    def _tracked_edit(self, operation: str, args: tuple[Any, ...]) -> Any:
+        """Run the edit and patch the model with only the touched lines."""
+        call = self._text.tk.call
+        last = self._line_of("end-1c")
+        if operation == "insert":
+            first = old_last = min(self._line_of(args[0]), last)
+            added = "".join(str(a) for a in args[1::2]).count("\n")
+        elif operation == "delete" and 1 <= len(args) <= 2:
+            first = min(self._line_of(args[0]), last)
+            end = args[1] if len(args) == 2 else f"{args[0]} +1c"
+            old_last = max(first, min(self._line_of(end), last))
+            added = 0
+        elif operation == "replace" and len(args) >= 3:
+            first = min(self._line_of(args[0]), last)
+            old_last = max(first, min(self._line_of(args[1]), last))
+            added = "".join(str(a) for a in args[2::2]).count("\n")
+        else:
+            # Not tracked (several ranges, odd arguments): the model is re-parsed
+            # and the journal's positions no longer match the buffer, so drop it.
+            self._needs_full_parse = True
+            self._journal.clear()
+            return call((self._orig_cmd, operation) + args)
+        journal = None if self._replaying else self._journal_before(operation, args)
+        result = call((self._orig_cmd, operation) + args)
+        if journal is not None and (journal[1] or journal[2]):
+            start, removed, inserted = journal
+            self._journal.record(Change(start, advance(start, inserted), removed))
+        if self._parse_pending:
+            # Model is behind the buffer until the worker parses a fresh snapshot.
+            self._needs_full_parse = True
+            return result
+        new_last = first + added
+        text = str(call(self._orig_cmd, "get", f"{first}.0", f"{new_last}.end"))
+        self._model.replace_lines(first - 1, old_last - first + 1, text.split("\n"))
+        if self._model.total != self._line_of("end-1c"):
+            self._needs_full_parse = True
+        return result
+
+    # [START SPEC:POMODORO-16:TASKS_WORKER]
+    # req_refs: REQ-POMODORO-16-03
+    def _ensure_model(self) -> None:
+        """
+        Full re-parse only when an edit could not be tracked line by line.
+        The buffer snapshot is parsed on the worker; a newer snapshot cancels
+        the pending one. Until the result arrives the model lags the buffer.
+        """
+        if self._needs_full_parse and not self._virtual:
+            self._needs_full_parse = False
+            self._parse_pending = True
+            text = self._text.get("1.0", "end-1c")
+            self._worker.submit(PARSE_JOB, lambda: TaskModel.parse_text(text), self._on_parsed)
+
+    def _on_parsed(self, parsed: Any) -> None:
+        """UI thread (after_idle): adopt the parsed list unless the buffer moved on."""
+        if self._needs_full_parse:
+            self._parse_pending = False
+            self._ensure_model()  # edited after the snapshot: parse a fresh one
+            return
+        self._parse_pending = False
+        self._model.adopt(parsed)
         self._sync_to_config()
 
+    # [END SPEC:POMODORO-16:TASKS_WORKER]
+
     def _sync_from_config(self) -> None:
-        tasks = self._config.get("tasks", [])
-        self._text.delete("1.0", tk.END)
-        self._text.insert("1.0", _tasks_to_text(tasks))
+        tasks = TaskList.coerce(self._config.get("tasks"))
+        self._worker.cancel(PARSE_JOB)
+        self._model.reset(tasks)
+        self._config["tasks"] = tasks
+        self._needs_full_parse = False
+        self._parse_pending = False
+        if len(tasks) > self._virtual_threshold():
+            self._show_virtual()
+        else:
+            self._show_text()
         self._update_progress_display()
+        if not self._loading:
+            self._loading = True
+            self._frame.after_idle(self._load_step)
+
+    # [START SPEC:POMODORO-13:TASKS_LOAD]
+    # req_refs: REQ-POMODORO-13-03
+    def _load_step(self) -> None:
+        """Parse the rest of a lazily loaded task file, one chunk per event-loop turn."""
+        if self._model.load_more():
+            self._frame.after(LOAD_STEP_MS, self._load_step)
+            return
+        self._loading = False
+        self._update_progress_display()
+        self._on_loaded()
+
+    # [END SPEC:POMODORO-13:TASKS_LOAD]
 
     def _sync_to_config(self) -> None:
-        raw = self._text.get("1.0", tk.END)
-        tasks = _text_to_tasks(raw)
-        self._config["tasks"] = tasks
-        idx = _first_active_task_index(tasks)
-        self._config["active_task_index"] = idx
+        self._ensure_model()
+        if self._parse_pending:
+            return  # model lags the buffer: _on_parsed syncs and saves the fresh list
+        self._maybe_switch_mode()
+        self._config["tasks"] = self._model.tasks
+        self._config["active_task_index"] = self._model.active_index
         self._save()
         self._update_progress_display()
         self._on_active()
 
     def _update_active_and_progress(self) -> None:
-        raw = self._text.get("1.0", tk.END)
-        tasks = _text_to_tasks(raw)
-        self._config["tasks"] = tasks
-        idx = _first_active_task_index(tasks)
-        self._config["active_task_index"] = idx
+        self._ensure_model()
+        if self._parse_pending:
+            return
+        self._config["tasks"] = self._model.tasks
+        self._config["active_task_index"] = self._model.active_index
         self._update_progress_display()
         self._on_active()
 
     def _update_progress_display(self) -> None:
-        tasks = self._config.get("tasks", [])
-        total = len(tasks)
-        done = sum(1 for t in tasks if t.get("done", False))
+        total = self._model.total
+        done = self._model.done_count
         if total > 0:
             self._progress_var.set(100.0 * done / total)
             self._progress_label.config(text=f"{done}/{total}")
@@ -165,29 +370,109 @@ class TasksWidget:
             self._progress_label.config(text="0/0")
 
     def get_active_text(self) -> str:
-        tasks = self._config.get("tasks", [])
-        idx = _first_active_task_index(tasks)
-        if idx is not None and 0 <= idx < len(tasks):
-            return tasks[idx].get("text", "")
-        return ""
-
-    def apply_theme(self, colors: dict) -> None:
-        fb = str(colors.get("frame_bg", "#f5f5f5"))
-        fg = str(colors.get("fg", "#1a1a1a"))
-        eb = str(colors.get("entry_bg", "#ffffff"))
-        sb = str(colors.get("select_bg", "#b0d4f1"))
-        sf = str(colors.get("select_fg", "#1a1a1a"))
-        fdim = str(colors.get("fg_dim", "#666666"))
-        self._frame.config(bg=fb, fg=fg)
-        self._text.config(
-            bg=eb, fg=fg, insertbackground=fg, selectbackground=sb, selectforeground=sf
-        )
-        self._progress_label.config(bg=fb, fg=fdim)
+        self._ensure_model()
+        return self._model.active_text()
+
+    # [START SPEC:POMODORO-29:TASKS_ADD]
+    # req_refs: REQ-POMODORO-29-02
+    def add_task(self, text: str) -> None:
+        """Append one task at the end (add-task from another launch) and save."""
+        line = " ".join(text.split())
+        if not line:
+            return
+        if self._virtual and self._view is not None:
+            self._model.replace_lines(self._model.total, 0, [line])
+            self._view.render()
+            self._sync_to_config()
+            return
+        # Tracked insert: the model is patched in place and the edit can be undone.
+        empty_last = self._text.index("end-1c").endswith(".0")
+        self._text.insert("end-1c", line if empty_last else "\n" + line)
+        self.sync_to_config()
+
+    # [END SPEC:POMODORO-29:TASKS_ADD]
+
+    # [END SPEC:POMODORO-9:TASKS_INCREMENTAL]
+
+    # [START SPEC:POMODORO-12:TASKS_MODE]
+    # req_refs: REQ-POMODORO-12-04
+    def _virtual_threshold(self) -> int:
+        return int(self._config.get("virtual_threshold", DEFAULT_VIRTUAL_THRESHOLD))
+
+    def _set_text_content(self, content: str) -> None:
+        """Replace the Text buffer without per-line tracking (model set separately)."""
+        self._tracking = False
+        try:
+            self._text.delete("1.0", tk.END)
+            self._text.insert("1.0", content)
+            self._journal.clear()
+            self._text.edit_modified(False)
+        finally:
+            self._tracking = True
+
+    def _show_text(self) -> None:
+        """Plain-text editing mode: the whole list lives in the Text widget."""
+        self._set_text_content(self._model.tasks.to_text())
+        if self._virtual and self._view is not None:
+            self._view.frame.pack_forget()
+            self._text.pack(fill=tk.BOTH, expand=True, pady=2, before=self._prog_frame)
+        self._virtual = False
+
+    def _show_virtual(self) -> None:
+        """Virtualized mode: Text is emptied; only visible rows are rendered."""
+        self._set_text_content("")
+        if self._view is None:
+            self._view = VirtualTaskList(self._frame, self._model, self._on_view_changed)
+            if self._colors is not None:
+                self._view.apply_theme(self._colors)
+        else:
+            self._view.set_model(self._model)
+        if not self._virtual:
+            self._text.pack_forget()
+            self._view.frame.pack(fill=tk.BOTH, expand=True, pady=2, before=self._prog_frame)
+        self._virtual = True
+        self._view.render()
+
+    def _maybe_switch_mode(self) -> None:
+        """Switch above the threshold; back to text below half of it (hysteresis)."""
+        if self._parse_pending:
+            return  # model lags the buffer; decided again once the parse lands
+        threshold = self._virtual_threshold()
+        total = self._model.total
+        if not self._virtual and total > threshold:
+            self._show_virtual()
+        elif self._virtual and total <= threshold // 2:
+            self._show_text()
+
+    def _on_view_changed(self) -> None:
+        self._sync_to_config()
+
+    # [END SPEC:POMODORO-12:TASKS_MODE]
+
+    # [START SPEC:POMODORO-18:TASKS_THEME]
+    # req_refs: REQ-POMODORO-18-01
+    def register_theme(self, theme: ThemeEngine) -> None:
+        """Register the section by role; the virtual list (recycled rows) follows the palette."""
+        theme.register(self._frame, "panel")
+        theme.register(self._text, "text")
+        theme.register(self._prog_frame, "panel_surface")
+        theme.register(self._progress_label, "panel_dim")
+        theme.on_change(self._on_palette)
+
+    def _on_palette(self, colors: Palette) -> None:
+        self._colors = colors
+        if self._view is not None:
+            self._view.apply_theme(colors)
+
+    # [END SPEC:POMODORO-18:TASKS_THEME]
 
     def contains_focus(self, root: tk.Misc) -> bool:
         """True if keyboard focus is inside the tasks text widget (do not trigger hotkeys)."""
         try:
-            return root.focus_get() == self._text
+            focus = root.focus_get()
+            if self._view is not None and self._view.contains_focus(focus):
+                return True
+            return focus == self._text
         except (tk.TclError, AttributeError):
             return False
 
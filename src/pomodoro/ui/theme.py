@@ -1,41 +1,247 @@
 """Light/dark theme colors (Shutdowner-style). Apply to root and widgets."""
 
-from typing import Any
-
-THEME_LIGHT: dict[str, Any] = {
-    "bg": "#f0f0f0",
-    "fg": "#1a1a1a",
-    "fg_dim": "#666666",
-    "frame_bg": "#f5f5f5",
-    "entry_bg": "#ffffff",
-    "entry_fg": "#1a1a1a",
-    "btn_bg": "#e8e8e8",
-    "btn_fg": "#1a1a1a",
-    "btn_active": "#d0d0d0",
-    "progress_bg": "#e0e0e0",
-    "progress_fg": "#4caf50",
-    "select_bg": "#b0d4f1",
-    "select_fg": "#1a1a1a",
-}
-
-THEME_DARK: dict[str, Any] = {
-    "bg": "#2b2b2b",
-    "fg": "#e0e0e0",
-    "fg_dim": "#a0a0a0",
-    "frame_bg": "#333333",
-    "entry_bg": "#3c3c3c",
-    "entry_fg": "#e0e0e0",
-    "btn_bg": "#404040",
-    "btn_fg": "#e0e0e0",
-    "btn_active": "#505050",
-    "progress_bg": "#404040",
-    "progress_fg": "#4caf50",
-    "select_bg": "#505050",
-    "select_fg": "#e0e0e0",
-}
-
-
-def theme_colors(theme: str) -> dict[str, Any]:
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+# Palettes are read-only and shared: theme_colors() hands out the same object.
+Palette = Mapping[str, str]
+
+THEME_LIGHT: Palette = MappingProxyType(
+    {
+        "bg": "#f0f0f0",
+        "fg": "#1a1a1a",
+        "fg_dim": "#666666",
+        "frame_bg": "#f5f5f5",
+        "entry_bg": "#ffffff",
+        "entry_fg": "#1a1a1a",
+        "btn_bg": "#e8e8e8",
+        "btn_fg": "#1a1a1a",
+        "btn_active": "#d0d0d0",
+        "progress_bg": "#e0e0e0",
+        "progress_fg": "#4caf50",
+        "select_bg": "#b0d4f1",
+        "select_fg": "#1a1a1a",
+    }
+)
+
+THEME_DARK: Palette = MappingProxyType(
+    {
+        "bg": "#2b2b2b",
+        "fg": "#e0e0e0",
+        "fg_dim": "#a0a0a0",
+        "frame_bg": "#333333",
+        "entry_bg": "#3c3c3c",
+        "entry_fg": "#e0e0e0",
+        "btn_bg": "#404040",
+        "btn_fg": "#e0e0e0",
+        "btn_active": "#505050",
+        "progress_bg": "#404040",
+        "progress_fg": "#4caf50",
+        "select_bg": "#505050",
+        "select_fg": "#e0e0e0",
+    }
+)
+
+BUILTIN_THEMES: Mapping[str, Palette] = MappingProxyType(
+    {"light": THEME_LIGHT, "dark": THEME_DARK}
+)
+
+
+def theme_colors(theme: str) -> Palette:
     if theme == "dark":
-        return dict(THEME_DARK)
-    return dict(THEME_LIGHT)
+        return THEME_DARK
+    return THEME_LIGHT
+
+
+# [START SPEC:POMODORO-18:THEME_ENGINE]
+# req_refs: REQ-POMODORO-18-01, REQ-POMODORO-18-02, REQ-POMODORO-18-03, REQ-POMODORO-18-04
+
+THEMES_DIRNAME = "themes"
+
+# Semantic roles: widget option -> palette key. Widgets register once with a role.
+ROLES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        # window background: root and frames directly on it
+        "surface": {"bg": "bg"},
+        "label": {"bg": "bg", "fg": "fg"},
+        # LabelFrame sections (tasks, settings) and what sits inside them
+        "panel": {"bg": "frame_bg", "fg": "fg"},
+        "panel_surface": {"bg": "frame_bg"},
+        "panel_label": {"bg": "frame_bg", "fg": "fg"},
+        "panel_dim": {"bg": "frame_bg", "fg": "fg_dim"},
+        "entry": {"bg": "entry_bg", "fg": "fg", "insertbackground": "fg"},
+        "text": {
+            "bg": "entry_bg",
+            "fg": "fg",
+            "insertbackground": "fg",
+            "selectbackground": "select_bg",
+            "selectforeground": "select_fg",
+        },
+        "radio": {"bg": "frame_bg", "fg": "fg", "selectcolor": "frame_bg"},
+        "scale": {"bg": "frame_bg", "fg": "fg", "troughcolor": "progress_bg"},
+        # ttk.Style("TProgressbar")
+        "progressbar": {
+            "background": "progress_bg",
+            "troughcolor": "progress_bg",
+            "darkcolor": "progress_fg",
+            "lightcolor": "progress_fg",
+        },
+    }
+)
+
+
+def load_palettes(directory: Path | None = None) -> dict[str, Palette]:
+    """
+    Built-in palettes plus custom themes from <base dir>/themes/*.json
+    (theme name = file name). A file holds palette keys to override and an
+    optional "base": "light" | "dark"; unknown keys and non-string values are
+    ignored, unreadable files skipped. Every palette is merged and frozen here.
+    """
+    import json
+
+    if directory is None:
+        from pomodoro.config import get_base_dir
+
+        directory = get_base_dir() / THEMES_DIRNAME
+    palettes: dict[str, Palette] = dict(BUILTIN_THEMES)
+    try:
+        files = sorted(directory.glob("*.json"))
+    except OSError:
+        files = []
+    for path in files:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        base = BUILTIN_THEMES.get(str(data.get("base", "light")), THEME_LIGHT)
+        merged = dict(base)
+        for key, value in data.items():
+            if key in base and isinstance(value, str) and value:
+                merged[key] = value
+        palettes[path.stem] = MappingProxyType(merged)
+    return palettes
+
+
+class ThemeEngine:
+    """
+    Applies palettes to registered widgets by semantic role. Each registration
+    remembers the option values it last set; switch() configures only the
+    options whose value actually changes (one configure call per widget, none
+    if nothing changed). Parts that are not plain widget options (canvas
+    drawings, recycled rows) subscribe with on_change(fn) and get the palette
+    only when it is a different one. Tk-free: targets are duck-typed
+    configure(**options) callables.
+    `post` (e.g. root.after_idle) measures switch-to-painted latency: Tk redraws
+    are idle callbacks queued by configure, so a later idle callback runs after them.
+    """
+
+    def __init__(
+        self,
+        palettes: Mapping[str, Palette] | None = None,
+        theme: str = "light",
+        post: Callable[[Callable[[], None]], Any] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._palettes = palettes if palettes is not None else BUILTIN_THEMES
+        self._post = post
+        self._clock = clock
+        self.name = theme if theme in self._palettes else "light"
+        self.palette: Palette = self._palettes.get(self.name, THEME_LIGHT)
+        self._targets: list[tuple[Callable[..., Any], Mapping[str, str], dict[str, str]]] = []
+        self._listeners: list[Callable[[Palette], None]] = []
+        self._switch_started: float | None = None
+        self.switches = 0
+        self.options_set = 0
+        self.options_skipped = 0
+        self.configure_calls = 0
+        self.last_apply_ms = 0.0
+        self.last_paint_ms = 0.0
+        self.max_paint_ms = 0.0
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._palettes)
+
+    def register(self, widget: Any, role: str) -> None:
+        """Theme widget by role now and on every switch (KeyError for unknown roles)."""
+        self._add(widget.configure, ROLES[role])
+
+    def register_style(self, style: Any, style_name: str, role: str) -> None:
+        """ttk.Style element, e.g. register_style(ttk.Style(), "TProgressbar", "progressbar")."""
+        self._add(
+            lambda **options: style.configure(style_name, **options), ROLES[role]
+        )
+
+    def on_change(self, fn: Callable[[Palette], None]) -> None:
+        """fn(palette) now and after every switch to a different palette."""
+        self._listeners.append(fn)
+        fn(self.palette)
+
+    def switch(self, theme: str) -> float:
+        """Apply theme (unknown names fall back to light). Returns apply time in ms."""
+        palette = self._palettes.get(theme, THEME_LIGHT)
+        if palette is self.palette:
+            return 0.0
+        t0 = self._clock()
+        self.name = theme if theme in self._palettes else "light"
+        self.palette = palette
+        self.switches += 1
+        for configure, role, applied in self._targets:
+            self._apply(configure, role, applied)
+        for fn in self._listeners:
+            fn(palette)
+        self.last_apply_ms = (self._clock() - t0) * 1000.0
+        if self._post is not None:
+            self._switch_started = t0
+            self._post(self._painted)
+        return self.last_apply_ms
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "targets": len(self._targets),
+            "listeners": len(self._listeners),
+            "switches": self.switches,
+            "options_set": self.options_set,
+            "options_skipped": self.options_skipped,
+            "configure_calls": self.configure_calls,
+            "last_apply_ms": round(self.last_apply_ms, 3),
+            "last_paint_ms": round(self.last_paint_ms, 3),
+            "max_paint_ms": round(self.max_paint_ms, 3),
+        }
+
+    # --- internals ---
+
+    def _add(self, configure: Callable[..., Any], role: Mapping[str, str]) -> None:
+        applied: dict[str, str] = {}
+        self._targets.append((configure, role, applied))
+        self._apply(configure, role, applied)
+
+    def _apply(
+        self, configure: Callable[..., Any], role: Mapping[str, str], applied: dict[str, str]
+    ) -> None:
+        palette = self.palette
+        changed: dict[str, str] = {}
+        for option, key in role.items():
+            value = palette[key]
+            if applied.get(option) != value:
+                changed[option] = value
+        self.options_skipped += len(role) - len(changed)
+        if changed:
+            configure(**changed)
+            applied.update(changed)
+            self.options_set += len(changed)
+            self.configure_calls += 1
+
+    def _painted(self) -> None:
+        if self._switch_started is None:
+            return
+        self.last_paint_ms = (self._clock() - self._switch_started) * 1000.0
+        self.max_paint_ms = max(self.max_paint_ms, self.last_paint_ms)
+        self._switch_started = None
+
+
+# [END SPEC:POMODORO-18:THEME_ENGINE]
@@ -7,10 +7,11 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable
 
+from pomodoro.engine import BREAK, WORK, TimerEngine
+from pomodoro.scheduler import TimerHandle, TimerScheduler, TkBackend
 from pomodoro.ui.rounded_button import RoundedButton
-
-WORK = "work"
-BREAK = "break"
+from pomodoro.ui.theme import THEME_LIGHT, Palette, ThemeEngine
+from pomodoro.view_model import ViewModel, quantize_progress
 
 CLOCK_FONT_SIZE = 44
 BIG_BTN_WIDTH = 200
@@ -18,14 +19,10 @@ BIG_BTN_HEIGHT = 44
 TAB_BTN_WIDTH = 100
 
 
-def _format_mmss(seconds: int) -> str:
-    m, s = divmod(max(0, seconds), 60)
-    return f"{m:02d}:{s:02d}"
-
-
 class TimerWidget:
     """
     Timer display, one big Start/Pause button, mode selector Pomodoro | Перерыв.
+    Thin view over TimerEngine: renders its state and drives tick() with after().
     Calls on_run_state_changed(running: bool) and on_phase_changed(phase) when phase changes.
     """
 
@@ -36,23 +33,21 @@ class TimerWidget:
         on_finish: Callable[[str], None] | None = None,
         on_run_state_changed: Callable[[bool], None] | None = None,
         on_phase_changed: Callable[[str], None] | None = None,
+        scheduler: TimerScheduler | None = None,
+        view: ViewModel | None = None,
     ) -> None:
-        self._get_config = get_config
-        self._on_finish = on_finish or (lambda _: None)
         self._on_run_state = on_run_state_changed or (lambda _: None)
-        self._on_phase = on_phase_changed or (lambda _: None)
-        self._remaining = 0
-        self._total_seconds = 0
-        self._phase: str = WORK
-        self._selected_mode: str = WORK
-        self._running = False
-        self._after_id: str | None = None
+        self._last_theme: Palette = THEME_LIGHT
+        self._tick_handle: TimerHandle | None = None
+        self._view = view or ViewModel()
+        self._hidden = False
 
         frame = tk.Frame(parent)
         frame.pack(fill=tk.X, padx=(8, 14), pady=6)
 
         self._label = tk.Label(frame, text="25:00", font=("Consolas", CLOCK_FONT_SIZE))
         self._label.pack(pady=(0, 4))
+        self._scheduler = scheduler or TimerScheduler(TkBackend(self._label))
 
         self._progress_var = tk.DoubleVar(value=0.0)
         self._time_progress = ttk.Progressbar(
@@ -79,7 +74,7 @@ class TimerWidget:
             text="Помодоро",
             width=TAB_BTN_WIDTH,
             height=32,
-            command=lambda: self._select_mode(WORK),
+            command=lambda: self._engine.select_mode(WORK),
         )
         self._btn_pomodoro.pack(side=tk.LEFT, padx=(0, 2), pady=(0, 1))
         self._btn_break = RoundedButton(
@@ -87,209 +82,189 @@ class TimerWidget:
             text="Перерыв",
             width=TAB_BTN_WIDTH,
             height=32,
-            command=lambda: self._select_mode(BREAK),
+            command=lambda: self._engine.select_mode(BREAK),
         )
         self._btn_break.pack(side=tk.LEFT, padx=(0, 1), pady=(0, 1))
         self._tabs_frame = tabs_frame
-        self._update_tabs_highlight()
 
         self._btn_frame = frame
+        # [START SPEC:POMODORO-6:TIMER_VIEW]
+        # req_refs: REQ-POMODORO-6-04
+        self._engine = TimerEngine(
+            get_config,
+            on_finish=on_finish,
+            on_run_state_changed=self._on_engine_run_state,
+            on_phase_changed=on_phase_changed,
+            on_display=self._render,
+        )
         self.reset_to_work()
 
-    def _select_mode(self, mode: str) -> None:
-        if self._running:
-            return
-        self._selected_mode = mode
+    @property
+    def engine(self) -> TimerEngine:
+        return self._engine
+
+    def _render(self) -> None:
+        """Push engine state to the label, progress bar, tabs and main button (on change only)."""
+        engine = self._engine
+        view = self._view
+        view.push("clock.text", engine.display_text, self._show_clock)
+        view.push("clock.progress", quantize_progress(engine.progress), self._progress_var.set)
+        view.push("tabs.selected", engine.selected_mode, self._show_selected)
+        self._layout_buttons(running=engine.running)
+
+    # [START SPEC:POMODORO-20:TIMER_VIEW]
+    # req_refs: REQ-POMODORO-20-03
+    def _show_clock(self, text: str) -> None:
+        self._label.config(text=text)
+
+    def _show_selected(self, _mode: str) -> None:
         self._update_tabs_highlight()
-        cfg = self._get_config()
-        if mode == WORK:
-            self._remaining = cfg["work_minutes"] * 60
-            self._phase = WORK
+
+    def render_stats(self) -> dict[str, float]:
+        """Applied vs skipped widget updates (Tcl round trips saved), also per hour."""
+        return self._view.stats()
+
+    # [END SPEC:POMODORO-20:TIMER_VIEW]
+
+    def _on_engine_run_state(self, running: bool) -> None:
+        if running:
+            self._arm()
         else:
-            self._remaining = cfg["break_minutes"] * 60
-            self._phase = BREAK
-        self._total_seconds = self._remaining
-        self._label.config(text=_format_mmss(self._remaining))
-        self._progress_var.set(100.0)
-        self._on_phase(self._phase)
+            self._disarm()
+        self._on_run_state(running)
+
+    # [START SPEC:POMODORO-7:TIMER_SCHEDULER]
+    # req_refs: REQ-POMODORO-7-01
+    def _arm(self) -> None:
+        self._disarm()
+        if self._hidden:
+            delay_ms = self._engine.deadline_delay_ms()  # one wakeup, at the phase end
+        else:
+            delay_ms = self._engine.next_delay_ms()
+        self._tick_handle = self._scheduler.add(delay_ms / 1000.0, self._tick, name="clock")
+
+    def _disarm(self) -> None:
+        if self._tick_handle is not None:
+            self._scheduler.cancel(self._tick_handle)
+            self._tick_handle = None
+
+    # [END SPEC:POMODORO-7:TIMER_SCHEDULER]
+
+    def _tick(self) -> None:
+        self._tick_handle = None
+        if self._engine.tick():
+            self._arm()
+
+    # [START SPEC:POMODORO-21:TIMER_IDLE]
+    # req_refs: REQ-POMODORO-21-02
+    def set_hidden(self, hidden: bool) -> None:
+        """
+        Hidden overlay: no per-second repaints, a single wakeup for the phase
+        deadline. Shown again: resync the display and return to per-second ticks.
+        """
+        if hidden == self._hidden:
+            return
+        self._hidden = hidden
+        if self._engine.running:
+            self._arm()
+        if not hidden:
+            self._render()
+
+    def wakeup_stats(self) -> dict[str, float]:
+        """Scheduler wakeups, including wakeups_per_hour (low while hidden)."""
+        return self._scheduler.stats()
+
+    # [END SPEC:POMODORO-21:TIMER_IDLE]
+
+    # [END SPEC:POMODORO-6:TIMER_VIEW]
 
     def _update_tabs_highlight(self) -> None:
-        colors = getattr(self, "_last_theme", None) or {
-            "btn_bg": "#e8e8e8",
-            "btn_fg": "#1a1a1a",
-            "bg": "#f0f0f0",
-            "btn_active": "#d0d0d0",
-        }
-        self._btn_pomodoro.apply_theme(colors)
-        self._btn_break.apply_theme(colors)
+        colors = self._last_theme
         active_bg = str(colors.get("btn_active", "#d0d0d0"))
-        for btn, is_selected in [
-            (self._btn_pomodoro, self._selected_mode == WORK),
-            (self._btn_break, self._selected_mode == BREAK),
-        ]:
-            btn._bg = active_bg if is_selected else str(colors.get("btn_bg", "#e8e8e8"))
-            btn._draw()
+        btn_bg = str(colors.get("btn_bg", "#e8e8e8"))
+        selected = self._engine.selected_mode
+        self._btn_pomodoro.set_fill(active_bg if selected == WORK else btn_bg)
+        self._btn_break.set_fill(active_bg if selected == BREAK else btn_bg)
 
     def _on_main_click(self) -> None:
-        if self._running:
-            self._on_pause()
-        else:
-            self._on_start()
+        self._engine.toggle()
 
     def _set_pause_disabled(self, disabled: bool) -> None:
         pass
 
     def _layout_buttons(self, running: bool) -> None:
-        self._btn_main._text = "Пауза" if running else "Старт"
-        self._btn_main._draw()
+        label = "Пауза" if running else "Старт"
+        self._view.push("main.text", label, self._btn_main.set_text)
 
     def set_compact(self, compact: bool) -> None:
         self._layout_buttons(running=compact)
 
-    def _tick(self) -> None:
-        if not self._running or self._remaining <= 0:
-            return
-        self._remaining -= 1
-        self._label.config(text=_format_mmss(self._remaining))
-        if self._total_seconds > 0:
-            self._progress_var.set(100.0 * self._remaining / self._total_seconds)
-        if self._remaining <= 0:
-            self._running = False
-            self._layout_buttons(running=False)
-            self._on_run_state(False)
-            self._on_finish(self._phase)
-            # Switch to other mode with full duration so user can press Start
-            cfg = self._get_config()
-            if self._phase == WORK:
-                self._selected_mode = BREAK
-                self._phase = BREAK
-                self._remaining = cfg["break_minutes"] * 60
-            else:
-                self._selected_mode = WORK
-                self._phase = WORK
-                self._remaining = cfg["work_minutes"] * 60
-            self._total_seconds = self._remaining
-            self._on_phase(self._phase)
-            self._update_tabs_highlight()
-            self._label.config(text=_format_mmss(self._remaining))
-            self._progress_var.set(100.0)
-            return
-        self._after_id = self._label.after(1000, self._tick)
-
-    def _on_start(self) -> None:
-        if self._remaining <= 0:
-            cfg = self._get_config()
-            if self._selected_mode == WORK:
-                self._remaining = cfg["work_minutes"] * 60
-                self._phase = WORK
-            else:
-                self._remaining = cfg["break_minutes"] * 60
-                self._phase = BREAK
-            self._on_phase(self._phase)
-        self._total_seconds = self._remaining
-        self._progress_var.set(100.0)
-        self._running = True
-        self._layout_buttons(running=True)
-        self._on_run_state(True)
-        self._after_id = self._label.after(1000, self._tick)
-
-    def _on_pause(self) -> None:
-        self._running = False
-        if self._after_id is not None:
-            self._label.after_cancel(self._after_id)
-            self._after_id = None
-        self._layout_buttons(running=False)
-        self._on_run_state(False)
-
-    def _on_reset(self) -> None:
-        self._on_pause()
-        self.reset_to_work()
-
     def reset_to_work(self) -> None:
-        self._selected_mode = WORK
-        self._refresh_display()
-
-    def _refresh_display(self) -> None:
-        """Update displayed time from config according to current selected mode."""
-        cfg = self._get_config()
-        if self._selected_mode == WORK:
-            self._remaining = cfg["work_minutes"] * 60
-            self._phase = WORK
-        else:
-            self._remaining = cfg["break_minutes"] * 60
-            self._phase = BREAK
-        self._total_seconds = self._remaining
-        self._on_phase(self._phase)
-        self._label.config(text=_format_mmss(self._remaining))
-        self._progress_var.set(100.0)
-        self._layout_buttons(running=False)
+        self._engine.reset_to_work()
 
     def refresh_display(self) -> None:
         """Public: apply current work/break settings to display when not running."""
-        if not self._running:
-            self._refresh_display()
+        self._engine.refresh()
 
     def start_break(self) -> None:
         """Switch to break mode with full duration (e.g. after work finishes)."""
-        cfg = self._get_config()
-        self._selected_mode = BREAK
-        self._remaining = cfg["break_minutes"] * 60
-        self._total_seconds = self._remaining
-        self._phase = BREAK
-        self._on_phase(BREAK)
+        self._engine.start_break()
+
+    # [START SPEC:POMODORO-18:TIMER_THEME]
+    # req_refs: REQ-POMODORO-18-01
+    def register_theme(self, theme: ThemeEngine) -> None:
+        """Register clock, frames and progress style by role; buttons follow the palette."""
+        theme.register(self._label, "label")
+        for w in (self._btn_frame, self._big_btn_frame, self._tabs_frame):
+            theme.register(w, "surface")
+        theme.register_style(ttk.Style(), "TProgressbar", "progressbar")
+        theme.on_change(self._on_palette)
+
+    def _on_palette(self, colors: Palette) -> None:
+        self._last_theme = colors
+        for btn in (self._btn_main, self._btn_pomodoro, self._btn_break):
+            btn.apply_theme(colors)
         self._update_tabs_highlight()
-        self._label.config(text=_format_mmss(self._remaining))
-        self._progress_var.set(100.0)
-        self._layout_buttons(running=False)
-
-    def apply_theme(self, colors: dict) -> None:
-        self._last_theme = dict(colors)
-        bg = str(colors.get("bg", "#f0f0f0"))
-        fg = str(colors.get("fg", "#1a1a1a"))
-        self._label.config(bg=bg, fg=fg)
-        frame = self._label.master
-        if isinstance(frame, tk.Frame):
-            frame.config(bg=bg)
-        if hasattr(self, "_btn_frame"):
-            self._btn_frame["bg"] = bg
-        if hasattr(self, "_tabs_frame"):
-            self._tabs_frame["bg"] = bg
-        if hasattr(self, "_big_btn_frame"):
-            self._big_btn_frame["bg"] = bg
-        self._btn_main.apply_theme(colors)
-        self._update_tabs_highlight()
-        style = ttk.Style()
-        pb = str(colors.get("progress_bg", "#e0e0e0"))
-        pf = str(colors.get("progress_fg", "#4caf50"))
-        style.configure(
-            "TProgressbar", background=pb, troughcolor=pb, darkcolor=pf, lightcolor=pf
-        )
+
+    # [END SPEC:POMODORO-18:TIMER_THEME]
 
     @property
     def frame(self) -> tk.Misc:
         return self._label.master
 
     def is_running(self) -> bool:
-        return self._running
+        return self._engine.running
 
     def get_phase(self) -> str:
-        return self._phase
+        return self._engine.phase
 
     def set_selected_mode(self, mode: str) -> None:
         """Set selected mode (work/break) from outside, e.g. when editing time fields."""
-        self._select_mode(mode)
+        self._engine.select_mode(mode)
 
     def start(self) -> None:
         """Start or resume timer (for hotkeys)."""
-        self._on_start()
+        self._engine.start()
 
     def pause(self) -> None:
         """Pause timer (for hotkeys)."""
-        self._on_pause()
+        self._engine.pause()
 
     def reset(self) -> None:
         """Reset timer (for hotkeys)."""
-        self._on_reset()
+        self._engine.reset_to_work()
+
+    def button_stats(self) -> dict[str, int]:
+        """Canvas item churn of the three buttons (items created vs itemconfig calls)."""
+        out: dict[str, int] = {}
+        for btn in (self._btn_main, self._btn_pomodoro, self._btn_break):
+            for key, value in btn.render_stats().items():
+                out[key] = out.get(key, 0) + value
+        return out
+
+    def tick_stats(self) -> dict[str, float]:
+        """Measured wakeup lag/jitter and last end-of-phase error (ms)."""
+        return self._engine.stats.as_dict()
 
 
 # [END SPEC:POMODORO-1:TIMER]
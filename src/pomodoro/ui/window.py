@@ -24,6 +24,76 @@ def setup_overlay(
         root.protocol("WM_DELETE_WINDOW", on_close)
 
 
+# [START SPEC:POMODORO-21:VISIBILITY]
+# req_refs: REQ-POMODORO-21-01
+def track_visibility(root: tk.Tk, on_change: Callable[[bool], None]) -> None:
+    """
+    Call on_change(hidden) when the overlay is withdrawn/iconified (<Unmap>),
+    fully covered (<Visibility> VisibilityFullyObscured) or shown again.
+    Only events of the toplevel itself count (children unmap in compact mode).
+    """
+    state = {"mapped": True, "obscured": False, "hidden": False}
+
+    def update() -> None:
+        hidden = not state["mapped"] or state["obscured"]
+        if hidden != state["hidden"]:
+            state["hidden"] = hidden
+            on_change(hidden)
+
+    def on_map(event: tk.Event, mapped: bool) -> None:
+        if event.widget is root:
+            state["mapped"] = mapped
+            if mapped:
+                state["obscured"] = False
+            update()
+
+    def on_visibility(event: tk.Event) -> None:
+        if event.widget is root:
+            state["obscured"] = str(getattr(event, "state", "")) == "VisibilityFullyObscured"
+            update()
+
+    root.bind("<Map>", lambda e: on_map(e, True), add="+")
+    root.bind("<Unmap>", lambda e: on_map(e, False), add="+")
+    root.bind("<Visibility>", on_visibility, add="+")
+
+
+# [END SPEC:POMODORO-21:VISIBILITY]
+
+
+# [START SPEC:POMODORO-23:TK_COUNTS]
+# req_refs: REQ-POMODORO-23-02
+def tk_object_counts(root: tk.Tk) -> dict[str, int]:
+    """
+    Tk-side objects tracemalloc cannot see: widgets, canvas items, pending
+    after() events, Tcl commands (bound callbacks), images, Text widgets with undo history.
+    A count that keeps climbing over a session is a leak.
+    """
+    widgets = 0
+    canvas_items = 0
+    text_undo = 0
+    stack: list[tk.Misc] = [root]
+    while stack:
+        w = stack.pop()
+        widgets += 1
+        if isinstance(w, tk.Canvas):
+            canvas_items += len(w.find_all())
+        elif isinstance(w, tk.Text) and w.getboolean(w.cget("undo")):
+            # Tk has no undo-depth query: count Text widgets holding an undo history.
+            text_undo += int(w.getboolean(w.edit("canundo")))
+        stack.extend(w.winfo_children())
+    return {
+        "widgets": widgets,
+        "canvas_items": canvas_items,
+        "after_events": len(root.tk.splitlist(root.tk.call("after", "info"))),
+        "tcl_commands": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+        "images": len(root.tk.splitlist(root.tk.call("image", "names"))),
+        "texts_with_undo": text_undo,
+    }
+
+
+# [END SPEC:POMODORO-23:TK_COUNTS]
+
+
 def set_alpha(root: tk.Tk, alpha: float) -> None:
     """Set window transparency. Pre: 0.3 <= alpha <= 1.0."""
     root.attributes("-alpha", max(0.3, min(1.0, alpha)))
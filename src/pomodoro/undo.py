@@ -0,0 +1,177 @@
+"""Bounded undo/redo history for the task editor: compact diffs, typing runs merged."""
+# [START SPEC:POMODORO-24:UNDO]
+# req_refs: REQ-POMODORO-24-01, REQ-POMODORO-24-02, REQ-POMODORO-24-03
+
+import sys
+import time
+from collections import deque
+from typing import Callable
+
+# Default history cap (config: undo_max_kb).
+DEFAULT_UNDO_MAX_KB = 1024
+# Single-character edits closer than this (and adjacent) join one undo step.
+TYPING_RUN_S = 1.0
+# Estimated cost of one Change besides the removed text (object, ints, deque slot).
+_ENTRY_BYTES = 120
+
+Pos = tuple[int, int]  # (line, column) as in Tk text indexes, line 1-based
+
+
+def advance(start: Pos, text: str) -> Pos:
+    """Position right after text inserted at start."""
+    line, col = start
+    breaks = text.count("\n")
+    if not breaks:
+        return line, col + len(text)
+    return line + breaks, len(text) - text.rfind("\n") - 1
+
+
+class Change:
+    """
+    One edit as the buffer sees it afterwards: [start, end) is the inserted
+    text, `removed` the text it replaced. Inserted text is not stored: undo
+    reads it back from the buffer, so a large paste costs one entry, not a copy.
+    """
+
+    __slots__ = ("start", "end", "removed")
+
+    def __init__(self, start: Pos, end: Pos, removed: str) -> None:
+        self.start = start
+        self.end = end
+        self.removed = removed
+
+    @property
+    def size(self) -> int:
+        return _ENTRY_BYTES + (sys.getsizeof(self.removed) if self.removed else 0)
+
+    def _single_char(self) -> bool:
+        """Typing-sized: one character typed or deleted on one line."""
+        if self.removed:
+            return self.start == self.end and len(self.removed) == 1 and self.removed != "\n"
+        return self.start[0] == self.end[0] and self.end[1] - self.start[1] == 1
+
+
+class UndoJournal:
+    """
+    Undo and redo stacks of Change, bounded by max_bytes in total (oldest undo
+    steps and furthest redo steps are dropped first). undo()/redo() hand the
+    Change to `apply`, which edits the buffer and returns the inverse Change;
+    each step is O(size of that edit), independent of the buffer size.
+    Adjacent single-character inserts, backspaces and deletes within
+    TYPING_RUN_S merge into the previous step. No tkinter import.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_UNDO_MAX_KB * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._undo: deque[Change] = deque()
+        self._redo: deque[Change] = deque()
+        self._bytes = 0
+        self._last_record = float("-inf")
+        self._run_open = False
+        self.recorded = 0
+        self.merged = 0
+        self.dropped = 0
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+        self._run_open = False
+
+    def record(self, change: Change) -> None:
+        """A new edit happened in the buffer: push it (or extend the typing run); redo is lost."""
+        now = self._clock()
+        if self._redo:
+            self._bytes -= sum(c.size for c in self._redo)
+            self._redo.clear()
+        prev = self._undo[-1] if self._undo else None
+        typing = change._single_char()
+        if (
+            prev is not None
+            and typing
+            and self._run_open
+            and now - self._last_record <= TYPING_RUN_S
+            and self._merge(prev, change)
+        ):
+            self.merged += 1
+        else:
+            self._undo.append(change)
+            self._bytes += change.size
+        self.recorded += 1
+        self._last_record = now
+        self._run_open = typing
+        self._trim()
+
+    def _merge(self, prev: Change, change: Change) -> bool:
+        before = prev.size
+        if not prev.removed and not change.removed and change.start == prev.end:
+            prev.end = change.end  # typing on
+        elif prev.start == prev.end and change.removed and change.start == prev.start:
+            prev.removed += change.removed  # Delete key
+        elif (
+            prev.start == prev.end
+            and change.removed
+            and advance(change.start, change.removed) == prev.start
+        ):
+            prev.removed = change.removed + prev.removed  # Backspace
+            prev.start = prev.end = change.start
+        else:
+            return False
+        self._bytes += prev.size - before
+        return True
+
+    def undo(self, apply: Callable[[Change], Change]) -> bool:
+        """Revert the last step through apply. False if there is nothing to undo."""
+        return self._step(self._undo, self._redo, apply)
+
+    def redo(self, apply: Callable[[Change], Change]) -> bool:
+        """Re-apply the last undone step. False if there is nothing to redo."""
+        return self._step(self._redo, self._undo, apply)
+
+    def _step(
+        self, source: "deque[Change]", target: "deque[Change]", apply: Callable[[Change], Change]
+    ) -> bool:
+        if not source:
+            return False
+        change = source.pop()
+        self._bytes -= change.size
+        inverse = apply(change)
+        target.append(inverse)
+        self._bytes += inverse.size
+        self._run_open = False
+        self._trim()
+        return True
+
+    def _trim(self) -> None:
+        """Drop the furthest redo steps, then the oldest undo steps, until under the cap."""
+        while self._bytes > self.max_bytes and (self._redo or self._undo):
+            stack = self._redo if self._redo else self._undo
+            self._bytes -= stack.popleft().size
+            self.dropped += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "undo_steps": len(self._undo),
+            "redo_steps": len(self._redo),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "recorded": self.recorded,
+            "merged": self.merged,
+            "dropped": self.dropped,
+        }
+
+
+# [END SPEC:POMODORO-24:UNDO]
@@ -0,0 +1,61 @@
+"""Render-on-change guard: last rendered value per widget option, pushed only on real change."""
+# [START SPEC:POMODORO-20:VIEW_MODEL]
+# req_refs: REQ-POMODORO-20-01, REQ-POMODORO-20-02
+
+import time
+from typing import Any, Callable
+
+# Timer progress is quantized to this many steps (0.25% — below a pixel of the bar).
+PROGRESS_STEPS = 400
+
+_MISSING = object()
+
+
+def quantize_progress(percent: float, steps: int = PROGRESS_STEPS) -> float:
+    return round(percent * steps / 100.0) * 100.0 / steps
+
+
+class ViewModel:
+    """
+    Sits between state (TimerEngine, task model) and Tk widgets. push(key, value,
+    apply) remembers the last value rendered under key ("clock.text",
+    "progress.value", ...) and calls apply(value) — one Tcl round trip — only if
+    value differs. Counts applied vs skipped pushes; stats() reports both per
+    hour since creation. No tkinter import.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._started = clock()
+        self._last: dict[str, Any] = {}
+        self.applied = 0
+        self.skipped = 0
+
+    def push(self, key: str, value: Any, apply: Callable[[Any], Any]) -> bool:
+        """Render value under key unless it is already shown. Returns True if applied."""
+        if self._last.get(key, _MISSING) == value:
+            self.skipped += 1
+            return False
+        apply(value)
+        self._last[key] = value
+        self.applied += 1
+        return True
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Forget the shown value (all keys if None): the next push applies."""
+        if key is None:
+            self._last.clear()
+        else:
+            self._last.pop(key, None)
+
+    def stats(self) -> dict[str, float]:
+        hours = max(self._clock() - self._started, 1e-9) / 3600.0
+        return {
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "applied_per_hour": round(self.applied / hours, 1),
+            "skipped_per_hour": round(self.skipped / hours, 1),
+        }
+
+
+# [END SPEC:POMODORO-20:VIEW_MODEL]
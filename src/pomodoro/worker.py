@@ -0,0 +1,116 @@
+"""Background worker: latest-wins jobs off the UI thread, results posted back to it."""
+# [START SPEC:POMODORO-16:WORKER]
+# req_refs: REQ-POMODORO-16-01, REQ-POMODORO-16-02
+
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable
+
+
+class BackgroundWorker:
+    """
+    One daemon thread running jobs keyed by name. submit() for a key whose
+    previous job has not started yet replaces it (stale work is cancelled);
+    a result that was overtaken by a newer submit is discarded instead of
+    delivered. Results are handed to `post` (e.g. lambda fn: root.after_idle(fn))
+    so on_done always runs on the UI thread.
+    """
+
+    def __init__(
+        self, post: Callable[[Callable[[], None]], Any], name: str = "pomodoro-worker"
+    ) -> None:
+        self._post = post
+        self._cond = threading.Condition()
+        self._queue: OrderedDict[str, tuple[int, Callable[[], Any], Callable[[Any], None]]] = (
+            OrderedDict()
+        )
+        self._latest: dict[str, int] = {}
+        self._gen = 0
+        self._closed = False
+        self.submitted = 0
+        self.cancelled = 0
+        self.discarded = 0
+        self.delivered = 0
+        self.errors = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, key: str, job: Callable[[], Any], on_done: Callable[[Any], None]) -> int:
+        """Queue job(); on_done(result) later runs on the UI thread unless superseded."""
+        with self._cond:
+            self._gen += 1
+            self.submitted += 1
+            if key in self._queue:
+                self.cancelled += 1
+                del self._queue[key]
+            self._queue[key] = (self._gen, job, on_done)
+            self._latest[key] = self._gen
+            self._cond.notify()
+            return self._gen
+
+    def cancel(self, key: str) -> None:
+        """Drop a queued job and discard the result of a running one."""
+        with self._cond:
+            self._gen += 1
+            self._latest[key] = self._gen
+            if self._queue.pop(key, None) is not None:
+                self.cancelled += 1
+
+    def is_current(self, key: str, gen: int) -> bool:
+        with self._cond:
+            return self._latest.get(key) == gen
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "cancelled": self.cancelled,
+            "discarded": self.discarded,
+            "delivered": self.delivered,
+            "errors": self.errors,
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                key, (gen, job, on_done) = self._queue.popitem(last=False)
+            try:
+                result = job()
+            except Exception:
+                with self._cond:
+                    self.errors += 1
+                continue
+            with self._cond:
+                if self._closed:
+                    return  # the UI thread may be blocked in close(): never post to it
+                if self._latest.get(key) != gen:
+                    self.discarded += 1
+                    continue
+            try:
+                self._post(partial(self._deliver, key, gen, on_done, result))
+            except Exception:
+                return  # UI loop is gone (RuntimeError / TclError)
+
+    def _deliver(self, key: str, gen: int, on_done: Callable[[Any], None], result: Any) -> None:
+        """UI thread: last staleness check, then hand over the result."""
+        if not self.is_current(key, gen):
+            with self._cond:
+                self.discarded += 1
+            return
+        with self._cond:
+            self.delivered += 1
+        on_done(result)
+
+
+# [END SPEC:POMODORO-16:WORKER]
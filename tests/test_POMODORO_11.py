@@ -0,0 +1,91 @@
+"""PendingIndex and TaskModel lookups against a naive list scan. [REQ-POMODORO-11-01..04]"""
+
+import random
+
+import pytest
+
+from pomodoro.task_model import PendingIndex, TaskList, TaskModel
+
+
+class SmallBlocks(PendingIndex):
+    """Tiny blocks: splits, merges and emptied blocks happen every few operations."""
+
+    BLOCK = 4
+
+
+def check(index: PendingIndex, bits: list[int]) -> None:
+    pending = [i for i, b in enumerate(bits) if b]
+    assert len(index) == len(bits)
+    assert index.pending_count == len(pending)
+    assert index.first() == (pending[0] if pending else None)
+    for k in (0, 1, len(pending) // 2, len(pending) - 1, len(pending)):
+        expected = pending[k] if 0 <= k < len(pending) else None
+        assert index.kth(k) == expected
+    assert index.upcoming(5) == pending[:5]
+    assert index.upcoming(len(bits) + 1) == pending
+
+
+@pytest.mark.parametrize("cls", [SmallBlocks, PendingIndex])
+@pytest.mark.parametrize("seed", range(20))
+def test_random_operations_match_list_scan(cls: type, seed: int) -> None:
+    rng = random.Random(seed)
+    bits = [rng.randint(0, 1) for _ in range(rng.randrange(0, 40))]
+    index = cls(bytearray(bits))
+    check(index, bits)
+    for _ in range(300):
+        op = rng.random()
+        if op < 0.35 and bits:  # set / clear one position
+            i = rng.randrange(len(bits))
+            bits[i] = rng.randint(0, 1)
+            index.set(i, bool(bits[i]))
+        elif op < 0.6:  # insert a run (also at the very end)
+            first = rng.randint(0, len(bits))
+            new = [rng.randint(0, 1) for _ in range(rng.randrange(1, 12))]
+            bits[first:first] = new
+            index.replace(first, 0, bytearray(new))
+        elif op < 0.85 and bits:  # delete a run
+            first = rng.randrange(len(bits))
+            count = rng.randint(1, min(12, len(bits) - first))
+            del bits[first : first + count]
+            index.replace(first, count, bytearray())
+        elif bits:  # replace a run by one of another length
+            first = rng.randrange(len(bits))
+            count = rng.randint(0, min(6, len(bits) - first))
+            new = [rng.randint(0, 1) for _ in range(rng.randrange(0, 8))]
+            bits[first : first + count] = new
+            index.replace(first, count, bytearray(new))
+        check(index, bits)
+
+
+def test_large_index_kth() -> None:
+    rng = random.Random(7)
+    bits = [int(rng.random() < 0.01) for _ in range(50_000)]
+    index = PendingIndex(bytearray(bits))
+    check(index, bits)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_task_model_active_and_upcoming(seed: int) -> None:
+    rng = random.Random(seed)
+    words = ["", "  ", "write", "read", "+ done", "+done too", "call"]
+    lines = [rng.choice(words) for _ in range(30)]
+    model = TaskModel(TaskList.from_lines(lines))
+    for _ in range(200):
+        if rng.random() < 0.5 and lines:
+            i = rng.randrange(len(lines))
+            done = rng.random() < 0.5
+            model.set_done(i, done)
+            text = lines[i].lstrip("+ \t") if lines[i].lstrip().startswith("+") else lines[i]
+            lines[i] = "+ " + text if done else text
+        else:
+            first = rng.randint(0, len(lines))
+            count = rng.randint(0, min(3, len(lines) - first))
+            new = [rng.choice(words) for _ in range(rng.randrange(0, 4))]
+            lines[first : first + count] = new
+            model.replace_lines(first, count, new)
+        naive = TaskList.from_lines(lines)
+        pending = [i for i in range(len(naive)) if naive.is_pending(i)]
+        assert model.total == len(lines)
+        assert model.done_count == naive.done_count
+        assert model.active_index == (pending[0] if pending else None)
+        assert model.upcoming(3) == pending[:3]
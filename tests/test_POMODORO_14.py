@@ -0,0 +1,204 @@
+"""tasks.txt journal: diff, torn/corrupt records, checkpoints, recovery. [REQ-POMODORO-14-01..03]"""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from pomodoro import task_journal as tj
+from pomodoro.task_journal import TaskFileWriter, diff_lines, journal_path, read_journal, recover
+
+
+def lines_of(n: int, prefix: str = "task") -> list[str]:
+    return [f"{prefix} {i}" for i in range(n)]
+
+
+def bump_mtime(path: Path) -> None:
+    """Make an edit visible even on filesystems with coarse mtimes."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+# --- diff_lines ---
+
+
+def test_diff_equal_is_none() -> None:
+    assert diff_lines(["a", "b"], ["a", "b"]) is None
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_diff_applies_back(seed: int) -> None:
+    rng = random.Random(seed)
+    old = [rng.choice("abc") for _ in range(rng.randrange(0, 3000))]
+    new = list(old)
+    for _ in range(rng.randrange(1, 4)):
+        first = rng.randint(0, len(new))
+        count = rng.randint(0, min(5, len(new) - first))
+        new[first : first + count] = [rng.choice("abcd") for _ in range(rng.randrange(0, 5))]
+    change = diff_lines(old, new)
+    if new == old:
+        assert change is None
+        return
+    assert change is not None
+    first, count, repl = change
+    patched = list(old)
+    patched[first : first + count] = repl
+    assert patched == new
+
+
+# --- journal records ---
+
+
+def test_torn_last_record_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    writer = TaskFileWriter(path)
+    writer.write(lines_of(3))
+    writer.write(["task 0", "ticked", "task 2"])
+    writer.write(["task 0", "ticked", "task 2", "added"])
+    writer._close_journal()
+    jpath = journal_path(path)
+    jpath.write_bytes(jpath.read_bytes()[:-5])  # crash in the middle of the last append
+    records = read_journal(path)
+    assert [r["op"] for r in records] == ["base", "patch"]
+    assert recover(path)
+    assert path.read_text(encoding="utf-8") == "task 0\nticked\ntask 2"
+    assert not jpath.exists()
+
+
+def test_bad_crc_stops_replay(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    writer = TaskFileWriter(path)
+    writer.write(lines_of(3))
+    writer.write(["changed", "task 1", "task 2"])
+    writer.write(["changed", "task 1", "changed too"])
+    writer._close_journal()
+    jpath = journal_path(path)
+    raw = jpath.read_bytes().split(b"\n")
+    raw[1] = raw[1].replace(b"changed", b"CHANGED")  # payload no longer matches its crc
+    jpath.write_bytes(b"\n".join(raw))
+    assert [r["op"] for r in read_journal(path)] == ["base"]
+    assert recover(path)
+    assert path.read_text(encoding="utf-8") == "task 0\ntask 1\ntask 2"
+
+
+# --- writer ---
+
+
+def test_patches_then_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    writer = TaskFileWriter(path)
+    lines = lines_of(1000)
+    writer.write(lines)
+    lines[500] = "+ task 500"
+    lines.append("appended")
+    assert writer.write(lines)
+    assert not writer.write(list(lines))
+    assert writer.stats()["full_writes"] == 1 and writer.stats()["patches"] == 1
+    writer.close()
+    assert path.read_text(encoding="utf-8") == "\n".join(lines)
+    assert not journal_path(path).exists()
+    assert writer.stats()["checkpoints"] == 1
+
+
+def test_prime_avoids_full_write(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    path.write_text("a\nb", encoding="utf-8")
+    writer = TaskFileWriter(path)
+    writer.prime(["a", "b"])
+    writer.write(["a", "+ b"])
+    writer.close()
+    assert writer.stats()["full_writes"] == 0
+    assert path.read_text(encoding="utf-8") == "a\n+ b"
+
+
+def test_file_changed_outside_is_rewritten_whole(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    writer = TaskFileWriter(path)
+    lines = lines_of(50)
+    writer.write(lines)
+    lines[40] = "+ task 40"
+    writer.write(lines)
+    path.write_text("edited by hand\n", encoding="utf-8")
+    bump_mtime(path)
+    writer.checkpoint()
+    # Offsets were computed for the old file: no in-place patch, a full rewrite instead.
+    assert writer.stats()["checkpoints"] == 0
+    assert writer.stats()["full_writes"] == 2
+    assert path.read_text(encoding="utf-8") == "\n".join(lines)
+
+
+# --- recovery ---
+
+
+def test_recover_patches_onto_matching_file(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    writer = TaskFileWriter(path)
+    writer.write(["a", "b", "c"])
+    writer.write(["a", "+ b", "c", "d"])
+    writer._close_journal()  # crash: journal left, tasks.txt not merged
+    assert path.read_text(encoding="utf-8") == "a\nb\nc"
+    assert recover(path)
+    assert path.read_text(encoding="utf-8") == "a\n+ b\nc\nd"
+    assert not recover(path)
+
+
+def test_recover_stamp_mismatch_sets_journal_aside(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    writer = TaskFileWriter(path)
+    writer.write(["a", "b", "c"])
+    writer.write(["a", "+ b", "c"])
+    writer._close_journal()
+    path.write_text("mine\n", encoding="utf-8")
+    bump_mtime(path)
+    with pytest.raises(ValueError):
+        recover(path)
+    assert path.read_text(encoding="utf-8") == "mine\n"
+    assert not journal_path(path).exists()
+    assert (tmp_path / "tasks.txt.journal.bad").exists()
+
+
+def interrupted_checkpoint(path: Path, lines: list[str], k: int) -> tuple[int, str]:
+    """Journal a checkpoint from line k, then write only part of its tail (crash)."""
+    start = sum(len(x.encode("utf-8")) + 1 for x in lines[:k]) - 1
+    tail = "\n" + "\n".join(lines[k:])
+    prefix = tj._prefix_crc(path, start)
+    record = {"op": "checkpoint", "start": start, "tail": tail, "prefix": prefix}
+    with open(journal_path(path), "ab") as f:
+        f.write(tj._encode_record(record))
+    with open(path, "r+b") as f:
+        f.seek(start)
+        f.write(tail.encode("utf-8")[:7])
+        f.truncate()
+    return start, tail
+
+
+def test_recover_after_interrupted_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    old = lines_of(100)
+    writer = TaskFileWriter(path)
+    writer.write(old)
+    writer._close_journal()
+    new = list(old)
+    new[60] = "+ task 60"
+    new.append("task 100")
+    interrupted_checkpoint(path, new, 60)
+    assert recover(path)
+    assert path.read_text(encoding="utf-8") == "\n".join(new)
+    assert not journal_path(path).exists()
+
+
+def test_recover_checkpoint_with_changed_prefix_is_refused(tmp_path: Path) -> None:
+    path = tmp_path / "tasks.txt"
+    old = lines_of(100)
+    TaskFileWriter(path).write(old)
+    new = list(old)
+    new[60] = "+ task 60"
+    interrupted_checkpoint(path, new, 60)
+    data = bytearray(path.read_bytes())
+    data[0:6] = b"TASK 0"  # edited by hand before recovery ran
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        recover(path)
+    assert path.read_bytes() == bytes(data)
+    assert (tmp_path / "tasks.txt.journal.bad").exists()
@@ -0,0 +1,232 @@
+"""SQLite task store: positions, renumbering, counters, range saves. [REQ-POMODORO-15-01..05]"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from pomodoro import storage_sqlite
+from pomodoro.persist import ConfigWriter
+from pomodoro.storage_sqlite import POS_GAP, SqliteStore
+from pomodoro.task_model import TaskList
+
+WORDS = ["alpha", "beta", "", "  ", "gamma", "дельта"]
+
+
+def random_line(rng: random.Random) -> str:
+    return ("+ " if rng.random() < 0.3 else "") + rng.choice(WORDS) + str(rng.randrange(100))
+
+
+def db_rows(store: SqliteStore) -> list[tuple[int, int, str, int]]:
+    return store._db.execute("SELECT id, pos, text, status FROM tasks ORDER BY pos").fetchall()
+
+
+def check_store(store: SqliteStore, lines: list[str]) -> None:
+    """Database, in-memory mirror and trigger-kept counters all agree with lines."""
+    rows = db_rows(store)
+    assert [r[0] for r in rows] == list(store._ids)
+    assert [r[1] for r in rows] == list(store._pos)
+    positions = [r[1] for r in rows]
+    assert positions == sorted(set(positions))
+    expected = TaskList.from_lines(lines)
+    fresh = SqliteStore(store.path)
+    assert list(fresh.load_tasks().lines()) == list(expected.lines())
+    fresh.close()
+    counts = dict(store._db.execute("SELECT status, n FROM task_counts").fetchall())
+    actual = dict(
+        store._db.execute("SELECT status, count(*) FROM tasks GROUP BY status").fetchall()
+    )
+    for status in (storage_sqlite.STATUS_PENDING, storage_sqlite.STATUS_DONE,
+                   storage_sqlite.STATUS_BLANK):
+        assert counts[status] == actual.get(status, 0)
+    assert store.done_count() == expected.done_count
+    assert store.task_count() == len(expected)
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    store = SqliteStore(tmp_path / storage_sqlite.DB_FILENAME)
+    yield store
+    store.close()
+
+
+# --- text import / export ---
+
+
+def test_import_export_round_trip(store: SqliteStore) -> None:
+    lines = ["+ done one", "pending", "", "+ готово", "  ", "last"]
+    assert store.import_text("\n".join(lines) + "\n") == len(lines)
+    assert store.export_text() == "\n".join(lines)
+    assert store.next_pending() is not None
+    assert store.next_pending()[1] == "pending"
+    check_store(store, lines)
+    assert store.import_text("") == 0
+    assert store.export_text() == ""
+    check_store(store, [])
+
+
+def test_import_then_save_tasks_touches_changed_rows_only(store: SqliteStore) -> None:
+    lines = [f"task {i}" for i in range(100)]
+    store.import_text("\n".join(lines))
+    lines[40] = "+ task 40"
+    assert store.save_tasks(TaskList.from_lines(lines))
+    assert (store.row_updates, store.row_inserts, store.row_deletes) == (1, 0, 0)
+    assert not store.save_tasks(TaskList.from_lines(lines))
+    check_store(store, lines)
+
+
+# --- positions ---
+
+
+def test_inserts_take_positions_between_neighbours(store: SqliteStore) -> None:
+    store.import_text("a\nb")
+    assert list(store._pos) == [0, POS_GAP]
+    assert store.save_change(1, 0, ["x", "y", "z"])
+    assert list(store._pos) == [0, POS_GAP // 4, POS_GAP // 2, 3 * POS_GAP // 4, POS_GAP]
+    assert store.save_change(0, 0, ["first"])
+    assert store.save_change(6, 0, ["end"])
+    assert store._pos[0] < 0 < store._pos[-2] < store._pos[-1]
+    assert store.renumbers == 0
+    check_store(store, ["first", "a", "x", "y", "z", "b", "end"])
+
+
+def test_used_up_gap_renumbers(store: SqliteStore) -> None:
+    store.import_text("a\nb")
+    lines = ["a", "b"]
+    # Each insert right after "a" halves the gap to its neighbour.
+    for k in range(POS_GAP.bit_length() + 1):
+        assert store.save_change(1, 0, [f"n{k}"])
+        lines.insert(1, f"n{k}")
+    assert store.renumbers == 1
+    check_store(store, lines)
+
+
+def test_renumber_keeps_order(store: SqliteStore) -> None:
+    lines = [f"t{i}" for i in range(10)]
+    store.import_text("\n".join(lines))
+    store.save_change(3, 2, ["x"])
+    del lines[3:5]
+    lines.insert(3, "x")
+    with store._tx() as db:
+        store._renumber(db, 7)
+    assert list(store._pos) == list(range(0, 7 * len(lines), 7))
+    check_store(store, lines)
+
+
+# --- known-range saves ---
+
+
+def test_tick_is_one_update(store: SqliteStore) -> None:
+    store.import_text("a\nb\nc")
+    assert store.save_change(1, 1, ["+ b"])
+    assert (store.row_updates, store.row_inserts, store.row_deletes) == (1, 0, 0)
+    assert not store.save_change(1, 1, ["+ b"])
+    assert store.done_count() == 1
+    check_store(store, ["a", "+ b", "c"])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_changes_match_text(store: SqliteStore, seed: int) -> None:
+    rng = random.Random(seed)
+    lines = [random_line(rng) for _ in range(rng.randrange(0, 40))]
+    store.import_text("\n".join(lines))
+    for step in range(60):
+        first = rng.randint(0, len(lines))
+        old_count = rng.randint(0, min(4, len(lines) - first))
+        new_lines = [random_line(rng) for _ in range(rng.randrange(0, 4))]
+        lines[first : first + old_count] = new_lines
+        if step % 2:
+            store.save_change(first, old_count, new_lines)
+        else:
+            store.save_tasks(TaskList.from_lines(lines))
+        if step % 20 == 19:
+            with store._tx() as db:
+                store._renumber(db, rng.choice([1, 3, POS_GAP]))
+    check_store(store, lines)
+
+
+# --- TaskList change record ---
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_take_change_replays_onto_last_take(seed: int) -> None:
+    rng = random.Random(seed)
+    tasks = TaskList.from_lines(random_line(rng) for _ in range(rng.randrange(0, 30)))
+    base = list(tasks.take_copy().lines())
+    for _ in range(200):
+        op = rng.random()
+        n = len(tasks)
+        if op < 0.3 and n:
+            tasks.set_done(rng.randrange(n), rng.random() < 0.5)
+        elif op < 0.5 and n:
+            tasks.set_text(rng.randrange(n), rng.choice(WORDS))
+        else:
+            first = rng.randint(0, n)
+            old_count = rng.randint(0, min(3, n - first))
+            tasks.replace_lines(
+                first, old_count, [random_line(rng) for _ in range(rng.randrange(0, 3))]
+            )
+        if rng.random() < 0.2:
+            change = tasks.take_change()
+            if change is not None:
+                first, old_count, new_lines = change
+                base[first : first + old_count] = new_lines
+            assert base == list(tasks.lines())
+    change = tasks.take_change()
+    if change is not None:
+        first, old_count, new_lines = change
+        base[first : first + old_count] = new_lines
+    assert base == list(tasks.lines())
+    assert tasks.take_change() is None
+
+
+# --- ConfigWriter hands the known range to the backends ---
+
+
+def test_config_writer_sqlite_tick_skips_the_diff(tmp_path: Path, monkeypatch) -> None:
+    writer = ConfigWriter(delay=60.0, base_dir=lambda: tmp_path)
+    tasks = TaskList.from_lines([f"task {i}" for i in range(50)])
+    cfg = {"storage": "sqlite", "tasks": tasks}
+    try:
+        writer.request(cfg)
+        writer.flush()
+        store = storage_sqlite.get_store(tmp_path)
+        full_saves = []
+        monkeypatch.setattr(store, "save_tasks", lambda t: full_saves.append(t))
+        store.row_updates = store.row_inserts = store.row_deletes = 0
+        tasks.set_done(7, True)
+        writer.request(cfg)
+        writer.flush()
+        assert (store.row_updates, store.row_inserts, store.row_deletes) == (1, 0, 0)
+        tasks.replace_lines(10, 2, ["new"])
+        writer.request(cfg)
+        writer.flush()
+        writer.request(cfg)
+        writer.flush()
+        assert full_saves == []
+        assert writer.skipped_unchanged == 1
+        check_store(store, list(tasks.lines()))
+        # Another list object is diffed in full.
+        cfg["tasks"] = tasks.copy()
+        writer.request(cfg)
+        writer.flush()
+        assert len(full_saves) == 1
+    finally:
+        writer.close()
+        storage_sqlite._stores.pop(tmp_path / storage_sqlite.DB_FILENAME).close()
+
+
+def test_config_writer_text_tick_is_one_patch(tmp_path: Path) -> None:
+    writer = ConfigWriter(delay=60.0, base_dir=lambda: tmp_path)
+    tasks = TaskList.from_lines([f"task {i}" for i in range(50)])
+    cfg = {"tasks": tasks}
+    writer.request(cfg)
+    writer.flush()
+    tasks.set_done(3, True)
+    tasks.replace_lines(20, 0, ["inserted"])
+    writer.request(cfg)
+    writer.flush()
+    stats = writer.stats()
+    assert (stats["full_writes"], stats["patches"]) == (1, 1)
+    writer.close()
+    assert (tmp_path / "tasks.txt").read_text(encoding="utf-8") == tasks.to_text()
@@ -0,0 +1,73 @@
+"""Event coalescing: bursts merged per key; a raising update keeps the rest. [REQ-POMODORO-17-01]"""
+
+from typing import Callable
+
+import pytest
+
+from pomodoro.coalesce import Coalescer
+
+
+class Loop:
+    """Posted callbacks, run on demand."""
+
+    def __init__(self) -> None:
+        self.posted: list[Callable[[], None]] = []
+
+    def post(self, fn: Callable[[], None]) -> None:
+        self.posted.append(fn)
+
+    def run(self) -> None:
+        posted, self.posted = self.posted, []
+        for fn in posted:
+            fn()
+
+
+def test_burst_runs_latest_update_once() -> None:
+    loop = Loop()
+    co = Coalescer(loop.post)
+    ran: list[str] = []
+    for k in range(5):
+        co.schedule("tasks", lambda k=k: ran.append(f"tasks{k}"))
+    co.schedule("label", lambda: ran.append("label"))
+    assert len(loop.posted) == 1
+    loop.run()
+    assert ran == ["tasks4", "label"]
+    assert co.counters() == {"tasks": (5, 1), "label": (1, 1)}
+    assert co.stats() == {"raw": 6, "executed": 2, "pending": 0}
+
+
+def test_cancel_and_explicit_flush() -> None:
+    loop = Loop()
+    co = Coalescer(loop.post)
+    ran: list[str] = []
+    co.schedule("a", lambda: ran.append("a"))
+    co.schedule("b", lambda: ran.append("b"))
+    co.cancel("a")
+    co.flush()
+    assert ran == ["b"] and not co.pending
+    loop.run()  # the posted flush finds nothing left
+    assert ran == ["b"]
+
+
+def test_raising_update_keeps_the_rest() -> None:
+    loop = Loop()
+    co = Coalescer(loop.post)
+    ran: list[str] = []
+
+    def boom() -> None:
+        ran.append("boom")
+        co.schedule("c", lambda: ran.append("c new"))
+        raise RuntimeError("update failed")
+
+    co.schedule("a", lambda: ran.append("a"))
+    co.schedule("b", boom)
+    co.schedule("c", lambda: ran.append("c old"))
+    co.schedule("d", lambda: ran.append("d"))
+    loop.posted.clear()
+    with pytest.raises(RuntimeError):
+        co.flush()
+    assert ran == ["a", "boom"]
+    assert co.pending and len(loop.posted) == 1
+    loop.run()
+    assert ran == ["a", "boom", "c new", "d"]
+    assert not co.pending and not loop.posted
@@ -0,0 +1,207 @@
+"""Undo journal: typing runs, byte cap, redo invalidation. [REQ-POMODORO-24-01..03]"""
+
+import random
+
+import pytest
+
+from pomodoro.undo import TYPING_RUN_S, Change, Pos, UndoJournal, advance
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Buffer:
+    """Plain-string stand-in for the Text widget; apply() as TasksWidget._apply_change."""
+
+    def __init__(self, journal: UndoJournal, text: str = "") -> None:
+        self.journal = journal
+        self.text = text
+
+    def offset(self, pos: Pos) -> int:
+        line, col = pos
+        return sum(len(s) + 1 for s in self.text.split("\n")[: line - 1]) + col
+
+    def pos(self, offset: int) -> Pos:
+        return advance((1, 0), self.text[:offset])
+
+    def edit(self, start: int, end: int, inserted: str = "") -> None:
+        """A user edit of text[start:end], recorded like TasksWidget._tracked_edit."""
+        removed = self.text[start:end]
+        begin = self.pos(start)
+        self.text = self.text[:start] + inserted + self.text[end:]
+        self.journal.record(Change(begin, advance(begin, inserted), removed))
+
+    def type(self, offset: int, chars: str) -> None:
+        for k, ch in enumerate(chars):
+            self.edit(offset + k, offset + k, ch)
+
+    def apply(self, change: Change) -> Change:
+        a, b = self.offset(change.start), self.offset(change.end)
+        inserted = self.text[a:b]
+        self.text = self.text[:a] + change.removed + self.text[b:]
+        return Change(change.start, advance(change.start, change.removed), inserted)
+
+    def undo(self) -> bool:
+        return self.journal.undo(self.apply)
+
+    def redo(self) -> bool:
+        return self.journal.redo(self.apply)
+
+
+def check_bytes(journal: UndoJournal) -> None:
+    steps = list(journal._undo) + list(journal._redo)
+    assert journal.stats()["bytes"] == sum(c.size for c in steps)
+    assert journal.stats()["bytes"] <= journal.max_bytes
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+# --- typing runs ---
+
+
+def test_typed_word_is_one_step(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(clock=clock))
+    buf.type(0, "hello")
+    assert buf.journal.stats()["undo_steps"] == 1
+    assert buf.journal.merged == 4
+    assert buf.undo() and buf.text == ""
+    assert buf.redo() and buf.text == "hello"
+    check_bytes(buf.journal)
+
+
+def test_newline_and_pause_split_runs(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(clock=clock))
+    buf.type(0, "ab\ncd")
+    clock.now += TYPING_RUN_S + 0.1
+    buf.type(5, "ef")
+    assert buf.journal.stats()["undo_steps"] == 4  # "ab", "\n", "cd", "ef"
+    buf.undo()
+    assert buf.text == "ab\ncd"
+    buf.undo()
+    assert buf.text == "ab\n"
+    buf.undo()
+    assert buf.text == "ab"
+
+
+def test_backspace_and_delete_runs_merge(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(clock=clock), "hello world")
+    for end in range(11, 6, -1):  # Backspace from the end
+        buf.edit(end - 1, end)
+    assert buf.text == "hello "
+    clock.now += TYPING_RUN_S + 0.1
+    for _ in range(3):  # Delete at the start
+        buf.edit(0, 1)
+    assert buf.text == "lo "
+    assert buf.journal.stats()["undo_steps"] == 2
+    buf.undo()
+    assert buf.text == "hello "
+    buf.undo()
+    assert buf.text == "hello world"
+    check_bytes(buf.journal)
+
+
+def test_non_adjacent_typing_is_a_new_step(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(clock=clock), "abc")
+    buf.type(3, "x")
+    buf.type(0, "y")
+    assert buf.journal.stats()["undo_steps"] == 2
+
+
+def test_undo_ends_the_run(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(clock=clock))
+    buf.type(0, "ab")
+    buf.undo()
+    buf.type(0, "c")
+    buf.type(1, "d")
+    buf.undo()
+    assert buf.text == ""
+
+
+# --- redo invalidation ---
+
+
+def test_new_edit_drops_redo(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(clock=clock))
+    buf.type(0, "one")
+    clock.now += 2
+    buf.type(3, " two")
+    buf.undo()
+    assert buf.journal.can_redo
+    clock.now += 2
+    buf.type(3, "!")
+    assert not buf.journal.can_redo
+    assert not buf.redo()
+    assert buf.text == "one!"
+    check_bytes(buf.journal)
+    buf.undo()
+    buf.undo()
+    assert buf.text == "" and not buf.journal.can_undo
+
+
+# --- byte cap ---
+
+
+def test_oldest_undo_steps_are_dropped(clock: Clock) -> None:
+    chunk = 3000
+    buf = Buffer(UndoJournal(max_bytes=10_000, clock=clock), "x" * chunk * 6)
+    for _ in range(6):
+        buf.edit(0, chunk)  # each step keeps the 3000 removed characters
+        check_bytes(buf.journal)
+    journal = buf.journal
+    assert journal.dropped > 0
+    kept = journal.stats()["undo_steps"]
+    assert kept + journal.dropped == 6
+    while buf.undo():
+        pass
+    assert buf.text == "x" * chunk * kept
+
+
+def test_furthest_redo_is_dropped_first(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(max_bytes=10_000, clock=clock), "keep")
+    buf.edit(4, 4, "y" * 50_000)  # a paste: the entry stores no text
+    assert buf.journal.dropped == 0
+    buf.undo()  # its redo entry holds the 50 000 characters: over the cap
+    assert buf.text == "keep"
+    assert not buf.journal.can_redo
+    assert buf.journal.dropped == 1
+    check_bytes(buf.journal)
+
+
+def test_zero_cap_keeps_nothing(clock: Clock) -> None:
+    buf = Buffer(UndoJournal(max_bytes=0, clock=clock))
+    buf.type(0, "abc")
+    assert not buf.journal.can_undo
+    check_bytes(buf.journal)
+
+
+# --- random edits ---
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_edits_undo_to_each_state(clock: Clock, seed: int) -> None:
+    rng = random.Random(seed)
+    buf = Buffer(UndoJournal(clock=clock), "first line\nsecond\n")
+    states = [buf.text]
+    for _ in range(80):
+        clock.now += TYPING_RUN_S + 0.1  # no merging: one step per edit
+        a = rng.randint(0, len(buf.text))
+        b = rng.randint(a, min(len(buf.text), a + 5))
+        inserted = rng.choice(["", "z", "\n", "ab\ncd", "ю"] if b > a else ["z", "\n"])
+        buf.edit(a, b, inserted)
+        states.append(buf.text)
+    for state in reversed(states[:-1]):
+        assert buf.undo()
+        assert buf.text == state
+    assert not buf.undo()
+    for state in states[1:]:
+        assert buf.redo()
+        assert buf.text == state
+    check_bytes(buf.journal)
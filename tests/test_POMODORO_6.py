@@ -0,0 +1,142 @@
+"""TimerEngine on a VirtualClock: phases, pause/resume, progress. [REQ-POMODORO-6-01..03]"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from pomodoro.engine import BREAK, WORK, TimerEngine
+from pomodoro.ticker import VirtualClock
+
+CFG = {"work_minutes": 25, "break_minutes": 5}
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def make_engine(clock: VirtualClock, events: list | None = None) -> TimerEngine:
+    log = events if events is not None else []
+    engine = TimerEngine(
+        lambda: CFG,
+        clock=clock,
+        on_finish=lambda phase: log.append(("finish", phase)),
+        on_run_state_changed=lambda running: log.append(("running", running)),
+    )
+    engine.reset_to_work()
+    return engine
+
+
+def run_until_stopped(engine: TimerEngine, clock: VirtualClock) -> int:
+    """Drive tick() the way a front end does; returns the number of wakeups."""
+    wakeups = 0
+    while True:
+        clock.advance(engine.next_delay_ms() / 1000.0)
+        wakeups += 1
+        if not engine.tick():
+            return wakeups
+
+
+def test_engine_does_not_import_tkinter() -> None:
+    probe = "import sys, pomodoro.engine; print('tkinter' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", probe], env={**os.environ, "PYTHONPATH": str(SRC)},
+        capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_work_finishes_and_switches_to_break() -> None:
+    clock = VirtualClock()
+    events: list = []
+    engine = make_engine(clock, events)
+    engine.start()
+    assert engine.running and engine.display_text == "25:00"
+    wakeups = run_until_stopped(engine, clock)
+    assert wakeups == 25 * 60
+    assert ("finish", WORK) in events
+    assert engine.phase == BREAK and not engine.running
+    assert engine.display_text == "05:00"
+
+
+def test_break_finishes_and_switches_to_work() -> None:
+    clock = VirtualClock()
+    events: list = []
+    engine = make_engine(clock, events)
+    engine.start_break()
+    engine.start()
+    run_until_stopped(engine, clock)
+    assert events[-1] == ("finish", BREAK)
+    assert engine.phase == WORK and engine.display_text == "25:00"
+
+
+def test_thousands_of_cycles() -> None:
+    clock = VirtualClock()
+    events: list = []
+    engine = make_engine(clock, events)
+    for _ in range(100):
+        engine.start()
+        run_until_stopped(engine, clock)
+    finished = [e[1] for e in events if e[0] == "finish"]
+    assert finished == [WORK, BREAK] * 50
+    # Wakeups land on whole milliseconds: at most 1 ms late each, never early.
+    assert 50 * (25 + 5) * 60 <= clock() < 50 * (25 + 5) * 60 * 1.00001
+
+
+def test_pause_keeps_remaining_time() -> None:
+    clock = VirtualClock()
+    engine = make_engine(clock)
+    engine.start()
+    clock.advance(90.4)
+    engine.tick()
+    engine.pause()
+    assert not engine.running
+    assert abs(engine.remaining - (25 * 60 - 90.4)) < 1e-6
+    clock.advance(3600)  # time while paused does not count
+    assert abs(engine.remaining - (25 * 60 - 90.4)) < 1e-6
+    engine.start()
+    clock.advance(engine.remaining)
+    assert not engine.tick()
+    assert engine.phase == BREAK
+
+
+def test_toggle() -> None:
+    clock = VirtualClock()
+    engine = make_engine(clock)
+    engine.toggle()
+    assert engine.running
+    engine.toggle()
+    assert not engine.running
+
+
+def test_progress_counts_down_from_100() -> None:
+    clock = VirtualClock()
+    engine = make_engine(clock)
+    assert engine.progress == 100.0
+    engine.start()
+    clock.advance(15 * 60)
+    engine.tick()
+    assert abs(engine.progress - 40.0) < 1e-9
+
+
+def test_progress_continues_after_resume() -> None:
+    # Resuming used to reset the phase length to the time left (bar back at 100%).
+    clock = VirtualClock()
+    engine = make_engine(clock)
+    engine.start()
+    clock.advance(15 * 60)
+    engine.tick()
+    engine.pause()
+    engine.start()
+    assert abs(engine.progress - 40.0) < 1e-9
+    clock.advance(5 * 60)
+    engine.tick()
+    assert abs(engine.progress - 20.0) < 1e-9
+
+
+def test_select_mode_ignored_while_running() -> None:
+    clock = VirtualClock()
+    engine = make_engine(clock)
+    engine.start()
+    engine.select_mode(BREAK)
+    assert engine.phase == WORK
+    engine.pause()
+    engine.select_mode(BREAK)
+    assert engine.phase == BREAK and engine.display_text == "05:00"
@@ -0,0 +1,110 @@
+"""Timer scheduler: one armed wakeup, heap order, no re-entrant spin. [REQ-POMODORO-7-01..04]"""
+
+from typing import Any, Callable
+
+import pytest
+
+from pomodoro.scheduler import FIRE_EPSILON, TimerScheduler
+
+
+class FakeBackend:
+    """Event loop stand-in: a list of armed (due time, callback), fired by run_next()."""
+
+    def __init__(self, clock: "Clock") -> None:
+        self.clock = clock
+        self.armed: dict[int, tuple[float, Callable[[], None]]] = {}
+        self._tokens = 0
+
+    def arm(self, delay_ms: int, callback: Callable[[], None]) -> Any:
+        self._tokens += 1
+        self.armed[self._tokens] = (self.clock.now + delay_ms / 1000.0, callback)
+        return self._tokens
+
+    def disarm(self, token: Any) -> None:
+        del self.armed[token]
+
+    def run_next(self) -> None:
+        token = min(self.armed, key=lambda t: self.armed[t][0])
+        due, callback = self.armed.pop(token)
+        self.clock.now = max(self.clock.now, due)
+        callback()
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def backend(clock: Clock) -> FakeBackend:
+    return FakeBackend(clock)
+
+
+def test_one_wakeup_armed_for_earliest(clock: Clock, backend: FakeBackend) -> None:
+    sched = TimerScheduler(backend, clock)
+    order: list[str] = []
+    for name, delay in [("c", 3.0), ("a", 1.0), ("b", 2.0), ("idle", 3600.0)]:
+        sched.add(delay, lambda name=name: order.append(name), name)
+        assert len(backend.armed) == 1
+    for _ in range(3):
+        backend.run_next()
+    assert order == ["a", "b", "c"]
+    assert sched.wakeups == 3 and len(sched) == 1
+
+
+@pytest.mark.parametrize("delay", [0.0, FIRE_EPSILON / 2])
+def test_readding_callback_fires_once_per_wakeup(
+    clock: Clock, backend: FakeBackend, delay: float
+) -> None:
+    sched = TimerScheduler(backend, clock)
+    calls: list[float] = []
+
+    def again() -> None:
+        calls.append(clock.now)
+        if len(calls) < 100:  # bounded, so a spinning wakeup fails instead of hanging
+            sched.add(delay, again)
+
+    sched.add(0.0, again)
+    for wakeup in range(1, 6):
+        backend.run_next()
+        assert len(calls) == wakeup
+        assert len(backend.armed) == 1
+    assert sched.fired == sched.wakeups == 5
+
+
+def test_due_timers_share_a_wakeup(clock: Clock, backend: FakeBackend) -> None:
+    sched = TimerScheduler(backend, clock, slack=0.5)
+    fired: list[str] = []
+    sched.add(1.0, lambda: fired.append("a"))
+    sched.add(1.3, lambda: fired.append("b"))
+    sched.add(2.0, lambda: fired.append("c"))
+    backend.run_next()
+    assert fired == ["a", "b"]
+    backend.run_next()
+    assert fired == ["a", "b", "c"]
+    assert sched.wakeups == 2
+
+
+def test_cancel_and_pause_resume(clock: Clock, backend: FakeBackend) -> None:
+    sched = TimerScheduler(backend, clock)
+    fired: list[str] = []
+    gone = sched.add(1.0, lambda: fired.append("gone"))
+    paused = sched.add(5.0, lambda: fired.append("paused"))
+    sched.cancel(gone)
+    clock.now += 2.0
+    sched.pause(paused)
+    assert not backend.armed and len(sched) == 0
+    clock.now += 100.0
+    sched.resume(paused)
+    assert sched.next_deadline() == pytest.approx(clock.now + 3.0)
+    backend.run_next()
+    assert fired == ["paused"]
+    assert not paused.active